@@ -18,11 +18,14 @@ if typing.TYPE_CHECKING:
         plannedworkout,
         sleep,
         user,
+        webhooks,
     )
     from .client import AsyncTerra, Terra
+    from .core.retry import RetryPolicy
     from .version import __version__
 _dynamic_imports: typing.Dict[str, str] = {
     "AsyncTerra": ".client",
+    "RetryPolicy": ".core.retry",
     "Terra": ".client",
     "__version__": ".version",
     "activity": ".activity",
@@ -36,6 +39,7 @@ _dynamic_imports: typing.Dict[str, str] = {
     "plannedworkout": ".plannedworkout",
     "sleep": ".sleep",
     "user": ".user",
+    "webhooks": ".webhooks",
 }
 
 
@@ -62,6 +66,7 @@ def __dir__():
 
 __all__ = [
     "AsyncTerra",
+    "RetryPolicy",
     "Terra",
     "__version__",
     "activity",
@@ -75,4 +80,5 @@ __all__ = [
     "plannedworkout",
     "sleep",
     "user",
+    "webhooks",
 ]
@@ -1,17 +1,22 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import contextlib
 import typing
 from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
 from ..core.serialization import convert_and_respect_annotation_metadata
 from ..core.unchecked_base_model import construct_type
 from ..errors.bad_request_error import BadRequestError
 from ..errors.not_found_error import NotFoundError
 from ..errors.unauthorized_error import UnauthorizedError
+from ..rate_limit_signals import record_processing_response
+from ..stream_fetch import async_stream_fetch, stream_fetch
 from ..types.activity import Activity
 from ..types.activity_fetch_request_end_date import ActivityFetchRequestEndDate
 from .types.activity_fetch_request_start_date import ActivityFetchRequestStartDate
@@ -78,13 +83,10 @@ class RawActivityClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    ActivityFetchResponse,
-                    construct_type(
-                        type_=ActivityFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, ActivityFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
+                record_processing_response(_response, _data)
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -93,7 +95,7 @@ class RawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -104,7 +106,7 @@ class RawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -115,15 +117,67 @@ class RawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.contextmanager
+    def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: ActivityFetchRequestStartDate,
+        end_date: typing.Optional[ActivityFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[HttpResponse[typing.Iterator[Activity]]]:
+        """
+        Fetches completed workout sessions, with a defined start and end time and activity type (e.g. running, cycling, etc.)
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : ActivityFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[ActivityFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.Iterator[HttpResponse[typing.Iterator[Activity]]]
+            The response, whose data iterates over the records
+        """
+        with stream_fetch(
+            self._client_wrapper,
+            "activity",
+            record_type=Activity,
+            response_type=ActivityFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
     def write(
         self, *, data: typing.Sequence[Activity], request_options: typing.Optional[RequestOptions] = None
     ) -> HttpResponse[ActivityWriteResponse]:
@@ -159,12 +213,8 @@ class RawActivityClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    ActivityWriteResponse,
-                    construct_type(
-                        type_=ActivityWriteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, ActivityWriteResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -174,7 +224,7 @@ class RawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -185,11 +235,11 @@ class RawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -251,13 +301,10 @@ class AsyncRawActivityClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    ActivityFetchResponse,
-                    construct_type(
-                        type_=ActivityFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, ActivityFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
+                record_processing_response(_response, _data)
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -266,7 +313,7 @@ class AsyncRawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -277,7 +324,7 @@ class AsyncRawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -288,15 +335,67 @@ class AsyncRawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.asynccontextmanager
+    async def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: ActivityFetchRequestStartDate,
+        end_date: typing.Optional[ActivityFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Activity]]]:
+        """
+        Fetches completed workout sessions, with a defined start and end time and activity type (e.g. running, cycling, etc.)
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : ActivityFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[ActivityFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Activity]]]
+            The response, whose data iterates over the records
+        """
+        async with async_stream_fetch(
+            self._client_wrapper,
+            "activity",
+            record_type=Activity,
+            response_type=ActivityFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
     async def write(
         self, *, data: typing.Sequence[Activity], request_options: typing.Optional[RequestOptions] = None
     ) -> AsyncHttpResponse[ActivityWriteResponse]:
@@ -332,12 +431,8 @@ class AsyncRawActivityClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    ActivityWriteResponse,
-                    construct_type(
-                        type_=ActivityWriteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, ActivityWriteResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -347,7 +442,7 @@ class AsyncRawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -358,11 +453,11 @@ class AsyncRawActivityClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
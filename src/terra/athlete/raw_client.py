@@ -5,7 +5,9 @@ from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
 from ..core.unchecked_base_model import construct_type
 from ..errors.bad_request_error import BadRequestError
@@ -55,12 +57,8 @@ class RawAthleteClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    AthleteFetchResponse,
-                    construct_type(
-                        type_=AthleteFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, AthleteFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -70,7 +68,7 @@ class RawAthleteClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -81,7 +79,7 @@ class RawAthleteClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -92,11 +90,11 @@ class RawAthleteClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -143,12 +141,8 @@ class AsyncRawAthleteClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    AthleteFetchResponse,
-                    construct_type(
-                        type_=AthleteFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, AthleteFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -158,7 +152,7 @@ class AsyncRawAthleteClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -169,7 +163,7 @@ class AsyncRawAthleteClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -180,11 +174,11 @@ class AsyncRawAthleteClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
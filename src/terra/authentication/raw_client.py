@@ -5,7 +5,9 @@ from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
 from ..core.unchecked_base_model import construct_type
 from ..errors.bad_request_error import BadRequestError
@@ -77,12 +79,8 @@ class RawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    AuthenticationAuthenticateUserResponse,
-                    construct_type(
-                        type_=AuthenticationAuthenticateUserResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, AuthenticationAuthenticateUserResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -92,7 +90,7 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -103,11 +101,11 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -168,12 +166,10 @@ class RawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
+                _data = decode_response(
+                    _response,
                     AuthenticationGenerateWidgetSessionResponse,
-                    construct_type(
-                        type_=AuthenticationGenerateWidgetSessionResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                    model_backend=self._client_wrapper.model_backend,
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -183,11 +179,11 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -221,12 +217,10 @@ class RawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
+                _data = decode_response(
+                    _response,
                     AuthenticationDeauthenticateUserResponse,
-                    construct_type(
-                        type_=AuthenticationDeauthenticateUserResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                    model_backend=self._client_wrapper.model_backend,
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 404:
@@ -236,11 +230,11 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -268,12 +262,8 @@ class RawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    AuthenticationGenerateAuthTokenResponse,
-                    construct_type(
-                        type_=AuthenticationGenerateAuthTokenResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, AuthenticationGenerateAuthTokenResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 404:
@@ -283,11 +273,11 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -351,12 +341,8 @@ class AsyncRawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    AuthenticationAuthenticateUserResponse,
-                    construct_type(
-                        type_=AuthenticationAuthenticateUserResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, AuthenticationAuthenticateUserResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -366,7 +352,7 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -377,11 +363,11 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -442,12 +428,10 @@ class AsyncRawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
+                _data = decode_response(
+                    _response,
                     AuthenticationGenerateWidgetSessionResponse,
-                    construct_type(
-                        type_=AuthenticationGenerateWidgetSessionResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                    model_backend=self._client_wrapper.model_backend,
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -457,11 +441,11 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -495,12 +479,10 @@ class AsyncRawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
+                _data = decode_response(
+                    _response,
                     AuthenticationDeauthenticateUserResponse,
-                    construct_type(
-                        type_=AuthenticationDeauthenticateUserResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                    model_backend=self._client_wrapper.model_backend,
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 404:
@@ -510,11 +492,11 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -542,12 +524,8 @@ class AsyncRawAuthenticationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    AuthenticationGenerateAuthTokenResponse,
-                    construct_type(
-                        type_=AuthenticationGenerateAuthTokenResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, AuthenticationGenerateAuthTokenResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 404:
@@ -557,11 +535,11 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
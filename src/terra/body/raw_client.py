@@ -1,17 +1,22 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import contextlib
 import typing
 from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
 from ..core.serialization import convert_and_respect_annotation_metadata
 from ..core.unchecked_base_model import construct_type
 from ..errors.bad_request_error import BadRequestError
 from ..errors.not_found_error import NotFoundError
 from ..errors.unauthorized_error import UnauthorizedError
+from ..rate_limit_signals import record_processing_response
+from ..stream_fetch import async_stream_fetch, stream_fetch
 from ..types.body import Body
 from ..types.body_fetch_request_end_date import BodyFetchRequestEndDate
 from .types.body_delete_response import BodyDeleteResponse
@@ -79,13 +84,8 @@ class RawBodyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    BodyFetchResponse,
-                    construct_type(
-                        type_=BodyFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, BodyFetchResponse, model_backend=self._client_wrapper.model_backend)
+                record_processing_response(_response, _data)
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -94,7 +94,7 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -105,7 +105,7 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -116,15 +116,67 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.contextmanager
+    def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: BodyFetchRequestStartDate,
+        end_date: typing.Optional[BodyFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[HttpResponse[typing.Iterator[Body]]]:
+        """
+        Fetches body metrics such as weight, height, body fat percentage etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : BodyFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[BodyFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.Iterator[HttpResponse[typing.Iterator[Body]]]
+            The response, whose data iterates over the records
+        """
+        with stream_fetch(
+            self._client_wrapper,
+            "body",
+            record_type=Body,
+            response_type=BodyFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
     def write(
         self, *, data: typing.Sequence[Body], request_options: typing.Optional[RequestOptions] = None
     ) -> HttpResponse[BodyWriteResponse]:
@@ -160,13 +212,7 @@ class RawBodyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    BodyWriteResponse,
-                    construct_type(
-                        type_=BodyWriteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, BodyWriteResponse, model_backend=self._client_wrapper.model_backend)
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -175,7 +221,7 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -186,11 +232,11 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -238,13 +284,7 @@ class RawBodyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    BodyDeleteResponse,
-                    construct_type(
-                        type_=BodyDeleteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, BodyDeleteResponse, model_backend=self._client_wrapper.model_backend)
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -253,7 +293,7 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -264,7 +304,7 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -275,11 +315,11 @@ class RawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -341,13 +381,8 @@ class AsyncRawBodyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    BodyFetchResponse,
-                    construct_type(
-                        type_=BodyFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, BodyFetchResponse, model_backend=self._client_wrapper.model_backend)
+                record_processing_response(_response, _data)
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -356,7 +391,7 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -367,7 +402,7 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -378,15 +413,67 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.asynccontextmanager
+    async def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: BodyFetchRequestStartDate,
+        end_date: typing.Optional[BodyFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Body]]]:
+        """
+        Fetches body metrics such as weight, height, body fat percentage etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : BodyFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[BodyFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Body]]]
+            The response, whose data iterates over the records
+        """
+        async with async_stream_fetch(
+            self._client_wrapper,
+            "body",
+            record_type=Body,
+            response_type=BodyFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
     async def write(
         self, *, data: typing.Sequence[Body], request_options: typing.Optional[RequestOptions] = None
     ) -> AsyncHttpResponse[BodyWriteResponse]:
@@ -422,13 +509,7 @@ class AsyncRawBodyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    BodyWriteResponse,
-                    construct_type(
-                        type_=BodyWriteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, BodyWriteResponse, model_backend=self._client_wrapper.model_backend)
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -437,7 +518,7 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -448,11 +529,11 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -500,13 +581,7 @@ class AsyncRawBodyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    BodyDeleteResponse,
-                    construct_type(
-                        type_=BodyDeleteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, BodyDeleteResponse, model_backend=self._client_wrapper.model_backend)
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -515,7 +590,7 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -526,7 +601,7 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -537,11 +612,11 @@ class AsyncRawBodyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from .core.request_options import RequestOptions
+
+if typing.TYPE_CHECKING:
+    from .client import AsyncTerra
+
+FetchResource = typing.Literal["activity", "body", "daily", "menstruation", "nutrition", "plannedworkout", "sleep"]
+
+
+class BulkFetchResult(typing.NamedTuple):
+    user_id: str
+    data: typing.Any
+    """
+    The fetch response for the user, or None if the fetch failed.
+    """
+
+    error: typing.Optional[Exception]
+    """
+    The exception raised while fetching the user's data, if any.
+    """
+
+
+async def bulk_fetch(
+    client: "AsyncTerra",
+    resource: FetchResource,
+    user_ids: typing.Iterable[str],
+    *,
+    start_date: typing.Union[int, str],
+    end_date: typing.Optional[typing.Union[int, str]] = None,
+    concurrency: int = 10,
+    to_webhook: typing.Optional[bool] = None,
+    with_samples: typing.Optional[bool] = None,
+    request_options: typing.Optional[RequestOptions] = None,
+) -> typing.AsyncIterator[BulkFetchResult]:
+    """
+    Fetches `resource` for every user in `user_ids`, keeping at most `concurrency` requests in flight, and yields
+    each user's result as soon as it completes. Failures are captured on the result rather than raised, so a
+    single bad user does not abort the batch.
+
+    `user_ids` is consumed lazily, so it can be a generator over a very large population. Closing the iterator
+    early cancels any requests still in flight.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    fetch = getattr(client, resource).fetch
+    fetch_kwargs: typing.Dict[str, typing.Any] = {"start_date": start_date, "end_date": end_date}
+    if to_webhook is not None:
+        fetch_kwargs["to_webhook"] = to_webhook
+    if with_samples is not None:
+        fetch_kwargs["with_samples"] = with_samples
+
+    async def fetch_user(user_id: str) -> BulkFetchResult:
+        try:
+            data = await fetch(user_id=user_id, request_options=request_options, **fetch_kwargs)
+        except Exception as e:
+            return BulkFetchResult(user_id=user_id, data=None, error=e)
+        return BulkFetchResult(user_id=user_id, data=data, error=None)
+
+    remaining = iter(user_ids)
+    in_flight: typing.Set["asyncio.Task[BulkFetchResult]"] = set()
+
+    def schedule() -> None:
+        while len(in_flight) < concurrency:
+            user_id = next(remaining, None)
+            if user_id is None:
+                return
+            in_flight.add(asyncio.ensure_future(fetch_user(user_id)))
+
+    try:
+        schedule()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            in_flight.difference_update(done)
+            # Top the window back up before handing results to the caller, so fetching overlaps with processing
+            schedule()
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
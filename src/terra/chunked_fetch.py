@@ -0,0 +1,169 @@
+import asyncio
+import datetime as dt
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from .core.msgspec_models import get_struct_type, is_struct
+from .core.pydantic_utilities import IS_PYDANTIC_V2, parse_date, parse_datetime
+from .types.no_data_returned import NoDataReturned
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
+
+T = typing.TypeVar("T")
+DateLike = typing.Union[int, str]
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def split_date_range(
+    start_date: DateLike,
+    end_date: typing.Optional[DateLike],
+    window: dt.timedelta,
+) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Splits a fetch's date range into consecutive `window` sized ranges of unix timestamps. A date-only
+    `end_date` includes that whole day, and a missing `end_date` means now.
+    """
+    if window <= dt.timedelta(0):
+        raise ValueError("The chunk window must be positive")
+
+    start = _to_datetime(start_date, end_of_day=False)
+    end = _to_datetime(end_date, end_of_day=True) if end_date is not None else dt.datetime.now(dt.timezone.utc)
+
+    windows = []
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + window, end)
+        windows.append((_to_timestamp(window_start), _to_timestamp(window_end)))
+        window_start = window_end
+    return windows or [(_to_timestamp(start), _to_timestamp(end))]
+
+
+def merge_fetch_responses(responses: typing.Sequence[T]) -> T:
+    """
+    Merges the responses of each window into one, concatenating their `data` in chronological order and
+    dropping records returned by more than one window.
+
+    If a window returned neither data nor `NoDataReturned` (the request was sent to a webhook, is still processing
+    or was rate limited), that response is returned as is, since a merged result would be incomplete. If no window
+    returned data, the first window's response is returned.
+    """
+    data_responses = []
+    for response in responses:
+        if isinstance(getattr(response, "data", None), list):
+            data_responses.append(response)
+        elif not _is_no_data_returned(response):
+            return response
+    if not data_responses:
+        return responses[0]
+
+    seen: typing.Set[typing.Any] = set()
+    records = []
+    for response in data_responses:
+        for record in getattr(response, "data"):
+            key = _get_record_key(record)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            records.append(record)
+    records.sort(key=_get_record_start_time)
+
+    merged = data_responses[0]
+    if is_struct(merged):
+        return typing.cast(T, msgspec.structs.replace(typing.cast(typing.Any, merged), data=records))
+    if IS_PYDANTIC_V2:
+        return merged.model_copy(update={"data": records})  # type: ignore[attr-defined]
+    return merged.copy(update={"data": records})  # type: ignore[attr-defined]
+
+
+def chunked_fetch(
+    fetch: typing.Callable[..., T],
+    *,
+    start_date: DateLike,
+    end_date: typing.Optional[DateLike],
+    window: dt.timedelta,
+    max_concurrency: int,
+    **kwargs: typing.Any,
+) -> T:
+    windows = split_date_range(start_date, end_date, window)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(windows)))) as executor:
+        responses = list(
+            executor.map(
+                lambda window_range: fetch(start_date=window_range[0], end_date=window_range[1], **kwargs), windows
+            )
+        )
+    return merge_fetch_responses(responses)
+
+
+async def async_chunked_fetch(
+    fetch: typing.Callable[..., typing.Awaitable[T]],
+    *,
+    start_date: DateLike,
+    end_date: typing.Optional[DateLike],
+    window: dt.timedelta,
+    max_concurrency: int,
+    **kwargs: typing.Any,
+) -> T:
+    windows = split_date_range(start_date, end_date, window)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch_window(window_range: typing.Tuple[int, int]) -> T:
+        async with semaphore:
+            return await fetch(start_date=window_range[0], end_date=window_range[1], **kwargs)
+
+    responses = await asyncio.gather(*(fetch_window(window_range) for window_range in windows))
+    return merge_fetch_responses(responses)
+
+
+def _to_datetime(value: DateLike, *, end_of_day: bool) -> dt.datetime:
+    if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+        return dt.datetime.fromtimestamp(int(value), tz=dt.timezone.utc)
+    try:
+        return _as_aware(parse_datetime(value))
+    except Exception:
+        date = parse_date(value)
+        return dt.datetime(date.year, date.month, date.day, tzinfo=dt.timezone.utc) + (
+            dt.timedelta(days=1) if end_of_day else dt.timedelta(0)
+        )
+
+
+def _to_timestamp(value: dt.datetime) -> int:
+    return int((value - _EPOCH).total_seconds())
+
+
+def _as_aware(value: dt.datetime) -> dt.datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=dt.timezone.utc)
+
+
+def _is_no_data_returned(response: typing.Any) -> bool:
+    # Responses decoded by the msgspec model backend are mirrors of the models, rather than the models themselves
+    if is_struct(response):
+        return isinstance(response, get_struct_type(NoDataReturned))
+    return isinstance(response, NoDataReturned)
+
+
+def _get_record_key(record: typing.Any) -> typing.Optional[typing.Hashable]:
+    metadata = getattr(record, "metadata", None)
+    if metadata is None:
+        return None
+    summary_id = getattr(metadata, "summary_id", None)
+    if summary_id is not None:
+        return summary_id
+    start_time = getattr(metadata, "start_time", None)
+    if start_time is None:
+        return None
+    return (start_time, getattr(metadata, "end_time", None))
+
+
+def _get_record_start_time(record: typing.Any) -> dt.datetime:
+    start_time = getattr(getattr(record, "metadata", None), "start_time", None)
+    if start_time is None:
+        return _EPOCH
+    try:
+        return _as_aware(parse_datetime(start_time))
+    except Exception:
+        return _EPOCH
@@ -5,7 +5,16 @@ from __future__ import annotations
 import typing
 
 import httpx
+from .bulk import BulkFetchResult, FetchResource, bulk_fetch
+from .core.circuit_breaker import CircuitBreaker
 from .core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .core.decoding import ModelBackend
+from .core.hedging import HedgingPolicy
+from .core.http_client import ConnectionPoolStats, build_httpx_timeout
+from .core.rate_limiter import RateLimiter
+from .core.request_options import RequestOptions
+from .core.response_cache import ResponseCache
+from .core.retry import RetryPolicy
 from .environment import TerraEnvironment
 
 if typing.TYPE_CHECKING:
@@ -51,6 +60,42 @@ class Terra:
     follow_redirects : typing.Optional[bool]
         Whether the default httpx client follows redirects or not, this is irrelevant if a custom httpx client is passed in.
 
+    connect_timeout : typing.Optional[float]
+    read_timeout : typing.Optional[float]
+    write_timeout : typing.Optional[float]
+    pool_timeout : typing.Optional[float]
+        Per-phase timeouts, in seconds, each defaulting to `timeout`. The pool timeout bounds how long a request waits for a free connection. These are passed with each request, so they also apply to a custom httpx client.
+
+    max_connections : typing.Optional[int]
+        The maximum number of concurrent connections the default httpx client may open. Defaults to httpx's limit of 100. Ignored if a custom httpx client is passed in, whose own limits apply.
+
+    max_keepalive_connections : typing.Optional[int]
+        The maximum number of idle connections kept alive for reuse. Defaults to httpx's limit of 20. Ignored if a custom httpx client is passed in.
+
+    keepalive_expiry : typing.Optional[float]
+        The number of seconds an idle connection is kept alive for. Defaults to httpx's 5 seconds. Ignored if a custom httpx client is passed in.
+
+    http2 : bool
+        Whether the default httpx client negotiates HTTP/2, multiplexing requests over fewer connections. Requires the http2 extra, `pip install terra-python[http2]`. Ignored if a custom httpx client is passed in, which must be created with `http2=True` instead.
+
+    retry_policy : typing.Optional[RetryPolicy]
+        How failed requests are retried: which statuses, the backoff curve, jitter and an overall deadline. By default requests are not retried.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        A client-side rate limiter shared by every sub-client, which adapts to the rate limit signals returned by the API. It may also be shared between clients.
+
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        A per-endpoint circuit breaker which fails requests fast, with a `CircuitOpenError`, while an endpoint is failing or slow.
+
+    coalesce_requests : bool
+        Whether identical GET requests made while one is already in flight share its response rather than sending their own.
+
+    response_cache : typing.Optional[ResponseCache]
+        Caches the decoded responses of slow-changing endpoints, such as integrations and user info, honouring `Cache-Control` and `ETag`.
+
+    model_backend : ModelBackend
+        The models responses are decoded into. "lazy" decodes the nested objects and arrays of the models on first access, which suits reading a few summary fields of large payloads. "msgspec", which requires the msgspec extra, decodes them in a single pass into `msgspec.Struct` mirrors of the models, with the same fields but without the extra fields the API may add.
+
     httpx_client : typing.Optional[httpx.Client]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
@@ -74,10 +119,33 @@ class Terra:
         headers: typing.Optional[typing.Dict[str, str]] = None,
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
+        connect_timeout: typing.Optional[float] = None,
+        read_timeout: typing.Optional[float] = None,
+        write_timeout: typing.Optional[float] = None,
+        pool_timeout: typing.Optional[float] = None,
+        max_connections: typing.Optional[int] = None,
+        max_keepalive_connections: typing.Optional[int] = None,
+        keepalive_expiry: typing.Optional[float] = None,
+        http2: bool = False,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        model_backend: ModelBackend = "pydantic",
         httpx_client: typing.Optional[httpx.Client] = None,
     ):
-        _defaulted_timeout = (
-            timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
+        _defaulted_timeout = build_httpx_timeout(
+            timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read,
+            connect=connect_timeout,
+            read=read_timeout,
+            write=write_timeout,
+            pool=pool_timeout,
+        )
+        _limits = _get_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
         self._client_wrapper = SyncClientWrapper(
             base_url=_get_base_url(base_url=base_url, environment=environment),
@@ -86,10 +154,18 @@ class Terra:
             headers=headers,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.Client(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
+            else httpx.Client(
+                timeout=_defaulted_timeout, follow_redirects=follow_redirects, limits=_limits, http2=http2
+            )
             if follow_redirects is not None
-            else httpx.Client(timeout=_defaulted_timeout),
+            else httpx.Client(timeout=_defaulted_timeout, limits=_limits, http2=http2),
             timeout=_defaulted_timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            model_backend=model_backend,
         )
         self._authentication: typing.Optional[AuthenticationClient] = None
         self._user: typing.Optional[UserClient] = None
@@ -103,6 +179,13 @@ class Terra:
         self._plannedworkout: typing.Optional[PlannedworkoutClient] = None
         self._integrations: typing.Optional[IntegrationsClient] = None
 
+    def get_connection_pool_stats(self) -> typing.Optional[ConnectionPoolStats]:
+        """
+        Returns the current occupancy of the client's connection pool, or None if it cannot be inspected, e.g.
+        with a custom transport.
+        """
+        return self._client_wrapper.httpx_client.get_connection_pool_stats()
+
     @property
     def authentication(self):
         if self._authentication is None:
@@ -221,6 +304,45 @@ class AsyncTerra:
     follow_redirects : typing.Optional[bool]
         Whether the default httpx client follows redirects or not, this is irrelevant if a custom httpx client is passed in.
 
+    connect_timeout : typing.Optional[float]
+    read_timeout : typing.Optional[float]
+    write_timeout : typing.Optional[float]
+    pool_timeout : typing.Optional[float]
+        Per-phase timeouts, in seconds, each defaulting to `timeout`. The pool timeout bounds how long a request waits for a free connection. These are passed with each request, so they also apply to a custom httpx client.
+
+    max_connections : typing.Optional[int]
+        The maximum number of concurrent connections the default httpx client may open. Defaults to httpx's limit of 100. Ignored if a custom httpx client is passed in, whose own limits apply.
+
+    max_keepalive_connections : typing.Optional[int]
+        The maximum number of idle connections kept alive for reuse. Defaults to httpx's limit of 20. Ignored if a custom httpx client is passed in.
+
+    keepalive_expiry : typing.Optional[float]
+        The number of seconds an idle connection is kept alive for. Defaults to httpx's 5 seconds. Ignored if a custom httpx client is passed in.
+
+    http2 : bool
+        Whether the default httpx client negotiates HTTP/2, multiplexing requests over fewer connections. Requires the http2 extra, `pip install terra-python[http2]`. Ignored if a custom httpx client is passed in, which must be created with `http2=True` instead.
+
+    retry_policy : typing.Optional[RetryPolicy]
+        How failed requests are retried: which statuses, the backoff curve, jitter and an overall deadline. By default requests are not retried.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        A client-side rate limiter shared by every sub-client, which adapts to the rate limit signals returned by the API. It may also be shared between clients.
+
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        A per-endpoint circuit breaker which fails requests fast, with a `CircuitOpenError`, while an endpoint is failing or slow.
+
+    coalesce_requests : bool
+        Whether identical GET requests made while one is already in flight share its response rather than sending their own.
+
+    response_cache : typing.Optional[ResponseCache]
+        Caches the decoded responses of slow-changing endpoints, such as integrations and user info, honouring `Cache-Control` and `ETag`.
+
+    hedging_policy : typing.Optional[HedgingPolicy]
+        Opts GET requests into hedging: a request slower than its endpoint's recent latency percentile is duplicated, within a budget, and the first response wins.
+
+    model_backend : ModelBackend
+        The models responses are decoded into. "lazy" decodes the nested objects and arrays of the models on first access, which suits reading a few summary fields of large payloads. "msgspec", which requires the msgspec extra, decodes them in a single pass into `msgspec.Struct` mirrors of the models, with the same fields but without the extra fields the API may add.
+
     httpx_client : typing.Optional[httpx.AsyncClient]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
@@ -244,10 +366,34 @@ class AsyncTerra:
         headers: typing.Optional[typing.Dict[str, str]] = None,
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
+        connect_timeout: typing.Optional[float] = None,
+        read_timeout: typing.Optional[float] = None,
+        write_timeout: typing.Optional[float] = None,
+        pool_timeout: typing.Optional[float] = None,
+        max_connections: typing.Optional[int] = None,
+        max_keepalive_connections: typing.Optional[int] = None,
+        keepalive_expiry: typing.Optional[float] = None,
+        http2: bool = False,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        model_backend: ModelBackend = "pydantic",
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
     ):
-        _defaulted_timeout = (
-            timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
+        _defaulted_timeout = build_httpx_timeout(
+            timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read,
+            connect=connect_timeout,
+            read=read_timeout,
+            write=write_timeout,
+            pool=pool_timeout,
+        )
+        _limits = _get_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
         self._client_wrapper = AsyncClientWrapper(
             base_url=_get_base_url(base_url=base_url, environment=environment),
@@ -256,10 +402,19 @@ class AsyncTerra:
             headers=headers,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
+            else httpx.AsyncClient(
+                timeout=_defaulted_timeout, follow_redirects=follow_redirects, limits=_limits, http2=http2
+            )
             if follow_redirects is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout),
+            else httpx.AsyncClient(timeout=_defaulted_timeout, limits=_limits, http2=http2),
             timeout=_defaulted_timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            hedging_policy=hedging_policy,
+            model_backend=model_backend,
         )
         self._authentication: typing.Optional[AsyncAuthenticationClient] = None
         self._user: typing.Optional[AsyncUserClient] = None
@@ -273,6 +428,92 @@ class AsyncTerra:
         self._plannedworkout: typing.Optional[AsyncPlannedworkoutClient] = None
         self._integrations: typing.Optional[AsyncIntegrationsClient] = None
 
+    def get_connection_pool_stats(self) -> typing.Optional[ConnectionPoolStats]:
+        """
+        Returns the current occupancy of the client's connection pool, or None if it cannot be inspected, e.g.
+        with a custom transport.
+        """
+        return self._client_wrapper.httpx_client.get_connection_pool_stats()
+
+    def bulk_fetch(
+        self,
+        resource: FetchResource,
+        user_ids: typing.Iterable[str],
+        *,
+        start_date: typing.Union[int, str],
+        end_date: typing.Optional[typing.Union[int, str]] = None,
+        concurrency: int = 10,
+        to_webhook: typing.Optional[bool] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[BulkFetchResult]:
+        """
+        Fetches a resource for many users at once, with at most `concurrency` requests in flight.
+
+        Parameters
+        ----------
+        resource : FetchResource
+            The resource to fetch, e.g. "activity" or "sleep".
+
+        user_ids : typing.Iterable[str]
+            Terra user IDs to fetch data for, consumed lazily.
+
+        start_date : typing.Union[int, str]
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[typing.Union[int, str]]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        concurrency : int
+            The maximum number of requests in flight at once.
+
+        to_webhook : typing.Optional[bool]
+            Boolean flag specifying whether to send the data retrieved to the webhook instead of in the response
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload. Ignored for planned workouts.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, applied to every request.
+
+        Returns
+        -------
+        typing.AsyncIterator[BulkFetchResult]
+            One result per user, in completion order. A failed fetch is reported through the result's `error`.
+
+        Examples
+        --------
+        import asyncio
+
+        from terra import AsyncTerra
+
+        client = AsyncTerra(
+            dev_id="YOUR_DEV_ID",
+            api_key="YOUR_API_KEY",
+        )
+
+
+        async def main() -> None:
+            async for result in client.bulk_fetch(
+                "activity", ["user_id"], start_date="2024-01-01", to_webhook=False, concurrency=50
+            ):
+                print(result.user_id, result.error or result.data)
+
+
+        asyncio.run(main())
+        """
+        return bulk_fetch(
+            self,
+            resource,
+            user_ids,
+            start_date=start_date,
+            end_date=end_date,
+            concurrency=concurrency,
+            to_webhook=to_webhook,
+            with_samples=with_samples if resource != "plannedworkout" else None,
+            request_options=request_options,
+        )
+
     @property
     def authentication(self):
         if self._authentication is None:
@@ -362,6 +603,22 @@ class AsyncTerra:
         return self._integrations
 
 
+def _get_limits(
+    *,
+    max_connections: typing.Optional[int],
+    max_keepalive_connections: typing.Optional[int],
+    keepalive_expiry: typing.Optional[float],
+) -> httpx.Limits:
+    default_limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    return httpx.Limits(
+        max_connections=max_connections if max_connections is not None else default_limits.max_connections,
+        max_keepalive_connections=max_keepalive_connections
+        if max_keepalive_connections is not None
+        else default_limits.max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry if keepalive_expiry is not None else default_limits.keepalive_expiry,
+    )
+
+
 def _get_base_url(*, base_url: typing.Optional[str] = None, environment: TerraEnvironment) -> str:
     if base_url is not None:
         return base_url
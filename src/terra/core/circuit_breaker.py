@@ -0,0 +1,209 @@
+import collections
+import enum
+import threading
+import time
+import typing
+
+# Path segments followed by an identifier, which are grouped under a single endpoint
+_ID_PREFIXED_PATHS = frozenset(("users",))
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+CircuitStateListener = typing.Callable[[str, CircuitState, CircuitState], None]
+
+
+class CircuitOpenError(Exception):
+    endpoint: str
+    retry_after: float
+
+    def __init__(self, *, endpoint: str, retry_after: float) -> None:
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        return f"The circuit for {self.endpoint} is open, retry after {self.retry_after:.1f}s"
+
+
+def get_endpoint(path: typing.Optional[str]) -> str:
+    """
+    Returns the endpoint a request path belongs to, e.g. "activity", "auth/authenticateUser" or "users".
+    """
+    path = (path or "").strip("/")
+    head, _, _ = path.partition("/")
+    return head if head in _ID_PREFIXED_PATHS else path
+
+
+class _Circuit:
+    def __init__(self, window_size: int) -> None:
+        self.state = CircuitState.CLOSED
+        self.outcomes: typing.Deque[bool] = collections.deque(maxlen=window_size)
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        # Bumped on every transition, so that the outcomes of requests admitted under an earlier state are ignored
+        self.generation = 0
+
+
+class CircuitBreaker:
+    """
+    Tracks the failure rate and latency of each endpoint and fails requests fast while an endpoint is unhealthy.
+
+    An endpoint's circuit opens once at least `minimum_requests` of its last `window_size` requests completed, and
+    `failure_threshold` of them failed. A failure is a transport error, a 5xx response or a response slower than
+    `slow_call_threshold`. While open, requests raise `CircuitOpenError` without being sent. After `reset_timeout`
+    seconds the circuit is half open, letting up to `half_open_probes` requests through: the circuit closes if they
+    succeed and opens again if any fails.
+
+    Parameters
+    ----------
+    failure_threshold : float
+        The fraction of failed requests, between 0 and 1, that opens the circuit.
+
+    window_size : int
+        The number of most recent requests the failure rate is computed over.
+
+    minimum_requests : int
+        The number of requests in the window below which the circuit never opens.
+
+    slow_call_threshold : typing.Optional[float]
+        The number of seconds after which a successful request counts as a failure.
+
+    reset_timeout : float
+        The number of seconds a circuit stays open before probe requests are let through.
+
+    half_open_probes : int
+        The number of concurrent probe requests allowed while half open.
+
+    on_state_change : typing.Optional[CircuitStateListener]
+        Called with the endpoint, its previous state and its new state on every transition.
+
+    Examples
+    --------
+    from terra import Terra
+    from terra.core.circuit_breaker import CircuitBreaker
+
+    client = Terra(
+        dev_id="YOUR_DEV_ID",
+        api_key="YOUR_API_KEY",
+        circuit_breaker=CircuitBreaker(
+            slow_call_threshold=10,
+            on_state_change=lambda endpoint, old, new: print(f"{endpoint}: {old.value} -> {new.value}"),
+        ),
+    )
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_requests: int = 10,
+        slow_call_threshold: typing.Optional[float] = None,
+        reset_timeout: float = 30,
+        half_open_probes: int = 1,
+        on_state_change: typing.Optional[CircuitStateListener] = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.window_size = window_size
+        self.minimum_requests = minimum_requests
+        self.slow_call_threshold = slow_call_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.on_state_change = on_state_change
+        self._circuits: typing.Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def get_state(self, endpoint: str) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def before_request(self, endpoint: str) -> int:
+        """
+        Raises `CircuitOpenError` if a request to `endpoint` may not be sent right now. Otherwise returns the
+        generation of the circuit the request was admitted under, to pass on to `record` or `release`.
+        """
+        transition = None
+        with self._lock:
+            circuit = self._get_circuit(endpoint)
+            if circuit.state is CircuitState.OPEN:
+                retry_after = circuit.opened_at + self.reset_timeout - time.monotonic()
+                if retry_after > 0:
+                    raise CircuitOpenError(endpoint=endpoint, retry_after=retry_after)
+                transition = self._transition(circuit, CircuitState.HALF_OPEN)
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.probes >= self.half_open_probes:
+                    raise CircuitOpenError(endpoint=endpoint, retry_after=0)
+                circuit.probes += 1
+            generation = circuit.generation
+        self._notify(endpoint, transition)
+        return generation
+
+    def record(self, endpoint: str, *, failed: bool, elapsed: float, generation: typing.Optional[int] = None) -> None:
+        """
+        Records the outcome of a request to `endpoint` that took `elapsed` seconds. Outcomes of requests admitted
+        under an earlier `generation` of the circuit, e.g. requests sent before it opened, are ignored.
+        """
+        failed = failed or (self.slow_call_threshold is not None and elapsed > self.slow_call_threshold)
+        transition = None
+        with self._lock:
+            circuit = self._get_circuit(endpoint)
+            if generation is not None and generation != circuit.generation:
+                return
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if failed:
+                    transition = self._transition(circuit, CircuitState.OPEN)
+                elif circuit.probes == 0:
+                    transition = self._transition(circuit, CircuitState.CLOSED)
+            elif circuit.state is CircuitState.CLOSED:
+                if len(circuit.outcomes) == circuit.outcomes.maxlen:
+                    circuit.failures -= circuit.outcomes[0]
+                circuit.outcomes.append(failed)
+                circuit.failures += failed
+                if len(circuit.outcomes) >= self.minimum_requests and circuit.failures >= self.failure_threshold * len(
+                    circuit.outcomes
+                ):
+                    transition = self._transition(circuit, CircuitState.OPEN)
+        self._notify(endpoint, transition)
+
+    def release(self, endpoint: str, generation: typing.Optional[int] = None) -> None:
+        """
+        Records that a request to `endpoint` was abandoned, e.g. cancelled, without an outcome.
+        """
+        with self._lock:
+            circuit = self._get_circuit(endpoint)
+            if generation is not None and generation != circuit.generation:
+                return
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+
+    def _get_circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit(self.window_size)
+        return circuit
+
+    def _transition(
+        self, circuit: _Circuit, state: CircuitState
+    ) -> typing.Optional[typing.Tuple[CircuitState, CircuitState]]:
+        previous = circuit.state
+        circuit.state = state
+        circuit.probes = 0
+        circuit.generation += 1
+        if state is CircuitState.OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state is CircuitState.CLOSED:
+            circuit.outcomes.clear()
+            circuit.failures = 0
+        return previous, state
+
+    def _notify(self, endpoint: str, transition: typing.Optional[typing.Tuple[CircuitState, CircuitState]]) -> None:
+        # Called outside the lock, so that listeners may inspect the breaker
+        if transition is not None and self.on_state_change is not None:
+            self.on_state_change(endpoint, *transition)
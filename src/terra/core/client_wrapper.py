@@ -3,7 +3,13 @@
 import typing
 
 import httpx
+from .circuit_breaker import CircuitBreaker
+from .decoding import ModelBackend, check_model_backend
+from .hedging import HedgingPolicy
 from .http_client import AsyncHttpClient, HttpClient
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
 
 
 class BaseClientWrapper:
@@ -14,13 +20,16 @@ class BaseClientWrapper:
         api_key: str,
         headers: typing.Optional[typing.Dict[str, str]] = None,
         base_url: str,
-        timeout: typing.Optional[float] = None,
+        timeout: typing.Union[float, httpx.Timeout, None] = None,
+        model_backend: ModelBackend = "pydantic",
     ):
+        check_model_backend(model_backend)
         self._dev_id = dev_id
         self.api_key = api_key
         self._headers = headers
         self._base_url = base_url
         self._timeout = timeout
+        self.model_backend = model_backend
 
     def get_headers(self) -> typing.Dict[str, str]:
         headers: typing.Dict[str, str] = {
@@ -40,7 +49,7 @@ class BaseClientWrapper:
     def get_base_url(self) -> str:
         return self._base_url
 
-    def get_timeout(self) -> typing.Optional[float]:
+    def get_timeout(self) -> typing.Union[float, httpx.Timeout, None]:
         return self._timeout
 
 
@@ -52,15 +61,33 @@ class SyncClientWrapper(BaseClientWrapper):
         api_key: str,
         headers: typing.Optional[typing.Dict[str, str]] = None,
         base_url: str,
-        timeout: typing.Optional[float] = None,
+        timeout: typing.Union[float, httpx.Timeout, None] = None,
         httpx_client: httpx.Client,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        model_backend: ModelBackend = "pydantic",
     ):
-        super().__init__(dev_id=dev_id, api_key=api_key, headers=headers, base_url=base_url, timeout=timeout)
+        super().__init__(
+            dev_id=dev_id,
+            api_key=api_key,
+            headers=headers,
+            base_url=base_url,
+            timeout=timeout,
+            model_backend=model_backend,
+        )
         self.httpx_client = HttpClient(
             httpx_client=httpx_client,
             base_headers=self.get_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
         )
 
 
@@ -72,13 +99,33 @@ class AsyncClientWrapper(BaseClientWrapper):
         api_key: str,
         headers: typing.Optional[typing.Dict[str, str]] = None,
         base_url: str,
-        timeout: typing.Optional[float] = None,
+        timeout: typing.Union[float, httpx.Timeout, None] = None,
         httpx_client: httpx.AsyncClient,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        model_backend: ModelBackend = "pydantic",
     ):
-        super().__init__(dev_id=dev_id, api_key=api_key, headers=headers, base_url=base_url, timeout=timeout)
+        super().__init__(
+            dev_id=dev_id,
+            api_key=api_key,
+            headers=headers,
+            base_url=base_url,
+            timeout=timeout,
+            model_backend=model_backend,
+        )
         self.httpx_client = AsyncHttpClient(
             httpx_client=httpx_client,
             base_headers=self.get_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            hedging_policy=hedging_policy,
         )
@@ -0,0 +1,72 @@
+import typing
+
+import httpx
+from .json_codec import load_json
+from .msgspec_models import MSGSPEC_REQUIRED, convert_struct, decode_struct, msgspec
+from .unchecked_base_model import construct_type, lazy_decoding
+
+ModelBackend = typing.Literal["pydantic", "lazy", "msgspec"]
+
+T = typing.TypeVar("T")
+
+# The decoded bodies of a response, keyed by the type they were decoded into
+_DECODED_ATTRIBUTE = "_terra_decoded"
+
+
+def check_model_backend(model_backend: ModelBackend) -> None:
+    if model_backend not in typing.get_args(ModelBackend):
+        raise ValueError(f"Unknown model backend: {model_backend!r}")
+    if model_backend == "msgspec" and msgspec is None:
+        raise ImportError(MSGSPEC_REQUIRED)
+
+
+@typing.overload
+def decode_response(
+    response: httpx.Response, type_: typing.Type[T], *, model_backend: ModelBackend = "pydantic"
+) -> T: ...
+
+
+# Unions and other typing special forms are not types, their values are typed as Any
+@typing.overload
+def decode_response(
+    response: httpx.Response, type_: typing.Any, *, model_backend: ModelBackend = "pydantic"
+) -> typing.Any: ...
+
+
+def decode_response(
+    response: httpx.Response, type_: typing.Any, *, model_backend: ModelBackend = "pydantic"
+) -> typing.Any:
+    """
+    Decodes the JSON body of `response` into `type_`, lazily with the lazy backend, or into its msgspec mirror with
+    the msgspec backend.
+
+    The result is memoized on the response, so a response shared by coalesced requests or served again from the
+    response cache is only decoded once. Decoded models are immutable, which makes sharing them safe.
+    """
+    decoded: typing.Optional[typing.Dict[typing.Any, typing.Any]] = response.__dict__.get(_DECODED_ATTRIBUTE)
+    if decoded is None:
+        decoded = {}
+        setattr(response, _DECODED_ATTRIBUTE, decoded)
+    key = type_ if model_backend == "pydantic" else (model_backend, type_)
+    if key in decoded:
+        return decoded[key]
+    if model_backend == "msgspec":
+        data = decoded[key] = decode_struct(response, type_)
+    elif model_backend == "lazy":
+        with lazy_decoding():
+            data = decoded[key] = construct_type(type_=type_, object_=load_json(response))
+    else:
+        data = decoded[key] = construct_type(type_=type_, object_=load_json(response))
+    return data
+
+
+def decode_object(object_: typing.Any, type_: typing.Any, *, model_backend: ModelBackend = "pydantic") -> typing.Any:
+    """
+    Decodes an already parsed JSON value into `type_`, as `decode_response` does.
+    """
+    if model_backend == "msgspec":
+        return convert_struct(object_, type_)
+    if model_backend == "lazy":
+        with lazy_decoding():
+            return construct_type(type_=type_, object_=object_)
+    return construct_type(type_=type_, object_=object_)
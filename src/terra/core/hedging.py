@@ -0,0 +1,145 @@
+import asyncio
+import collections
+import threading
+import time
+import typing
+
+import httpx
+
+
+class HedgingPolicy:
+    """
+    Sends a second, duplicate GET request when the first has not answered within the `percentile` latency recently
+    observed for its endpoint, and uses whichever response arrives first.
+
+    Every request earns `budget` hedge tokens, up to `max_tokens`, and a hedge spends a whole token. A budget of
+    0.1 therefore hedges at most one request in ten, and the load never more than doubles since the budget is
+    capped at 1.
+
+    Parameters
+    ----------
+    percentile : float
+        The latency percentile, between 0 and 1, after which a request is hedged.
+
+    initial_delay : float
+        The hedging delay, in seconds, used until `min_samples` latencies have been observed for an endpoint.
+
+    min_delay : float
+    max_delay : float
+        Bounds, in seconds, on the hedging delay.
+
+    budget : float
+        The fraction of requests that may be hedged, at most 1.
+
+    window_size : int
+        The number of most recent latencies the percentile is computed over, per endpoint.
+
+    Examples
+    --------
+    from terra import AsyncTerra
+    from terra.core.hedging import HedgingPolicy
+
+    client = AsyncTerra(
+        dev_id="YOUR_DEV_ID",
+        api_key="YOUR_API_KEY",
+        hedging_policy=HedgingPolicy(percentile=0.95, budget=0.05),
+    )
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        max_delay: float = 5.0,
+        budget: float = 0.1,
+        max_tokens: float = 10,
+        min_samples: int = 20,
+        window_size: int = 200,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = min(max(budget, 0.0), 1.0)
+        self.max_tokens = max_tokens
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self._latencies: typing.Dict[str, typing.Deque[float]] = {}
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def get_delay(self, endpoint: str) -> float:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(latencies)
+        delay = ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record_latency(self, endpoint: str, elapsed: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = collections.deque(maxlen=self.window_size)
+            latencies.append(elapsed)
+
+    def earn(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+async def send_hedged(
+    httpx_client: httpx.AsyncClient, request: httpx.Request, *, endpoint: str, policy: HedgingPolicy
+) -> httpx.Response:
+    """
+    Sends `request`, hedging it with a duplicate if it is slower than the policy allows, and returns the first
+    successful response. The slower request is cancelled.
+    """
+    policy.earn()
+
+    async def send(*, is_primary: bool) -> httpx.Response:
+        sent_at = time.monotonic()
+        try:
+            response = await httpx_client.send(request)
+        except asyncio.CancelledError:
+            # A primary that lost to its hedge took at least this long, leaving it out would bias the delay down
+            if is_primary:
+                policy.record_latency(endpoint, time.monotonic() - sent_at)
+            raise
+        # Only the primaries are recorded, the latency of a hedge is measured from when it was sent and would
+        # understate how long requests take
+        if is_primary:
+            policy.record_latency(endpoint, time.monotonic() - sent_at)
+        return response
+
+    tasks: typing.List["asyncio.Future[httpx.Response]"] = [asyncio.ensure_future(send(is_primary=True))]
+    try:
+        answered, _ = await asyncio.wait(tasks, timeout=policy.get_delay(endpoint))
+        if not answered and policy.try_spend():
+            tasks.append(asyncio.ensure_future(send(is_primary=False)))
+
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            succeeded = [task for task in done if task.exception() is None]
+            if succeeded:
+                return succeeded[0].result()
+            if not pending:
+                # Every attempt failed, surface one of their errors
+                return done.pop().result()
+    finally:
+        # Responses are read in full by `send`, so a losing request that completed holds no connection
+        for task in tasks:
+            task.cancel()
@@ -1,92 +1,34 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import asyncio
-import email.utils
-import re
 import time
 import typing
 import urllib.parse
 from contextlib import asynccontextmanager, contextmanager
-from random import random
 
+import httpcore
 import httpx
+from .circuit_breaker import CircuitBreaker, get_endpoint
 from .file import File, convert_file_dict_to_httpx_tuples
 from .force_multipart import FORCE_MULTIPART
+from .hedging import HedgingPolicy, send_hedged
+from .json_codec import dump_json
 from .jsonable_encoder import jsonable_encoder
 from .query_encoder import encode_query
+from .rate_limiter import RateLimiter
 from .remove_none_from_dict import remove_none_from_dict
 from .request_options import RequestOptions
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
+from .single_flight import AsyncSingleFlight, SingleFlight, get_request_key
 from httpx._types import RequestFiles
 
-INITIAL_RETRY_DELAY_SECONDS = 0.5
-MAX_RETRY_DELAY_SECONDS = 10
-MAX_RETRY_DELAY_SECONDS_FROM_HEADER = 30
-
-
-def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
-    """
-    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
-
-    Inspired by the urllib3 retry implementation.
-    """
-    retry_after_ms = response_headers.get("retry-after-ms")
-    if retry_after_ms is not None:
-        try:
-            return int(retry_after_ms) / 1000 if retry_after_ms > 0 else 0
-        except Exception:
-            pass
-
-    retry_after = response_headers.get("retry-after")
-    if retry_after is None:
-        return None
-
-    # Attempt to parse the header as an int.
-    if re.match(r"^\s*[0-9]+\s*$", retry_after):
-        seconds = float(retry_after)
-    # Fallback to parsing it as a date.
-    else:
-        retry_date_tuple = email.utils.parsedate_tz(retry_after)
-        if retry_date_tuple is None:
-            return None
-        if retry_date_tuple[9] is None:  # Python 2
-            # Assume UTC if no timezone was specified
-            # On Python2.7, parsedate_tz returns None for a timezone offset
-            # instead of 0 if no timezone is given, where mktime_tz treats
-            # a None timezone offset as local time.
-            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
-
-        retry_date = email.utils.mktime_tz(retry_date_tuple)
-        seconds = retry_date - time.time()
-
-    if seconds < 0:
-        seconds = 0
-
-    return seconds
-
-
-def _retry_timeout(response: httpx.Response, retries: int) -> float:
-    """
-    Determine the amount of time to wait before retrying a request.
-    This function begins by trying to parse a retry-after header from the response, and then proceeds to use exponential backoff
-    with a jitter to determine the number of seconds to wait.
-    """
-
-    # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
-    retry_after = _parse_retry_after(response.headers)
-    if retry_after is not None and retry_after <= MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
-        return retry_after
-
-    # Apply exponential backoff, capped at MAX_RETRY_DELAY_SECONDS.
-    retry_delay = min(INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), MAX_RETRY_DELAY_SECONDS)
-
-    # Add a randomness / jitter to the retry delay to avoid overwhelming the server with retries.
-    timeout = retry_delay * (1 - 0.25 * random())
-    return timeout if timeout >= 0 else 0
-
-
-def _should_retry(response: httpx.Response) -> bool:
-    retryable_400s = [429, 408, 409]
-    return response.status_code >= 500 or response.status_code in retryable_400s
+Files = typing.Optional[
+    typing.Union[
+        typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]],
+        typing.List[typing.Tuple[str, File]],
+    ]
+]
 
 
 def remove_omit_from_dict(
@@ -147,19 +89,167 @@ def get_request_body(
     return (json_body if json_body != {} else None), data_body if data_body != {} else None
 
 
-class HttpClient:
+class ConnectionPoolStats(typing.NamedTuple):
+    connections: int
+    active_connections: int
+    idle_connections: int
+    pending_requests: int
+    max_connections: typing.Optional[int]
+    max_keepalive_connections: typing.Optional[int]
+
+
+def get_connection_pool_stats(
+    httpx_client: typing.Union[httpx.Client, httpx.AsyncClient],
+) -> typing.Optional[ConnectionPoolStats]:
+    """
+    Reports the occupancy of the default transport's connection pool, on a best-effort basis. httpx does not expose
+    its pool publicly, so this inspects the underlying httpcore pool, and returns None for custom transports and
+    for httpcore versions whose pool it does not recognise.
+    """
+    pool = getattr(getattr(httpx_client, "_transport", None), "_pool", None)
+    if not isinstance(pool, (httpcore.ConnectionPool, httpcore.AsyncConnectionPool)):
+        return None
+    try:
+        connections: typing.List[typing.Any] = list(pool.connections)
+        idle_connections = sum(1 for connection in connections if connection.is_idle())
+        pending_requests = sum(1 for request in pool._requests if request.is_queued())
+        max_connections = pool._max_connections
+        max_keepalive_connections = pool._max_keepalive_connections
+    except AttributeError:
+        return None
+    return ConnectionPoolStats(
+        connections=len(connections),
+        active_connections=len(connections) - idle_connections,
+        idle_connections=idle_connections,
+        pending_requests=pending_requests,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+
+
+def build_httpx_timeout(
+    timeout: typing.Optional[float],
+    *,
+    connect: typing.Optional[float] = None,
+    read: typing.Optional[float] = None,
+    write: typing.Optional[float] = None,
+    pool: typing.Optional[float] = None,
+) -> typing.Union[float, httpx.Timeout, None]:
+    """
+    Returns `timeout` as is unless any phase has its own timeout, in which case the unset phases default to `timeout`.
+    """
+    if connect is None and read is None and write is None and pool is None:
+        return timeout
+    return httpx.Timeout(
+        timeout,
+        connect=connect if connect is not None else timeout,
+        read=read if read is not None else timeout,
+        write=write if write is not None else timeout,
+        pool=pool if pool is not None else timeout,
+    )
+
+
+def build_request(
+    httpx_client: typing.Union[httpx.Client, httpx.AsyncClient],
+    *,
+    method: str,
+    url: str,
+    base_headers: typing.Dict[str, str],
+    timeout: typing.Union[float, httpx.Timeout, None],
+    params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    json: typing.Optional[typing.Any] = None,
+    data: typing.Optional[typing.Any] = None,
+    content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
+    files: Files = None,
+    headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    request_options: typing.Optional[RequestOptions] = None,
+    omit: typing.Optional[typing.Any] = None,
+    force_multipart: typing.Optional[bool] = None,
+) -> httpx.Request:
+    """
+    Encodes the request once, so that retries resend the same `httpx.Request` rather than re-encoding its inputs.
+    """
+    json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+
+    request_files: typing.Optional[RequestFiles] = (
+        convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
+        if (files is not None and files is not omit and isinstance(files, dict))
+        else None
+    )
+
+    if (request_files is None or len(request_files) == 0) and force_multipart:
+        request_files = FORCE_MULTIPART
+
+    request_headers = jsonable_encoder(
+        remove_none_from_dict(
+            {
+                **base_headers,
+                **(headers if headers is not None else {}),
+                **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
+            }
+        )
+    )
+
+    # Encode JSON bodies ourselves, with orjson when it is installed, in the cases httpx would encode `json=`
+    if json_body is not None and content is None and data_body is None and not request_files:
+        content = dump_json(json_body)
+        json_body = None
+        if not any(name.lower() == "content-type" for name in request_headers):
+            request_headers["Content-Type"] = "application/json"
+
+    return httpx_client.build_request(
+        method=method,
+        url=url,
+        headers=request_headers,
+        params=encode_query(
+            jsonable_encoder(
+                remove_none_from_dict(
+                    remove_omit_from_dict(
+                        {
+                            **(params if params is not None else {}),
+                            **(
+                                request_options.get("additional_query_parameters", {}) or {}
+                                if request_options is not None
+                                else {}
+                            ),
+                        },
+                        omit,
+                    )
+                )
+            )
+        ),
+        json=json_body,
+        data=data_body,
+        content=content,
+        files=request_files,
+        timeout=timeout,
+    )
+
+
+def _get_user_id(params: typing.Optional[typing.Dict[str, typing.Any]]) -> typing.Optional[str]:
+    user_id = params.get("user_id") if params is not None else None
+    return user_id if isinstance(user_id, str) else None
+
+
+class _BaseHttpClient:
     def __init__(
         self,
         *,
-        httpx_client: httpx.Client,
-        base_timeout: typing.Callable[[], typing.Optional[float]],
+        base_timeout: typing.Callable[[], typing.Union[float, httpx.Timeout, None]],
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
-        self.httpx_client = httpx_client
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = maybe_base_url
@@ -170,6 +260,101 @@ class HttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    def get_retry_policy(self, request_options: typing.Optional[RequestOptions]) -> RetryPolicy:
+        if request_options is None:
+            return self.retry_policy
+        retry_policy = request_options.get("retry_policy") or self.retry_policy
+        return retry_policy.with_overrides(max_retries=request_options.get("max_retries"))
+
+    def _before_send(self, endpoint: str) -> typing.Tuple[float, typing.Optional[int]]:
+        """
+        Returns when the attempt was sent and the generation of the circuit it was admitted under.
+        """
+        generation = self.circuit_breaker.before_request(endpoint) if self.circuit_breaker is not None else None
+        return time.monotonic(), generation
+
+    def _after_send(
+        self,
+        endpoint: str,
+        sent_at: float,
+        generation: typing.Optional[int],
+        response: typing.Optional[httpx.Response],
+        path: typing.Optional[str],
+        user_id: typing.Optional[str],
+    ) -> None:
+        """
+        Feeds the outcome of an attempt, or its transport error when `response` is None, to the circuit breaker
+        and the rate limiter.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(
+                endpoint,
+                failed=response is None or response.status_code >= 500,
+                elapsed=time.monotonic() - sent_at,
+                generation=generation,
+            )
+        if response is not None and self.rate_limiter is not None:
+            self.rate_limiter.record(response, path, user_id)
+
+    def _abandon_send(self, endpoint: str, generation: typing.Optional[int]) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(endpoint, generation)
+
+    def _build_request(
+        self,
+        httpx_client: typing.Union[httpx.Client, httpx.AsyncClient],
+        path: typing.Optional[str],
+        *,
+        method: str,
+        base_url: typing.Optional[str],
+        request_options: typing.Optional[RequestOptions],
+        **kwargs: typing.Any,
+    ) -> httpx.Request:
+        timeout = (
+            request_options.get("timeout_in_seconds")
+            if request_options is not None and request_options.get("timeout_in_seconds") is not None
+            else self.base_timeout()
+        )
+        return build_request(
+            httpx_client,
+            method=method,
+            url=urllib.parse.urljoin(f"{self.get_base_url(base_url)}/", path),
+            base_headers=self.base_headers(),
+            timeout=timeout,
+            request_options=request_options,
+            **kwargs,
+        )
+
+
+class HttpClient(_BaseHttpClient):
+    def __init__(
+        self,
+        *,
+        httpx_client: httpx.Client,
+        base_timeout: typing.Callable[[], typing.Union[float, httpx.Timeout, None]],
+        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_url: typing.Optional[typing.Callable[[], str]] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+    ):
+        super().__init__(
+            base_timeout=base_timeout,
+            base_headers=base_headers,
+            base_url=base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+        )
+        self.httpx_client = httpx_client
+        self.single_flight = SingleFlight() if coalesce_requests else None
+
+    def get_connection_pool_stats(self) -> typing.Optional[ConnectionPoolStats]:
+        return get_connection_pool_stats(self.httpx_client)
+
     def request(
         self,
         path: typing.Optional[str] = None,
@@ -180,91 +365,90 @@ class HttpClient:
         json: typing.Optional[typing.Any] = None,
         data: typing.Optional[typing.Any] = None,
         content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
-        files: typing.Optional[
-            typing.Union[
-                typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]],
-                typing.List[typing.Tuple[str, File]],
-            ]
-        ] = None,
+        files: Files = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> httpx.Response:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        request_files: typing.Optional[RequestFiles] = (
-            convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-            if (files is not None and files is not omit and isinstance(files, dict))
-            else None
-        )
-
-        if (request_files is None or len(request_files) == 0) and force_multipart:
-            request_files = FORCE_MULTIPART
-
-        response = self.httpx_client.request(
+        request = self._build_request(
+            self.httpx_client,
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=request_files,
-            timeout=timeout,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+            force_multipart=force_multipart,
         )
+        retry_policy = self.get_retry_policy(request_options)
+        endpoint = get_endpoint(path)
+        cache_key = self.response_cache.get_key(request, endpoint) if self.response_cache is not None else None
+        if self.response_cache is None or cache_key is None:
+            return self._send_coalesced(request, path, params, retry_policy)
+
+        cached_response, stale = self.response_cache.lookup(cache_key, request)
+        if cached_response is not None:
+            return cached_response
+        response = self._send_coalesced(request, path, params, retry_policy)
+        return self.response_cache.update(cache_key, endpoint, response, stale)
+
+    def _send_coalesced(
+        self,
+        request: httpx.Request,
+        path: typing.Optional[str],
+        params: typing.Optional[typing.Dict[str, typing.Any]],
+        retry_policy: RetryPolicy,
+    ) -> httpx.Response:
+        if self.single_flight is not None and request.method == "GET":
+            return self.single_flight.do(
+                get_request_key(request), lambda: self._send_with_retries(request, path, params, retry_policy)
+            )
+        return self._send_with_retries(request, path, params, retry_policy)
 
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
-                return self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
-
-        return response
+    def _send_with_retries(
+        self,
+        request: httpx.Request,
+        path: typing.Optional[str],
+        params: typing.Optional[typing.Dict[str, typing.Any]],
+        retry_policy: RetryPolicy,
+    ) -> httpx.Response:
+        user_id = _get_user_id(params)
+        endpoint = get_endpoint(path)
+        started_at = time.monotonic()
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path, user_id)
+            sent_at, generation = self._before_send(endpoint)
+            try:
+                response = self.httpx_client.send(request)
+            except httpx.TransportError as e:
+                self._after_send(endpoint, sent_at, generation, None, path, user_id)
+                delay = retry_policy.get_delay(retries)
+                if not (
+                    retry_policy.should_retry_exception(e, request.method)
+                    and retry_policy.allows_retry(retries, delay, started_at)
+                ):
+                    raise
+            except BaseException:
+                self._abandon_send(endpoint, generation)
+                raise
+            else:
+                self._after_send(endpoint, sent_at, generation, response, path, user_id)
+                if not retry_policy.should_retry_response(response):
+                    return response
+                delay = retry_policy.get_delay(retries, response)
+                if not retry_policy.allows_retry(retries, delay, started_at):
+                    return response
+                response.close()
+            time.sleep(delay)
+            retries += 1
 
     @contextmanager
     def stream(
@@ -277,96 +461,82 @@ class HttpClient:
         json: typing.Optional[typing.Any] = None,
         data: typing.Optional[typing.Any] = None,
         content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
-        files: typing.Optional[
-            typing.Union[
-                typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]],
-                typing.List[typing.Tuple[str, File]],
-            ]
-        ] = None,
+        files: Files = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> typing.Iterator[httpx.Response]:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        request_files: typing.Optional[RequestFiles] = (
-            convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-            if (files is not None and files is not omit and isinstance(files, dict))
-            else None
-        )
-
-        if (request_files is None or len(request_files) == 0) and force_multipart:
-            request_files = FORCE_MULTIPART
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        with self.httpx_client.stream(
+        request = self._build_request(
+            self.httpx_client,
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=request_files,
-            timeout=timeout,
-        ) as stream:
-            yield stream
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+            force_multipart=force_multipart,
+        )
+        user_id = _get_user_id(params)
+        endpoint = get_endpoint(path)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(path, user_id)
+        sent_at, generation = self._before_send(endpoint)
+        try:
+            response = self.httpx_client.send(request, stream=True)
+        except httpx.TransportError:
+            self._after_send(endpoint, sent_at, generation, None, path, user_id)
+            raise
+        except BaseException:
+            self._abandon_send(endpoint, generation)
+            raise
+        self._after_send(endpoint, sent_at, generation, response, path, user_id)
+        try:
+            yield response
+        finally:
+            response.close()
 
 
-class AsyncHttpClient:
+class AsyncHttpClient(_BaseHttpClient):
     def __init__(
         self,
         *,
         httpx_client: httpx.AsyncClient,
-        base_timeout: typing.Callable[[], typing.Optional[float]],
+        base_timeout: typing.Callable[[], typing.Union[float, httpx.Timeout, None]],
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
     ):
-        self.base_url = base_url
-        self.base_timeout = base_timeout
-        self.base_headers = base_headers
+        super().__init__(
+            base_timeout=base_timeout,
+            base_headers=base_headers,
+            base_url=base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+        )
         self.httpx_client = httpx_client
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.hedging_policy = hedging_policy
 
-    def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
-        base_url = maybe_base_url
-        if self.base_url is not None and base_url is None:
-            base_url = self.base_url()
+    def get_connection_pool_stats(self) -> typing.Optional[ConnectionPoolStats]:
+        return get_connection_pool_stats(self.httpx_client)
 
-        if base_url is None:
-            raise ValueError("A base_url is required to make this request, please provide one and try again.")
-        return base_url
+    async def _send(self, request: httpx.Request, endpoint: str) -> httpx.Response:
+        if self.hedging_policy is not None and request.method == "GET":
+            return await send_hedged(self.httpx_client, request, endpoint=endpoint, policy=self.hedging_policy)
+        return await self.httpx_client.send(request)
 
     async def request(
         self,
@@ -378,91 +548,90 @@ class AsyncHttpClient:
         json: typing.Optional[typing.Any] = None,
         data: typing.Optional[typing.Any] = None,
         content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
-        files: typing.Optional[
-            typing.Union[
-                typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]],
-                typing.List[typing.Tuple[str, File]],
-            ]
-        ] = None,
+        files: Files = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> httpx.Response:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        request_files: typing.Optional[RequestFiles] = (
-            convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-            if (files is not None and files is not omit and isinstance(files, dict))
-            else None
-        )
-
-        if (request_files is None or len(request_files) == 0) and force_multipart:
-            request_files = FORCE_MULTIPART
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        # Add the input to each of these and do None-safety checks
-        response = await self.httpx_client.request(
+        request = self._build_request(
+            self.httpx_client,
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=request_files,
-            timeout=timeout,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+            force_multipart=force_multipart,
         )
+        retry_policy = self.get_retry_policy(request_options)
+        endpoint = get_endpoint(path)
+        cache_key = self.response_cache.get_key(request, endpoint) if self.response_cache is not None else None
+        if self.response_cache is None or cache_key is None:
+            return await self._send_coalesced(request, path, params, retry_policy)
+
+        cached_response, stale = self.response_cache.lookup(cache_key, request)
+        if cached_response is not None:
+            return cached_response
+        response = await self._send_coalesced(request, path, params, retry_policy)
+        return self.response_cache.update(cache_key, endpoint, response, stale)
+
+    async def _send_coalesced(
+        self,
+        request: httpx.Request,
+        path: typing.Optional[str],
+        params: typing.Optional[typing.Dict[str, typing.Any]],
+        retry_policy: RetryPolicy,
+    ) -> httpx.Response:
+        if self.single_flight is not None and request.method == "GET":
+            return await self.single_flight.do(
+                get_request_key(request), lambda: self._send_with_retries(request, path, params, retry_policy)
+            )
+        return await self._send_with_retries(request, path, params, retry_policy)
 
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
-                return await self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
-        return response
+    async def _send_with_retries(
+        self,
+        request: httpx.Request,
+        path: typing.Optional[str],
+        params: typing.Optional[typing.Dict[str, typing.Any]],
+        retry_policy: RetryPolicy,
+    ) -> httpx.Response:
+        user_id = _get_user_id(params)
+        endpoint = get_endpoint(path)
+        started_at = time.monotonic()
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(path, user_id)
+            sent_at, generation = self._before_send(endpoint)
+            try:
+                response = await self._send(request, endpoint)
+            except httpx.TransportError as e:
+                self._after_send(endpoint, sent_at, generation, None, path, user_id)
+                delay = retry_policy.get_delay(retries)
+                if not (
+                    retry_policy.should_retry_exception(e, request.method)
+                    and retry_policy.allows_retry(retries, delay, started_at)
+                ):
+                    raise
+            except BaseException:
+                self._abandon_send(endpoint, generation)
+                raise
+            else:
+                self._after_send(endpoint, sent_at, generation, response, path, user_id)
+                if not retry_policy.should_retry_response(response):
+                    return response
+                delay = retry_policy.get_delay(retries, response)
+                if not retry_policy.allows_retry(retries, delay, started_at):
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            retries += 1
 
     @asynccontextmanager
     async def stream(
@@ -475,69 +644,42 @@ class AsyncHttpClient:
         json: typing.Optional[typing.Any] = None,
         data: typing.Optional[typing.Any] = None,
         content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
-        files: typing.Optional[
-            typing.Union[
-                typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]],
-                typing.List[typing.Tuple[str, File]],
-            ]
-        ] = None,
+        files: Files = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> typing.AsyncIterator[httpx.Response]:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        request_files: typing.Optional[RequestFiles] = (
-            convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-            if (files is not None and files is not omit and isinstance(files, dict))
-            else None
-        )
-
-        if (request_files is None or len(request_files) == 0) and force_multipart:
-            request_files = FORCE_MULTIPART
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        async with self.httpx_client.stream(
+        request = self._build_request(
+            self.httpx_client,
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit=omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=request_files,
-            timeout=timeout,
-        ) as stream:
-            yield stream
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+            force_multipart=force_multipart,
+        )
+        user_id = _get_user_id(params)
+        endpoint = get_endpoint(path)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(path, user_id)
+        sent_at, generation = self._before_send(endpoint)
+        try:
+            response = await self.httpx_client.send(request, stream=True)
+        except httpx.TransportError:
+            self._after_send(endpoint, sent_at, generation, None, path, user_id)
+            raise
+        except BaseException:
+            self._abandon_send(endpoint, generation)
+            raise
+        self._after_send(endpoint, sent_at, generation, response, path, user_id)
+        try:
+            yield response
+        finally:
+            await response.aclose()
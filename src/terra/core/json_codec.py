@@ -0,0 +1,58 @@
+import json
+import typing
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
+
+
+def _loads_fallback(source: typing.Union[httpx.Response, bytes, str]) -> typing.Any:
+    # Also covers what the fast decoders reject, such as non UTF-8 bodies and NaN literals
+    if isinstance(source, httpx.Response):
+        return source.json()
+    return json.loads(source)
+
+
+def load_json(source: typing.Union[httpx.Response, bytes, str]) -> typing.Any:
+    """
+    Decodes the JSON body of a response, or a JSON document, with orjson or msgspec when installed, falling back to
+    the standard library. Invalid JSON raises `json.JSONDecodeError` whichever decoder is used.
+    """
+    content = source.content if isinstance(source, httpx.Response) else source
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return _loads_fallback(source)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(content)
+        except msgspec.DecodeError:
+            return _loads_fallback(source)
+    return _loads_fallback(source)
+
+
+def dump_json(obj: typing.Any) -> bytes:
+    """
+    Encodes an already JSON compatible object, see `jsonable_encoder`, compactly as UTF-8 like httpx does for a
+    `json=` body.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    elif msgspec is not None:
+        try:
+            return msgspec.json.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
@@ -0,0 +1,161 @@
+import codecs
+import json
+import re
+import typing
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+# What may follow the part of a number decoded so far, if the number continues in the next chunk
+_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+\-]*\Z")
+
+_OBJECT_START = 0
+_KEY = 1
+_VALUE = 2
+_ARRAY_START = 3
+_ITEM = 4
+_DONE = 5
+
+
+class JsonArrayStream:
+    """
+    Incrementally parses a JSON object fed to it chunk by chunk, returning the items of the array under `key` as
+    soon as each is complete. Only one item is held at a time, the object's other values are kept in `fields`, and
+    `key_found` tells whether the object had the array at all.
+
+    Examples
+    --------
+    stream = JsonArrayStream("data")
+    for chunk in response.iter_bytes():
+        for record in stream.feed(chunk):
+            ...
+    stream.close()
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.fields: typing.Dict[str, typing.Any] = {}
+        self.key_found = False
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pending: typing.List[str] = []
+        self._pending_size = 0
+        self._position = 0
+        self._state = _OBJECT_START
+        self._current_key: typing.Optional[str] = None
+        # Values are only re-parsed once the buffer has doubled since the last incomplete attempt, which keeps
+        # parsing a value that spans many chunks linear in its size
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> typing.List[typing.Any]:
+        text = self._text_decoder.decode(chunk)
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if len(self._buffer) + self._pending_size < self._retry_at:
+            return []
+        self._flush_pending()
+        return self._parse(final=False)
+
+    def close(self) -> typing.List[typing.Any]:
+        """
+        Parses what remains of the body, raising a `json.JSONDecodeError` if it is truncated or invalid.
+        """
+        self._pending.append(self._text_decoder.decode(b"", final=True))
+        self._flush_pending()
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise json.JSONDecodeError("Unexpected end of data", self._buffer, len(self._buffer))
+        return items
+
+    def _flush_pending(self) -> None:
+        # Chunks are joined in one go, appending them one by one would copy a large value once per chunk
+        self._buffer = "".join([self._buffer, *self._pending])
+        self._pending = []
+        self._pending_size = 0
+
+    def _parse(self, *, final: bool) -> typing.List[typing.Any]:
+        items = []
+        buffer = self._buffer
+        position = self._position
+        while self._state != _DONE:
+            position = _WHITESPACE_RE.match(buffer, position).end()  # type: ignore[union-attr]
+            if position == len(buffer):
+                break
+            char = buffer[position]
+
+            if self._state == _OBJECT_START:
+                if char != "{":
+                    raise json.JSONDecodeError("Expecting '{'", buffer, position)
+                position += 1
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == "}":
+                    position += 1
+                    self._state = _DONE
+                elif char == ",":
+                    position += 1
+                elif char != '"':
+                    raise json.JSONDecodeError("Expecting property name enclosed in double quotes", buffer, position)
+                else:
+                    key, end = self._decode(buffer, position, final=final)
+                    if key is _INCOMPLETE:
+                        break
+                    colon = _WHITESPACE_RE.match(buffer, end).end()  # type: ignore[union-attr]
+                    if colon == len(buffer):
+                        if final:
+                            raise json.JSONDecodeError("Expecting ':' delimiter", buffer, colon)
+                        break
+                    if buffer[colon] != ":":
+                        raise json.JSONDecodeError("Expecting ':' delimiter", buffer, colon)
+                    self._current_key = key
+                    position = colon + 1
+                    if key == self.key:
+                        self.key_found = True
+                        self._state = _ARRAY_START
+                    else:
+                        self._state = _VALUE
+            elif self._state == _ARRAY_START and char == "[":
+                position += 1
+                self._state = _ITEM
+            elif self._state == _ITEM and char == "]":
+                position += 1
+                self._state = _KEY
+            elif self._state == _ITEM and char == ",":
+                position += 1
+            else:
+                value, end = self._decode(buffer, position, final=final)
+                if value is _INCOMPLETE:
+                    self._retry_at = 2 * len(buffer) - position
+                    break
+                position = end
+                if self._state == _ITEM:
+                    items.append(value)
+                else:
+                    self.fields[typing.cast(str, self._current_key)] = value
+                    self._state = _KEY
+
+        if final and position < len(buffer) and buffer[position:].strip():
+            raise json.JSONDecodeError("Extra data", buffer, position)
+        # Drop what has been parsed once it is most of the buffer, so that the buffer only holds about one value
+        if position > len(buffer) // 2:
+            self._buffer = buffer[position:]
+            self._retry_at = max(0, self._retry_at - position)
+            position = 0
+        self._position = position
+        return items
+
+    def _decode(self, buffer: str, position: int, *, final: bool) -> typing.Tuple[typing.Any, int]:
+        try:
+            value, end = self._json_decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _INCOMPLETE, position
+        # A number, or literal, may continue in the next chunk. A number cut short, e.g. "1." or "2e", decodes up to
+        # the characters which would continue it
+        if not final and buffer[position] not in '{["' and _NUMBER_TAIL_RE.match(buffer, end):
+            return _INCOMPLETE, position
+        self._retry_at = 0
+        return value, end
+
+
+_INCOMPLETE: typing.Any = object()
@@ -0,0 +1,90 @@
+import typing
+
+import pydantic
+from .serialization import get_field_to_alias_mapping
+from .unchecked_base_model import (
+    _get_field_default,
+    _get_field_key,
+    _get_field_type,
+    _get_model_cache,
+    _get_model_fields,
+    _get_pending_fields,
+)
+
+
+class ModelField(typing.NamedTuple):
+    name: str
+    key: str
+    """
+    The key of the field in the JSON object of the model.
+    """
+
+    type_: typing.Any
+    default: typing.Any
+
+
+# The fields of each model, which are fixed once the model is defined
+_MODEL_FIELDS: typing.Dict[typing.Type[typing.Any], typing.Dict[str, ModelField]] = {}
+
+
+def get_model_fields(model: typing.Type[pydantic.BaseModel]) -> typing.Dict[str, ModelField]:
+    """
+    Returns the fields of `model` by name, with their JSON key, annotated type and default, for pydantic v1 and v2
+    alike.
+    """
+    fields = _MODEL_FIELDS.get(model)
+    if fields is None:
+        field_aliases = get_field_to_alias_mapping(model)
+        fields = {}
+        for name, field in _get_model_fields(model).items():
+            key = _get_field_key(name, field, field_aliases)
+            fields[name] = ModelField(
+                name=name,
+                key=key if key is not None else name,
+                type_=_get_field_type(field),
+                default=_get_field_default(field),
+            )
+        _MODEL_FIELDS[model] = fields
+    return fields
+
+
+def get_raw_field_value(value: typing.Any, name: str, key: str) -> typing.Any:
+    """
+    Returns the field `name` of a model, or the value under its JSON `key` of a JSON object. The JSON of fields a
+    lazily decoded model has not decoded yet is returned as is, without decoding it.
+    """
+    if isinstance(value, dict):
+        return value.get(key)
+    if value is None:
+        return None
+    fields = getattr(value, "__dict__", None)
+    if fields is not None and name in fields:
+        return fields[name]
+    if isinstance(value, pydantic.BaseModel):
+        pending = _get_pending_fields(value)
+        if pending:
+            entry = pending.get(name)
+            if entry is not None:
+                return entry[1]
+    return getattr(value, name, None)
+
+
+def get_model_cache(model: typing.Any) -> typing.Optional[typing.Dict[typing.Any, typing.Any]]:
+    """
+    Returns a dict stored on `model` for values derived from it, which lives and dies with the model, or None if
+    the model cannot store one, e.g. a pydantic v1 model or a msgspec struct.
+    """
+    return _get_model_cache(model)
+
+
+def get_record_type(
+    record: typing.Any, record_type: typing.Optional[typing.Type[typing.Any]] = None
+) -> typing.Type[typing.Any]:
+    """
+    Returns `record_type` if given, otherwise the type of `record`, which must then be a model.
+    """
+    if record_type is not None:
+        return record_type
+    if isinstance(record, pydantic.BaseModel):
+        return type(record)
+    raise TypeError("record_type is required unless the records are models")
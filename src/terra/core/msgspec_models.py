@@ -0,0 +1,242 @@
+import datetime as dt
+import inspect
+import typing
+import uuid
+
+import httpx
+import pydantic
+import typing_extensions
+from .json_codec import load_json
+from .pydantic_utilities import get_args, get_origin, is_literal_type, is_union
+from .serialization import get_field_to_alias_mapping
+from .unchecked_base_model import (
+    UnionMetadata,
+    _compile_member_signature,
+    _get_field_default,
+    _get_field_key,
+    _get_field_type,
+    _get_model_fields,
+    _select_union_members,
+    construct_type,
+)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
+
+MSGSPEC_REQUIRED = "The msgspec model backend requires msgspec, install terra-python[msgspec]"
+
+_PRIMITIVE_TYPES = (str, int, float, bool, dt.datetime, dt.date, uuid.UUID)
+
+_StructDecoder = typing.Callable[[bytes], typing.Any]
+
+# Struct mirrors and decoders are generated once per type, keyed by the pydantic type they mirror
+_STRUCT_TYPES: typing.Dict[typing.Tuple[typing.Any, typing.Optional[str]], typing.Any] = {}
+_STRUCT_MODELS: typing.Dict[typing.Any, typing.Type[pydantic.BaseModel]] = {}
+_DECODERS: typing.Dict[typing.Any, _StructDecoder] = {}
+
+if msgspec is not None:
+
+    class TerraStruct(msgspec.Struct, kw_only=True, frozen=True, omit_defaults=True):
+        """
+        The base of the msgspec mirrors of the pydantic models.
+        """
+
+        def dict(self) -> typing.Dict[str, typing.Any]:
+            return typing.cast(typing.Dict[str, typing.Any], msgspec.to_builtins(self))
+
+
+def get_struct_type(type_: typing.Any) -> typing.Any:
+    """
+    Returns the msgspec equivalent of `type_`, in which every pydantic model is replaced by a frozen
+    `msgspec.Struct` with the same field names.
+
+    As with the pydantic models every field is optional, and the fields of a model mirrored while it is being
+    mirrored, i.e. recursive references, as well as unions msgspec cannot tell apart without decoding, are left
+    as plain JSON values.
+    """
+    if msgspec is None:
+        raise ImportError(MSGSPEC_REQUIRED)
+    return _to_struct_type(type_, in_progress=set())
+
+
+def is_struct(value: typing.Any) -> bool:
+    """
+    Returns whether `value` was decoded by the msgspec model backend, rather than into a pydantic model.
+    """
+    return msgspec is not None and isinstance(value, TerraStruct)
+
+
+def get_struct_model(struct_type: typing.Any) -> typing.Type[pydantic.BaseModel]:
+    """
+    Returns the pydantic model that `struct_type`, a type returned by `get_struct_type`, mirrors.
+    """
+    try:
+        return _STRUCT_MODELS[struct_type]
+    except KeyError:
+        raise TypeError(f"{struct_type!r} is not a mirror of a pydantic model") from None
+
+
+def _to_struct_type(type_: typing.Any, *, in_progress: typing.Set[typing.Any]) -> typing.Any:
+    if type_ in _PRIMITIVE_TYPES or type_ is type(None):
+        return type_
+
+    base_type = get_origin(type_) or type_
+    args = get_args(type_)
+
+    if base_type == typing_extensions.Annotated:  # type: ignore[comparison-overlap]
+        discriminants = [metadata.discriminant for metadata in args[1:] if isinstance(metadata, UnionMetadata)]
+        if discriminants and is_union(get_origin(args[0])):
+            return _to_tagged_union(args[0], discriminants[0], in_progress=in_progress)
+        return _to_struct_type(args[0], in_progress=in_progress)
+
+    if is_union(base_type):
+        if typing.Any in args or len([arg for arg in args if _is_model(arg)]) > 1:
+            return typing.Any
+        return _checked(typing.Union[tuple(_to_struct_type(arg, in_progress=in_progress) for arg in args)])
+
+    if is_literal_type(type_):
+        return _checked(type_)
+
+    if base_type in (list, set, frozenset, tuple) and len(args) == 1:
+        item_type = _to_struct_type(args[0], in_progress=in_progress)
+        return typing.List[item_type]  # type: ignore[valid-type]
+
+    if base_type == dict and len(args) == 2:
+        key_type = _to_struct_type(args[0], in_progress=in_progress)
+        value_type = _to_struct_type(args[1], in_progress=in_progress)
+        return _checked(typing.Dict[key_type, value_type])  # type: ignore[valid-type]
+
+    if _is_model(type_):
+        return _to_struct(type_, tag_field=None, in_progress=in_progress)
+
+    return typing.Any
+
+
+def _to_tagged_union(union_type: typing.Any, tag_field: str, *, in_progress: typing.Set[typing.Any]) -> typing.Any:
+    members = get_args(union_type)
+    if not all(_is_model(member) for member in members):
+        return typing.Any
+    return _checked(
+        typing.Union[tuple(_to_struct(member, tag_field=tag_field, in_progress=in_progress) for member in members)]
+    )
+
+
+def _to_struct(
+    model: typing.Type[pydantic.BaseModel], *, tag_field: typing.Optional[str], in_progress: typing.Set[typing.Any]
+) -> typing.Any:
+    struct_type = _STRUCT_TYPES.get((model, tag_field))
+    if struct_type is not None:
+        return struct_type
+    if model in in_progress:
+        return typing.Any
+
+    in_progress.add(model)
+    try:
+        fields = _get_model_fields(model)
+        field_aliases = get_field_to_alias_mapping(model)
+        tag = None
+        struct_fields = []
+        for name, field in fields.items():
+            if name == tag_field:
+                # The tag is both matched on and set by msgspec, it cannot also be a field
+                tag = _get_field_default(field)
+                continue
+            key = _get_field_key(name, field, field_aliases)
+            default = _get_field_default(field)
+            field_type = _get_field_type(field)
+            struct_fields.append(
+                (
+                    name,
+                    _to_struct_type(field_type, in_progress=in_progress) if field_type is not None else typing.Any,
+                    msgspec.field(
+                        default=default if isinstance(default, _PRIMITIVE_TYPES) else None,
+                        name=key if key is not None and key != name else None,
+                    ),
+                )
+            )
+        struct_type = msgspec.defstruct(
+            model.__name__,
+            struct_fields,
+            bases=(TerraStruct,),
+            module=model.__module__,
+            tag_field=tag_field if tag is not None else None,
+            tag=tag,
+        )
+    finally:
+        in_progress.discard(model)
+
+    _STRUCT_TYPES[(model, tag_field)] = struct_type
+    _STRUCT_MODELS[struct_type] = model
+    return struct_type
+
+
+def _is_model(type_: typing.Any) -> bool:
+    return inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel)
+
+
+def _checked(type_: typing.Any) -> typing.Any:
+    # msgspec rejects unions it cannot decode unambiguously, e.g. of a str and a datetime, those stay untyped
+    try:
+        msgspec.json.Decoder(type_)
+    except TypeError:
+        return typing.Any
+    return type_
+
+
+def _get_decoder(type_: typing.Any) -> _StructDecoder:
+    decoder = _DECODERS.get(type_)
+    if decoder is None:
+        decoder = _DECODERS[type_] = _compile_decoder(type_)
+    return decoder
+
+
+def _compile_decoder(type_: typing.Any) -> _StructDecoder:
+    union_type = get_args(type_)[0] if get_origin(type_) == typing_extensions.Annotated else type_
+    models = (
+        [member for member in get_args(union_type) if _is_model(member)] if is_union(get_origin(union_type)) else []
+    )
+    struct_type = get_struct_type(type_)
+    if struct_type is not typing.Any or len(models) < 2:
+        return msgspec.json.Decoder(struct_type, strict=False).decode
+
+    # The fetch responses are unions of models, pick the member from the payload's keys, as the pydantic
+    # backend does, before decoding the payload straight into it
+    probe = msgspec.json.Decoder(typing.Dict[str, msgspec.Raw])
+    signatures = [_compile_member_signature(model) for model in models]
+    tag_keys = {key for signature in signatures for key in signature.tags}
+    decoders = {model: msgspec.json.Decoder(get_struct_type(model), strict=False) for model in models}
+
+    def decode_union(content: bytes) -> typing.Any:
+        fields: typing.Dict[str, typing.Any] = probe.decode(content)
+        for key in tag_keys & fields.keys():
+            fields[key] = msgspec.json.decode(fields[key])
+        candidates = _select_union_members(signatures, {}, fields)
+        if not candidates:
+            raise msgspec.ValidationError("The payload matches none of the union's members")
+        return decoders[candidates[0].model].decode(content)
+
+    return decode_union
+
+
+def decode_struct(response: httpx.Response, type_: typing.Any) -> typing.Any:
+    """
+    Decodes the body of `response` straight into the msgspec mirror of `type_`, in a single pass. Bodies msgspec
+    cannot decode, e.g. with a value of the wrong type, are decoded into the pydantic models instead.
+    """
+    try:
+        return _get_decoder(type_)(response.content)
+    except msgspec.DecodeError:
+        return construct_type(type_=type_, object_=load_json(response))
+
+
+def convert_struct(object_: typing.Any, type_: typing.Any) -> typing.Any:
+    """
+    Converts an already decoded JSON value into the msgspec mirror of `type_`, falling back to the pydantic
+    models as `decode_struct` does.
+    """
+    try:
+        return msgspec.convert(object_, get_struct_type(type_), strict=False)
+    except msgspec.ValidationError:
+        return construct_type(type_=type_, object_=object_)
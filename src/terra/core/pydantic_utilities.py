@@ -2,8 +2,24 @@
 
 # nopycln: file
 import datetime as dt
-from collections import defaultdict
-from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Union, cast
+import threading
+from collections import OrderedDict, defaultdict
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pydantic
 
@@ -36,10 +52,68 @@ T = TypeVar("T")
 Model = TypeVar("Model", bound=pydantic.BaseModel)
 
 
+class TypeAdapterCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TypeAdapterRegistry:
+    """
+    A process-wide, thread-safe LRU of `pydantic.TypeAdapter`s keyed by type, so that the core schema for a
+    type is only built once rather than on every validation. Only used under Pydantic V2.
+    """
+
+    def __init__(self, *, maxsize: int = 512) -> None:
+        self._maxsize = maxsize
+        self._adapters: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, type_: Any) -> Any:
+        try:
+            with self._lock:
+                adapter = self._adapters.get(type_)
+                if adapter is not None:
+                    self._adapters.move_to_end(type_)
+                    self._hits += 1
+                    return adapter
+                self._misses += 1
+        except TypeError:
+            # Unhashable types cannot be cached
+            return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+
+        # Build outside of the lock, schema construction is slow and concurrent builds are harmless
+        adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+        with self._lock:
+            self._adapters[type_] = adapter
+            self._adapters.move_to_end(type_)
+            while len(self._adapters) > self._maxsize:
+                self._adapters.popitem(last=False)
+        return adapter
+
+    def cache_info(self) -> TypeAdapterCacheInfo:
+        with self._lock:
+            return TypeAdapterCacheInfo(
+                hits=self._hits, misses=self._misses, maxsize=self._maxsize, currsize=len(self._adapters)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+type_adapter_registry = TypeAdapterRegistry()
+
+
 def parse_obj_as(type_: Type[T], object_: Any) -> T:
     dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
     if IS_PYDANTIC_V2:
-        adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+        adapter = type_adapter_registry.get(type_)
         return adapter.validate_python(dealiased_object)
     return pydantic.parse_obj_as(type_, dealiased_object)
 
@@ -0,0 +1,215 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+from .retry import _parse_retry_after
+from .ttl_cache import TTLCache
+
+# The rate limiter a response was recorded against, with the path and user of its request
+_RECORDED_ATTRIBUTE = "_terra_rate_limiter"
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket whose refill rate adapts to throttling: it is cut multiplicatively whenever the
+    API signals that it is being rate limited and recovers additively with every successful response.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: typing.Optional[float] = None,
+        min_rate: typing.Optional[float] = None,
+        decrease_factor: float = 0.5,
+        recovery_factor: float = 0.05,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 100
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.decrease_factor = decrease_factor
+        self.recovery_factor = recovery_factor
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token, returning the number of seconds the caller must wait before the token may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def throttle(self, retry_after: typing.Optional[float] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def recover(self) -> None:
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_factor)
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter shared by every sub-client of a `Terra` or `AsyncTerra` instance.
+
+    Every request takes a token from the global bucket and, when configured, from the bucket of the endpoint it
+    calls and of the user it concerns. Those buckets slow down when the API answers with a 429, a `Retry-After`
+    header or a `RateLimitRequestProcessing` or `RequestProcessing` body, and speed back up gradually as requests
+    succeed, so that workers settle just under the quota rather than alternating between bursts and backoff.
+
+    Parameters
+    ----------
+    rate : float
+        The number of requests per second allowed across the client.
+
+    burst : typing.Optional[float]
+        The number of requests that may be sent back to back. Defaults to one second's worth of requests.
+
+    per_user_rate : typing.Optional[float]
+        The number of requests per second allowed for any single `user_id`.
+
+    per_endpoint_rates : typing.Optional[typing.Mapping[str, float]]
+        The number of requests per second allowed for each endpoint, keyed by path prefix, e.g. `{"activity": 2}`.
+
+    decrease_factor : float
+        The factor a bucket's rate is multiplied by when the API signals throttling.
+
+    recovery_factor : float
+        The fraction of a bucket's configured rate regained with each successful response.
+
+    Examples
+    --------
+    from terra import Terra
+    from terra.core.rate_limiter import RateLimiter
+
+    client = Terra(
+        dev_id="YOUR_DEV_ID",
+        api_key="YOUR_API_KEY",
+        rate_limiter=RateLimiter(rate=10, per_user_rate=1, per_endpoint_rates={"activity": 2}),
+    )
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: typing.Optional[float] = None,
+        per_user_rate: typing.Optional[float] = None,
+        per_endpoint_rates: typing.Optional[typing.Mapping[str, float]] = None,
+        decrease_factor: float = 0.5,
+        recovery_factor: float = 0.05,
+    ) -> None:
+        self._bucket_options: typing.Dict[str, float] = {
+            "decrease_factor": decrease_factor,
+            "recovery_factor": recovery_factor,
+        }
+        self.bucket = TokenBucket(rate=rate, burst=burst, **self._bucket_options)
+        self.per_user_rate = per_user_rate
+        self._endpoint_buckets = {
+            path.strip("/"): TokenBucket(rate=endpoint_rate, **self._bucket_options)
+            for path, endpoint_rate in (per_endpoint_rates or {}).items()
+        }
+        # Longest prefixes first, so "auth/generateWidgetSession" wins over "auth"
+        self._endpoint_prefixes = sorted(self._endpoint_buckets, key=len, reverse=True)
+        # A bucket left idle refills completely, so evicting idle users' buckets loses nothing. Reads keep a bucket
+        # alive, so that the bucket of a user being throttled is never replaced by a full one
+        self._user_buckets: TTLCache[str, TokenBucket] = TTLCache(ttl=300, maxsize=10_000, sliding=True)
+        self._lock = threading.Lock()
+
+    def _get_buckets(self, path: typing.Optional[str], user_id: typing.Optional[str]) -> typing.List[TokenBucket]:
+        buckets = [self.bucket]
+        if path is not None and self._endpoint_prefixes:
+            path = path.strip("/")
+            for prefix in self._endpoint_prefixes:
+                if path == prefix or path.startswith(f"{prefix}/"):
+                    buckets.append(self._endpoint_buckets[prefix])
+                    break
+        if user_id is not None and self.per_user_rate is not None:
+            with self._lock:
+                bucket = self._user_buckets.get(user_id)
+                if bucket is None:
+                    bucket = TokenBucket(rate=self.per_user_rate, **self._bucket_options)
+                    self._user_buckets.set(user_id, bucket)
+            buckets.append(bucket)
+        return buckets
+
+    def reserve(self, path: typing.Optional[str] = None, user_id: typing.Optional[str] = None) -> float:
+        """
+        Takes a token from every bucket the request counts against, returning the number of seconds to wait.
+        """
+        return max(bucket.reserve() for bucket in self._get_buckets(path, user_id))
+
+    def acquire(self, path: typing.Optional[str] = None, user_id: typing.Optional[str] = None) -> None:
+        delay = self.reserve(path, user_id)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, path: typing.Optional[str] = None, user_id: typing.Optional[str] = None) -> None:
+        delay = self.reserve(path, user_id)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record(
+        self, response: httpx.Response, path: typing.Optional[str] = None, user_id: typing.Optional[str] = None
+    ) -> None:
+        """
+        Adapts the buckets the request counted against to the rate limit signals carried by its response.
+        """
+        throttled, retry_after = _get_rate_limit_signal(response)
+        for bucket in self._get_buckets(path, user_id):
+            if throttled:
+                bucket.throttle(retry_after)
+            elif response.is_success:
+                bucket.recover()
+        setattr(response, _RECORDED_ATTRIBUTE, (self, path, user_id))
+
+    def throttle(
+        self,
+        path: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+        retry_after: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Slows down the buckets a request counted against, for rate limit signals only found in its decoded body.
+        """
+        for bucket in self._get_buckets(path, user_id):
+            bucket.throttle(retry_after)
+
+
+def throttle_response(response: httpx.Response, retry_after: typing.Optional[float] = None) -> None:
+    """
+    Throttles the buckets of the rate limiter `response` was recorded against, if any. A response only throttles
+    once, however many times its body is decoded, e.g. when it is shared by coalesced requests.
+    """
+    recorded = response.__dict__.pop(_RECORDED_ATTRIBUTE, None)
+    if recorded is not None:
+        limiter, path, user_id = recorded
+        limiter.throttle(path, user_id, retry_after)
+
+
+def _get_rate_limit_signal(response: httpx.Response) -> typing.Tuple[bool, typing.Optional[float]]:
+    # Only the status and headers are read, the body of a streamed response may not have been read yet
+    retry_after = _parse_retry_after(response.headers)
+    return response.status_code == 429 or retry_after is not None, retry_after
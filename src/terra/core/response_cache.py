@@ -0,0 +1,270 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import typing
+
+import httpx
+from .ttl_cache import TTLCache
+
+# Endpoints whose data changes rarely, cached by default
+DEFAULT_CACHED_ENDPOINTS = ("integrations", "integrations/detailed", "athlete", "userInfo")
+
+# Endpoints returning a user's data over a date range, which pollers fetch repeatedly
+DATA_ENDPOINTS = ("activity", "body", "daily", "menstruation", "nutrition", "sleep")
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+class CachedResponse(typing.NamedTuple):
+    response: httpx.Response
+    expires_at: float
+    """
+    The `time.time()` after which the response must be revalidated, or refetched, before being used again.
+    """
+
+    etag: typing.Optional[str]
+    last_modified: typing.Optional[str] = None
+
+    def has_validator(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class CacheBackend(typing.Protocol):
+    def get(self, key: str) -> typing.Optional[CachedResponse]: ...
+
+    def set(self, key: str, entry: CachedResponse) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """
+    Keeps up to `maxsize` responses in memory, least recently used first out. Expired responses are kept for up
+    to `max_stale` seconds so that they can be revalidated cheaply.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, max_stale: float = 24 * 60 * 60) -> None:
+        self._entries: TTLCache[str, CachedResponse] = TTLCache(ttl=max_stale, maxsize=maxsize)
+
+    def get(self, key: str) -> typing.Optional[CachedResponse]:
+        return self._entries.get(key)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self._entries.set(key, entry)
+
+    def delete(self, key: str) -> None:
+        self._entries.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SqliteCacheBackend:
+    """
+    Persists up to `maxsize` responses in a sqlite database so that they survive restarts and can be shared between
+    processes. Only the status, headers and body of a response are stored, and the body is decoded again on the
+    first hit after a restart. The request, and with it the API key, is not stored.
+    """
+
+    def __init__(self, path: str, *, maxsize: int = 10_000) -> None:
+        self.maxsize = maxsize
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cached_responses ("
+            "key TEXT PRIMARY KEY, status_code INTEGER NOT NULL, headers TEXT NOT NULL, content BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, etag TEXT, last_modified TEXT, stored_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> typing.Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, expires_at, etag, last_modified FROM cached_responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, headers, content, expires_at, etag, last_modified = row
+        try:
+            response = httpx.Response(
+                status_code,
+                headers=[(name.encode("latin-1"), value.encode("latin-1")) for name, value in json.loads(headers)],
+                content=content,
+            )
+        except (TypeError, ValueError):
+            self.delete(key)
+            return None
+        return CachedResponse(response=response, expires_at=expires_at, etag=etag, last_modified=last_modified)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        response = entry.response
+        headers = json.dumps(
+            [(name.decode("latin-1"), value.decode("latin-1")) for name, value in response.headers.raw]
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cached_responses "
+                "(key, status_code, headers, content, expires_at, etag, last_modified, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    headers,
+                    response.content,
+                    entry.expires_at,
+                    entry.etag,
+                    entry.last_modified,
+                    time.time(),
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM cached_responses WHERE key NOT IN "
+                "(SELECT key FROM cached_responses ORDER BY stored_at DESC LIMIT ?)",
+                (self.maxsize,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cached_responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cached_responses")
+
+
+class ResponseCache:
+    """
+    Caches the successful responses of slow-changing GET endpoints, together with the objects they were decoded
+    into, so that a cache hit skips both the request and the decoding.
+
+    A response's `Cache-Control` header takes precedence over the configured TTL: `no-store` responses are not
+    cached, `no-cache` responses are always revalidated and `max-age` sets the TTL. Once a response with an `ETag`
+    or `Last-Modified` header expires, it is revalidated with `If-None-Match` or `If-Modified-Since` and served from
+    the cache if the API answers 304.
+
+    Parameters
+    ----------
+    ttl : float
+        The number of seconds responses are fresh for.
+
+    endpoint_ttls : typing.Optional[typing.Mapping[str, float]]
+        The endpoints to cache, mapped to their TTL in seconds. Defaults to the integrations, athlete and user info
+        endpoints, cached for `ttl` seconds.
+
+    revalidate_endpoints : typing.Optional[typing.Collection[str]]
+        Endpoints whose responses are never fresh but are kept to make the next identical request conditional,
+        e.g. `DATA_ENDPOINTS` for pollers that mostly re-fetch unchanged data. Responses without a validator are
+        not kept.
+
+    backend : typing.Optional[CacheBackend]
+        Where responses are stored. Defaults to an in-memory LRU, see `SqliteCacheBackend` for an on-disk cache.
+
+    Examples
+    --------
+    from terra import Terra
+    from terra.core.response_cache import ResponseCache, SqliteCacheBackend
+
+    client = Terra(
+        dev_id="YOUR_DEV_ID",
+        api_key="YOUR_API_KEY",
+        response_cache=ResponseCache(
+            endpoint_ttls={"integrations": 3600, "userInfo": 60},
+            backend=SqliteCacheBackend("terra-cache.sqlite"),
+        ),
+    )
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300,
+        endpoint_ttls: typing.Optional[typing.Mapping[str, float]] = None,
+        revalidate_endpoints: typing.Optional[typing.Collection[str]] = None,
+        backend: typing.Optional[CacheBackend] = None,
+    ) -> None:
+        self.endpoint_ttls: typing.Dict[str, float] = (
+            dict(endpoint_ttls) if endpoint_ttls is not None else dict.fromkeys(DEFAULT_CACHED_ENDPOINTS, ttl)
+        )
+        self.endpoint_ttls.update(dict.fromkeys(revalidate_endpoints or (), 0))
+        self.backend: CacheBackend = backend if backend is not None else InMemoryCacheBackend()
+
+    def get_key(self, request: httpx.Request, endpoint: str) -> typing.Optional[str]:
+        """
+        Returns the key `request` is cached under, or None if its responses are not cached.
+        """
+        if request.method != "GET" or endpoint not in self.endpoint_ttls:
+            return None
+        # Credentials are part of the key, so clients of different developers never share responses
+        key = hashlib.sha256(str(request.url).encode())
+        for name, value in sorted(request.headers.raw):
+            key.update(b"\0" + name + b"\0" + value)
+        return key.hexdigest()
+
+    def lookup(
+        self, key: str, request: httpx.Request
+    ) -> typing.Tuple[typing.Optional[httpx.Response], typing.Optional[CachedResponse]]:
+        """
+        Returns the cached response if it is fresh. Otherwise returns the stale entry, if any, after making
+        `request` conditional on it.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, None
+        if entry.is_fresh():
+            return entry.response, entry
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return None, entry
+
+    def update(
+        self, key: str, endpoint: str, response: httpx.Response, stale: typing.Optional[CachedResponse]
+    ) -> httpx.Response:
+        """
+        Stores `response` if it may be cached, returning the response the caller should use: the cached one if
+        the API confirmed it is still valid.
+        """
+        if response.status_code == 304 and stale is not None:
+            self.backend.set(key, stale._replace(expires_at=time.time() + self._get_ttl(endpoint, response)))
+            return stale.response
+        if not response.is_success:
+            return response
+
+        cache_control = response.headers.get("cache-control", "").lower()
+        entry = CachedResponse(
+            response=response,
+            expires_at=time.time() + self._get_ttl(endpoint, response),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        # A response that is immediately stale is only worth keeping if it can be revalidated
+        if "no-store" in cache_control or not (entry.is_fresh() or entry.has_validator()):
+            self.backend.delete(key)
+        else:
+            self.backend.set(key, entry)
+        return response
+
+    def invalidate(self, key: str) -> None:
+        self.backend.delete(key)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _get_ttl(self, endpoint: str, response: httpx.Response) -> float:
+        cache_control = response.headers.get("cache-control", "").lower()
+        if "no-cache" in cache_control:
+            return 0
+        max_age = _MAX_AGE_RE.search(cache_control)
+        if max_age is not None:
+            return float(max_age.group(1))
+        return self.endpoint_ttls[endpoint]
@@ -0,0 +1,163 @@
+import dataclasses
+import email.utils
+import re
+import time
+import typing
+from random import random
+
+import httpx
+
+INITIAL_RETRY_DELAY_SECONDS = 0.5
+MAX_RETRY_DELAY_SECONDS = 10
+MAX_RETRY_DELAY_SECONDS_FROM_HEADER = 30
+
+DEFAULT_RETRY_STATUSES: typing.FrozenSet[int] = frozenset((408, 409, 429, *range(500, 600)))
+
+# Methods which leave the server in the same state however many times they are sent
+IDEMPOTENT_METHODS: typing.FrozenSet[str] = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+
+
+def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
+    """
+    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
+
+    Inspired by the urllib3 retry implementation.
+    """
+    retry_after_ms = response_headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return int(retry_after_ms) / 1000 if int(retry_after_ms) > 0 else 0
+        except Exception:
+            pass
+
+    retry_after = response_headers.get("retry-after")
+    if retry_after is None:
+        return None
+
+    # Attempt to parse the header as an int.
+    if re.match(r"^\s*[0-9]+\s*$", retry_after):
+        seconds = float(retry_after)
+    # Fallback to parsing it as a date.
+    else:
+        retry_date_tuple = email.utils.parsedate_tz(retry_after)
+        if retry_date_tuple is None:
+            return None
+        if retry_date_tuple[9] is None:  # Python 2
+            # Assume UTC if no timezone was specified
+            # On Python2.7, parsedate_tz returns None for a timezone offset
+            # instead of 0 if no timezone is given, where mktime_tz treats
+            # a None timezone offset as local time.
+            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
+
+        retry_date = email.utils.mktime_tz(retry_date_tuple)
+        seconds = retry_date - time.time()
+
+    if seconds < 0:
+        seconds = 0
+
+    return seconds
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether, and after how long, a failed request is retried.
+
+    A policy can be passed to the client to apply to every request, and overridden for a single request through
+    the `retry_policy` request option. The `max_retries` request option still overrides `max_retries` alone.
+
+    Parameters
+    ----------
+    max_retries : int
+        The number of times a request is retried after the first attempt.
+
+    retry_statuses : typing.Collection[int]
+        The response status codes that are retried. Defaults to 408, 409, 429 and every 5xx.
+
+    initial_delay : float
+        The delay, in seconds, before the first retry.
+
+    backoff_factor : float
+        The factor the delay is multiplied by after each retry.
+
+    max_delay : float
+        The longest delay, in seconds, the backoff curve grows to.
+
+    jitter : float
+        The fraction of the delay that is randomly shaved off, so that clients retrying together spread out.
+
+    max_retry_after : float
+        The longest `Retry-After` delay, in seconds, that is honoured. Longer server delays fall back to the backoff curve.
+
+    deadline : typing.Optional[float]
+        The total number of seconds, measured from the first attempt, after which no further retry is started.
+
+    retry_on_timeout : bool
+        Whether connect and read timeouts are retried rather than raised. A request that timed out connecting was
+        never sent, but one that timed out reading its response may have been processed, so read timeouts are
+        only retried for idempotent methods.
+
+    retry_read_timeout_on_any_method : bool
+        Whether read timeouts of non-idempotent requests, e.g. POSTs, are retried too.
+
+    Examples
+    --------
+    from terra import RetryPolicy, Terra
+
+    client = Terra(
+        dev_id="YOUR_DEV_ID",
+        api_key="YOUR_API_KEY",
+        retry_policy=RetryPolicy(max_retries=5, retry_statuses={429, 503}, deadline=30),
+    )
+    """
+
+    max_retries: int = 0
+    retry_statuses: typing.Collection[int] = DEFAULT_RETRY_STATUSES
+    initial_delay: float = INITIAL_RETRY_DELAY_SECONDS
+    backoff_factor: float = 2.0
+    max_delay: float = MAX_RETRY_DELAY_SECONDS
+    jitter: float = 0.25
+    max_retry_after: float = MAX_RETRY_DELAY_SECONDS_FROM_HEADER
+    deadline: typing.Optional[float] = None
+    retry_on_timeout: bool = True
+    retry_read_timeout_on_any_method: bool = False
+
+    def with_overrides(self, *, max_retries: typing.Optional[int] = None) -> "RetryPolicy":
+        if max_retries is None or max_retries == self.max_retries:
+            return self
+        return dataclasses.replace(self, max_retries=max_retries)
+
+    def should_retry_response(self, response: httpx.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    def should_retry_exception(self, exception: Exception, method: str) -> bool:
+        if not self.retry_on_timeout:
+            return False
+        if isinstance(exception, httpx.ConnectTimeout):
+            return True
+        if isinstance(exception, httpx.ReadTimeout):
+            return self.retry_read_timeout_on_any_method or method.upper() in IDEMPOTENT_METHODS
+        return False
+
+    def get_delay(self, retries: int, response: typing.Optional[httpx.Response] = None) -> float:
+        """
+        Returns the number of seconds to wait before the retry following `retries` earlier retries, preferring
+        the server's `Retry-After` header when it asks for a reasonable delay.
+        """
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers)
+            if retry_after is not None and retry_after <= self.max_retry_after:
+                return retry_after
+
+        retry_delay = min(self.initial_delay * pow(self.backoff_factor, retries), self.max_delay)
+        delay = retry_delay * (1 - self.jitter * random())
+        return delay if delay >= 0 else 0
+
+    def allows_retry(self, retries: int, delay: float, started_at: float) -> bool:
+        """
+        Whether another retry, after `retries` earlier retries and a wait of `delay` seconds, fits within the policy.
+        `started_at` is the `time.monotonic()` of the first attempt.
+        """
+        if retries >= self.max_retries:
+            return False
+        return self.deadline is None or time.monotonic() + delay - started_at <= self.deadline
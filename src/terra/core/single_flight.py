@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import typing
+
+import httpx
+
+T = typing.TypeVar("T")
+
+RequestKey = typing.Tuple[str, str, typing.Tuple[typing.Tuple[bytes, bytes], ...]]
+
+
+def get_request_key(request: httpx.Request) -> RequestKey:
+    """
+    Identifies a request by its method, URL, including the encoded query parameters, and headers.
+    """
+    return request.method, str(request.url), tuple(sorted(request.headers.raw))
+
+
+class _Call(typing.Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: typing.Optional[T] = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key across threads: the first caller runs the call, and callers
+    arriving while it is in flight wait for it and share its result, or its error.
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[typing.Hashable, _Call[typing.Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return typing.cast(T, call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls for the same key on an event loop. The call runs as its own task, so cancelling
+    one of the callers does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[typing.Hashable, "asyncio.Future[typing.Any]"] = {}
+
+    async def do(self, key: typing.Hashable, fn: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(future)
@@ -0,0 +1,133 @@
+import array
+import datetime as dt
+import typing
+
+from .pydantic_utilities import parse_datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore
+
+# The value of missing or unparseable timestamps, which NumPy reads as NaT
+MISSING_TIMESTAMP = -(1 << 63)
+
+_EPOCH = dt.datetime(1970, 1, 1)
+_ZERO = dt.timedelta(0)
+
+# Positions of the digits and separators of the date and time, in "YYYY-MM-DDTHH:MM:SS"
+_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_DASHES = [4, 7]
+_COLONS = [13, 16]
+# Nanoseconds are the most precision a fraction can have
+_MAX_FRACTION_DIGITS = 9
+
+
+def parse_timestamps_ns(timestamps: typing.Sequence[typing.Optional[str]]) -> "array.array[int]":
+    """
+    Parses ISO-8601 timestamps into nanoseconds since the epoch, in UTC, as an `array('q')`.
+
+    Timestamps with a UTC offset are converted to UTC, and those without one are read as if they were in UTC.
+    Missing and unparseable timestamps are `MISSING_TIMESTAMP`.
+
+    With NumPy installed, the whole series is parsed in one vectorized pass over its characters, and only the
+    timestamps it does not recognize are parsed one at a time.
+    """
+    if numpy is not None and timestamps:
+        return array.array("q", _parse_vectorized(timestamps).tobytes())
+    return array.array("q", [_parse_one(timestamp) for timestamp in timestamps])
+
+
+def _parse_one(timestamp: typing.Any) -> int:
+    if not isinstance(timestamp, str):
+        return MISSING_TIMESTAMP
+    try:
+        value = dt.datetime.fromisoformat(timestamp)
+    except ValueError:
+        # Older Pythons' fromisoformat only reads the timestamps it writes
+        try:
+            value = parse_datetime(timestamp)
+        except (TypeError, ValueError):
+            return MISSING_TIMESTAMP
+    delta = value.replace(tzinfo=None) - _EPOCH - (value.utcoffset() or _ZERO)
+    ns = (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+    return ns if MISSING_TIMESTAMP < ns < -MISSING_TIMESTAMP else MISSING_TIMESTAMP
+
+
+def _parse_vectorized(timestamps: typing.Sequence[typing.Optional[str]]) -> typing.Any:
+    count = len(timestamps)
+    strings = numpy.array([timestamp if isinstance(timestamp, str) else "" for timestamp in timestamps], dtype=str)
+    width = max(strings.dtype.itemsize // 4, 1)
+    # The code points of the timestamps, one row per character position so that each position is contiguous,
+    # padded so that reads past the end of a timestamp stay in bounds
+    chars = numpy.zeros((max(width, 19) + 16, count), dtype=numpy.int32)
+    chars[:width] = strings.view(numpy.int32).reshape(count, width).T
+    lengths = (chars != 0).sum(axis=0)
+    digits = chars - ord("0")
+    rows = numpy.arange(count)
+
+    def is_digit(values: typing.Any) -> typing.Any:
+        return (values >= 0) & (values <= 9)
+
+    def number(*positions: int) -> typing.Any:
+        value = numpy.zeros(count, dtype=numpy.int64)
+        for position in positions:
+            value = value * 10 + digits[position]
+        return value
+
+    valid = lengths >= 19
+    valid &= is_digit(digits[_DIGITS]).all(axis=0)
+    valid &= (chars[_DASHES] == ord("-")).all(axis=0) & (chars[_COLONS] == ord(":")).all(axis=0)
+    valid &= (chars[10] == ord("T")) | (chars[10] == ord(" "))
+
+    year, month, day = number(0, 1, 2, 3), number(5, 6), number(8, 9)
+    hour, minute, second = number(11, 12), number(14, 15), number(17, 18)
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = numpy.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[numpy.clip(month - 1, 0, 11)]
+    month_days += (month == 2) & is_leap
+    # Nanoseconds since the epoch only fit in 64 bits between 1677 and 2262
+    valid &= (year > 1677) & (year < 2262) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= month_days)
+    valid &= (hour <= 23) & (minute <= 59) & (second <= 59)
+
+    has_fraction = (chars[19] == ord(".")) | (chars[19] == ord(","))
+    fraction = numpy.zeros(count, dtype=numpy.int64)
+    fraction_digits = numpy.zeros(count, dtype=numpy.int64)
+    running = has_fraction.copy()
+    for position in range(20, 20 + _MAX_FRACTION_DIGITS):
+        running &= is_digit(digits[position])
+        fraction = numpy.where(running, fraction * 10 + digits[position], fraction)
+        fraction_digits += running
+    valid &= ~has_fraction | (fraction_digits > 0)
+    fraction *= (10 ** numpy.arange(_MAX_FRACTION_DIGITS, -1, -1))[fraction_digits]
+
+    # The UTC offset, if any, follows the seconds or the fraction
+    start = 19 + numpy.where(has_fraction, 1 + fraction_digits, 0)
+    sign_char = chars[start, rows]
+    sign = numpy.where(sign_char == ord("+"), 1, numpy.where(sign_char == ord("-"), -1, 0))
+    has_colon = chars[start + 3, rows] == ord(":")
+    offset_hour = digits[start + 1, rows] * 10 + digits[start + 2, rows]
+    offset_minute = digits[start + 3 + has_colon, rows] * 10 + digits[start + 4 + has_colon, rows]
+    has_offset = (sign != 0) & (lengths == start + 5 + has_colon)
+    has_offset &= is_digit(digits[start + 1, rows]) & is_digit(digits[start + 2, rows])
+    has_offset &= is_digit(digits[start + 3 + has_colon, rows]) & is_digit(digits[start + 4 + has_colon, rows])
+    has_offset &= (offset_hour <= 23) & (offset_minute <= 59)
+    is_utc = (sign_char == ord("Z")) & (lengths == start + 1)
+    valid &= (lengths == start) | is_utc | has_offset
+    offset = numpy.where(has_offset, sign * (offset_hour * 3600 + offset_minute * 60), 0)
+
+    # Days since the epoch of the proleptic Gregorian date, per Howard Hinnant's days_from_civil
+    shifted_year = year - (month <= 2)
+    era = shifted_year // 400
+    year_of_era = shifted_year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = era * 146097 + day_of_era - 719468
+
+    seconds = days * 86400 + hour * 3600 + minute * 60 + second - offset
+    with numpy.errstate(over="ignore"):
+        result = numpy.where(valid, seconds * 1_000_000_000 + fraction, MISSING_TIMESTAMP)
+
+    # Timestamps in other layouts, e.g. without seconds, are parsed one at a time
+    for index in numpy.flatnonzero(~valid & (lengths > 0)):
+        result[index] = _parse_one(timestamps[int(index)])
+    return result
@@ -0,0 +1,56 @@
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class TTLCache(typing.Generic[K, V]):
+    """
+    A thread-safe, in-memory LRU whose entries expire `ttl` seconds after they were set, or with `sliding=True`
+    after they were last read or set.
+    """
+
+    def __init__(self, *, ttl: float, maxsize: int = 1024, sliding: bool = False) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.sliding = sliding
+        self._entries: "OrderedDict[K, typing.Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> typing.Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            if self.sliding:
+                self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: typing.Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
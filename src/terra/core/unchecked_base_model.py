@@ -1,5 +1,7 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import contextlib
+import contextvars
 import datetime as dt
 import inspect
 import typing
@@ -33,9 +35,76 @@ class UnionMetadata:
 Model = typing.TypeVar("Model", bound=pydantic.BaseModel)
 
 
+# Set while decoding lazily, see `lazy_decoding`
+_LAZY_DECODING: contextvars.ContextVar[bool] = contextvars.ContextVar("terra_lazy_decoding", default=False)
+
+_Decoder = typing.Callable[[typing.Any], typing.Any]
+
+# The values of a lazily constructed model's fields that have yet to be decoded, with their decoder
+_PendingFields = typing.Dict[str, typing.Tuple[_Decoder, typing.Any]]
+
+
+@contextlib.contextmanager
+def lazy_decoding() -> typing.Iterator[None]:
+    """
+    Models constructed within this context keep the JSON objects and arrays of their fields as is, and only decode
+    a field, as lazily, when it is first accessed. Serializing, comparing, copying or pickling a model decodes it
+    in full.
+    """
+    token = _LAZY_DECODING.set(True)
+    try:
+        yield
+    finally:
+        _LAZY_DECODING.reset(token)
+
+
 class UncheckedBaseModel(UniversalBaseModel):
     if IS_PYDANTIC_V2:
+        __slots__ = ("_terra_pending", "_terra_cache")
+
         model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="allow")  # type: ignore # Pydantic v2
+
+        def __getattr__(self, name: str) -> typing.Any:
+            pending = _get_pending_fields(self)
+            if pending is not None and name in pending:
+                return _decode_pending_field(self, pending, name)
+            return super().__getattr__(name)  # type: ignore[misc]
+
+        def __eq__(self, other: typing.Any) -> bool:
+            _decode_pending_fields(self)
+            if isinstance(other, UncheckedBaseModel):
+                _decode_pending_fields(other)
+            return super().__eq__(other)
+
+        def __repr_args__(self) -> typing.Any:
+            _decode_pending_fields(self)
+            return super().__repr_args__()
+
+        def __iter__(self) -> typing.Any:
+            _decode_pending_fields(self)
+            return super().__iter__()
+
+        def __copy__(self: "Model") -> "Model":
+            _decode_pending_fields(self)
+            return super().__copy__()  # type: ignore[misc]
+
+        def __deepcopy__(self: "Model", memo: typing.Optional[typing.Dict[int, typing.Any]] = None) -> "Model":
+            _decode_pending_fields(self)
+            return super().__deepcopy__(memo)  # type: ignore[misc]
+
+        def __getstate__(self) -> typing.Dict[typing.Any, typing.Any]:
+            _decode_pending_fields(self)
+            return super().__getstate__()
+
+        @pydantic.model_serializer(mode="wrap")
+        def serialize_model(self, handler: typing.Any, info: typing.Any) -> typing.Any:  # type: ignore[override]
+            # pydantic-core serializes the fields in `__dict__` directly, wherever the model is nested, so the
+            # pending ones are decoded first. The models they decode into are decoded as they are serialized in turn
+            _decode_pending_fields(self)
+            if info.mode_is_json():
+                return UniversalBaseModel.serialize_model(self)
+            return handler(self)
+
     else:
 
         class Config:
@@ -64,33 +133,28 @@ class UncheckedBaseModel(UniversalBaseModel):
         if _fields_set is None:
             _fields_set = set(values.keys())
 
-        fields = _get_model_fields(cls)
-        populate_by_name = _get_is_populate_by_name(cls)
-        field_aliases = get_field_to_alias_mapping(cls)
+        plan = _get_model_plan(cls)
+        pending: typing.Optional[_PendingFields] = {} if IS_PYDANTIC_V2 and _LAZY_DECODING.get() else None
 
-        for name, field in fields.items():
+        for field_plan in plan.fields:
+            name = field_plan.name
             # Key here is only used to pull data from the values dict
             # you should always use the NAME of the field to for field_values, etc.
             # because that's how the object is constructed from a pydantic perspective
-            key = field.alias
-            if (key is None or field.alias == name) and name in field_aliases:
-                key = field_aliases[name]
-
-            if key is None or (key not in values and populate_by_name):  # Added this to allow population by field name
+            key = field_plan.key
+            if key not in values and field_plan.populate_by_name:  # Added this to allow population by field name
                 key = name
 
             if key in values:
-                if IS_PYDANTIC_V2:
-                    type_ = field.annotation  # type: ignore # Pydantic v2
+                value = values[key]
+                decoder = field_plan.decoder
+                if pending is not None and decoder is not None and type(value) in _LAZY_TYPES:
+                    pending[name] = (decoder, value)
                 else:
-                    type_ = typing.cast(typing.Type, field.outer_type_)  # type: ignore # Pydantic < v1.10.15
-
-                fields_values[name] = (
-                    construct_type(object_=values[key], type_=type_) if type_ is not None else values[key]
-                )
+                    fields_values[name] = decoder(value) if decoder is not None and value is not None else value
                 _fields_set.add(name)
             else:
-                default = _get_field_default(field)
+                default = field_plan.get_default()
                 fields_values[name] = default
 
                 # If the default values are non-null act like they've been set
@@ -101,11 +165,10 @@ class UncheckedBaseModel(UniversalBaseModel):
 
         # Add extras back in
         extras = {}
-        pydantic_alias_fields = [field.alias for field in fields.values()]
-        internal_alias_fields = list(field_aliases.values())
+        known_keys = plan.known_keys
         for key, value in values.items():
             # If the key is not a field by name, nor an alias to a field, then it's extra
-            if (key not in pydantic_alias_fields and key not in internal_alias_fields) and key not in fields:
+            if key not in known_keys:
                 if IS_PYDANTIC_V2:
                     extras[key] = value
                 else:
@@ -118,12 +181,298 @@ class UncheckedBaseModel(UniversalBaseModel):
             object.__setattr__(m, "__pydantic_private__", None)
             object.__setattr__(m, "__pydantic_extra__", extras)
             object.__setattr__(m, "__pydantic_fields_set__", _fields_set)
+            if pending is not None:
+                object.__setattr__(m, "_terra_pending", pending)
         else:
             object.__setattr__(m, "__fields_set__", _fields_set)
             m._init_private_attributes()  # type: ignore # Pydantic v1
         return m
 
 
+# The JSON values whose decoding is deferred by lazy decoding, scalars are cheap enough to decode eagerly
+_LAZY_TYPES = (dict, list)
+
+
+def _get_pending_fields(model: pydantic.BaseModel) -> typing.Optional[_PendingFields]:
+    try:
+        return typing.cast(_PendingFields, object.__getattribute__(model, "_terra_pending"))
+    except AttributeError:
+        # Eagerly constructed
+        return None
+
+
+def _get_model_cache(model: typing.Any) -> typing.Optional[typing.Dict[typing.Any, typing.Any]]:
+    # Values derived from a model, kept for as long as the model is. Copies of the model start without them
+    if not (IS_PYDANTIC_V2 and isinstance(model, UncheckedBaseModel)):
+        return None
+    try:
+        return typing.cast(typing.Dict[typing.Any, typing.Any], object.__getattribute__(model, "_terra_cache"))
+    except AttributeError:
+        cache: typing.Dict[typing.Any, typing.Any] = {}
+        object.__setattr__(model, "_terra_cache", cache)
+        return cache
+
+
+def _decode_pending_field(model: pydantic.BaseModel, pending: _PendingFields, name: str) -> typing.Any:
+    entry = pending.get(name)
+    if entry is None:
+        # Decoded concurrently by another thread
+        return model.__dict__[name]
+    decoder, value = entry
+    with lazy_decoding():
+        decoded = model.__dict__.setdefault(name, decoder(value))
+    pending.pop(name, None)
+    if not pending:
+        # Restore the declaration order of the fields, which serialization follows
+        fields = _get_model_fields(type(model))
+        ordered = {key: model.__dict__[key] for key in fields if key in model.__dict__}
+        ordered.update(model.__dict__)
+        object.__setattr__(model, "__dict__", ordered)
+    return decoded
+
+
+def _decode_pending_fields(model: pydantic.BaseModel) -> None:
+    pending = _get_pending_fields(model)
+    if pending:
+        for name in list(pending):
+            _decode_pending_field(model, pending, name)
+
+
+# Decoders and model plans are compiled once per type and reused for every subsequent decode, so that
+# the typing introspection (get_origin / get_args / get_type_hints / issubclass) is only paid the first
+# time a type is seen rather than once per object.
+_DECODERS: typing.Dict[typing.Any, _Decoder] = {}
+
+_IMMUTABLE_DEFAULT_TYPES = (type(None), str, int, float, bool, bytes, tuple, frozenset)
+
+
+class _FieldPlan:
+    __slots__ = ("name", "key", "populate_by_name", "decoder", "get_default")
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        key: str,
+        populate_by_name: bool,
+        decoder: typing.Optional[_Decoder],
+        get_default: typing.Callable[[], typing.Any],
+    ) -> None:
+        self.name = name
+        self.key = key
+        self.populate_by_name = populate_by_name
+        self.decoder = decoder
+        self.get_default = get_default
+
+
+class _ModelPlan:
+    __slots__ = ("fields", "known_keys")
+
+    def __init__(self, *, fields: typing.List[_FieldPlan], known_keys: typing.FrozenSet[str]) -> None:
+        self.fields = fields
+        self.known_keys = known_keys
+
+
+_MODEL_PLANS: typing.Dict[typing.Type[typing.Any], _ModelPlan] = {}
+
+
+def _get_model_plan(model: typing.Type["Model"]) -> _ModelPlan:
+    plan = _MODEL_PLANS.get(model)
+    if plan is None:
+        plan = _compile_model_plan(model)
+        _MODEL_PLANS[model] = plan
+    return plan
+
+
+def _compile_model_plan(model: typing.Type["Model"]) -> _ModelPlan:
+    fields = _get_model_fields(model)
+    populate_by_name = _get_is_populate_by_name(model)
+    field_aliases = get_field_to_alias_mapping(model)
+
+    field_plans = []
+    for name, field in fields.items():
+        key = _get_field_key(name, field, field_aliases)
+
+        field_plans.append(
+            _FieldPlan(
+                name=name,
+                key=key if key is not None else name,
+                populate_by_name=populate_by_name and key is not None,
+                decoder=_get_decoder(_get_field_type(field)) if _get_field_type(field) is not None else None,
+                get_default=_compile_field_default(field),
+            )
+        )
+
+    return _ModelPlan(fields=field_plans, known_keys=_get_known_keys(fields, field_aliases))
+
+
+def _get_field_key(name: str, field: "PydanticField", field_aliases: typing.Dict[str, str]) -> typing.Optional[str]:
+    key = field.alias
+    if (key is None or field.alias == name) and name in field_aliases:
+        key = field_aliases[name]
+    return key
+
+
+def _get_field_type(field: "PydanticField") -> typing.Any:
+    if IS_PYDANTIC_V2:
+        return field.annotation  # type: ignore # Pydantic v2
+    return typing.cast(typing.Type, field.outer_type_)  # type: ignore # Pydantic < v1.10.15
+
+
+def _get_known_keys(
+    fields: typing.Mapping[str, "PydanticField"], field_aliases: typing.Dict[str, str]
+) -> typing.FrozenSet[str]:
+    known_keys = set(fields.keys())
+    known_keys.update(field.alias for field in fields.values() if field.alias is not None)
+    known_keys.update(field_aliases.values())
+    return frozenset(known_keys)
+
+
+def _compile_field_default(field: "PydanticField") -> typing.Callable[[], typing.Any]:
+    # Factories and mutable defaults must still be produced per instance, everything else can be shared
+    if getattr(field, "default_factory", None) is None:
+        default = _get_field_default(field)
+        if isinstance(default, _IMMUTABLE_DEFAULT_TYPES):
+            return lambda: default
+    return lambda: _get_field_default(field)
+
+
+def _get_decoder(type_: typing.Any) -> _Decoder:
+    """
+    Returns the compiled decoder for `type_`, compiling and caching it on first use. Decoders are never
+    called with `None`, callers are expected to short circuit optional values themselves.
+    """
+    try:
+        decoder = _DECODERS.get(type_)
+    except TypeError:
+        # Unhashable type arguments (e.g. a Literal of lists), these cannot be cached
+        return _compile_decoder(type_)
+    if decoder is None:
+        decoder = _compile_decoder(type_)
+        _DECODERS[type_] = decoder
+    return decoder
+
+
+def _identity(object_: typing.Any) -> typing.Any:
+    return object_
+
+
+def _compile_decoder(type_: typing.Any) -> _Decoder:
+    base_type = get_origin(type_) or type_
+    is_annotated = base_type == typing_extensions.Annotated  # type: ignore[comparison-overlap]
+    maybe_annotation_members = get_args(type_)
+    is_annotated_union = is_annotated and is_union(get_origin(maybe_annotation_members[0]))
+
+    if base_type == typing.Any:  # type: ignore[comparison-overlap]
+        return _identity
+
+    if base_type == dict:
+        if len(maybe_annotation_members) != 2:
+            return _identity
+        key_decoder = _get_decoder(maybe_annotation_members[0])
+        items_decoder = _get_decoder(maybe_annotation_members[1])
+
+        def decode_dict(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, typing.Mapping):
+                return object_
+            return {
+                (key_decoder(key) if key is not None else None): (items_decoder(item) if item is not None else None)
+                for key, item in object_.items()
+            }
+
+        return decode_dict
+
+    if base_type == list:
+        if len(maybe_annotation_members) != 1:
+            return _identity
+        list_decoder = _get_decoder(maybe_annotation_members[0])
+
+        def decode_list(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, list):
+                return object_
+            return [list_decoder(entry) if entry is not None else None for entry in object_]
+
+        return decode_list
+
+    if base_type == set:
+        if len(maybe_annotation_members) != 1:
+            return _identity
+        set_decoder = _get_decoder(maybe_annotation_members[0])
+
+        def decode_set(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, set) and not isinstance(object_, list):
+                return object_
+            return {set_decoder(entry) if entry is not None else None for entry in object_}
+
+        return decode_set
+
+    if is_union(base_type) or is_annotated_union:
+        return _compile_union_decoder(type_)
+
+    # Cannot do an `issubclass` with a literal type, let's also just confirm we have a class before this call
+    if not is_literal_type(type_):
+        model_type = None
+        if inspect.isclass(base_type) and issubclass(base_type, pydantic.BaseModel):
+            model_type = base_type
+        elif (
+            is_annotated
+            and inspect.isclass(maybe_annotation_members[0])
+            and issubclass(maybe_annotation_members[0], pydantic.BaseModel)
+        ):
+            model_type = maybe_annotation_members[0]
+        if model_type is not None:
+            # The model's own plan is compiled lazily on its first construct, which keeps self-referencing
+            # models from recursing here.
+            if IS_PYDANTIC_V2:
+                return lambda object_: model_type.model_construct(**object_)
+            return lambda object_: model_type.construct(**object_)
+
+    if base_type == dt.datetime:
+        return _make_safe_decoder(parse_datetime)
+
+    if base_type == dt.date:
+        return _make_safe_decoder(parse_date)
+
+    if base_type == uuid.UUID:
+        return _make_safe_decoder(uuid.UUID)
+
+    if base_type == int:
+        return _make_safe_decoder(int)
+
+    if base_type == float:
+        return _decode_float
+
+    if base_type == bool:
+        return _make_safe_decoder(_decode_bool)
+
+    return _identity
+
+
+def _make_safe_decoder(parse: _Decoder) -> _Decoder:
+    def decode(object_: typing.Any) -> typing.Any:
+        try:
+            return parse(object_)
+        except Exception:
+            return object_
+
+    return decode
+
+
+def _decode_float(object_: typing.Any) -> typing.Any:
+    # JSON numbers without a fractional part arrive as ints
+    if type(object_) is int:
+        return float(object_)
+    return object_
+
+
+def _decode_bool(object_: typing.Any) -> bool:
+    if isinstance(object_, str):
+        stringified_object = object_.lower()
+        return stringified_object == "true" or stringified_object == "1"
+
+    return bool(object_)
+
+
 def _validate_collection_items_compatible(collection: typing.Any, target_type: typing.Type[typing.Any]) -> bool:
     """
     Validate that all items in a collection are compatible with the target type.
@@ -150,60 +499,233 @@ def _validate_collection_items_compatible(collection: typing.Any, target_type: t
     return True
 
 
-def _convert_undiscriminated_union_type(union_type: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
+class _MemberSignature:
+    """
+    The top-level shape of a model member of a union, used to pick a member from the keys of a payload
+    without validating it.
+    """
+
+    __slots__ = ("model", "decoder", "required_keys", "known_keys", "tags")
+
+    def __init__(
+        self,
+        *,
+        model: typing.Type[typing.Any],
+        decoder: _Decoder,
+        required_keys: typing.FrozenSet[str],
+        known_keys: typing.FrozenSet[str],
+        tags: typing.Dict[str, typing.FrozenSet[typing.Any]],
+    ) -> None:
+        self.model = model
+        self.decoder = decoder
+        self.required_keys = required_keys
+        self.known_keys = known_keys
+        self.tags = tags
+
+    def accepts(self, object_: typing.Mapping[str, typing.Any]) -> bool:
+        if not self.required_keys.issubset(object_.keys()):
+            return False
+        for key, allowed in self.tags.items():
+            if key in object_:
+                try:
+                    if object_[key] not in allowed:
+                        return False
+                except TypeError:
+                    return False
+        return True
+
+
+def _compile_member_signature(model: typing.Type[typing.Any]) -> _MemberSignature:
+    fields = _get_model_fields(model)
+    field_aliases = get_field_to_alias_mapping(model)
+
+    required_keys = set()
+    tags = {}
+    for name, field in fields.items():
+        key = _get_field_key(name, field, field_aliases) or name
+        if _is_field_required(field):
+            required_keys.add(key)
+        type_ = _get_field_type(field)
+        if type_ is not None and is_literal_type(type_):
+            tags[key] = frozenset(get_args(type_))
+
+    return _MemberSignature(
+        model=model,
+        decoder=_get_decoder(model),
+        required_keys=frozenset(required_keys),
+        known_keys=_get_known_keys(fields, field_aliases),
+        tags=tags,
+    )
+
+
+def _select_union_members(
+    signatures: typing.List[_MemberSignature],
+    tag_index: typing.Dict[str, typing.Dict[typing.Any, typing.List[_MemberSignature]]],
+    object_: typing.Mapping[str, typing.Any],
+) -> typing.List[_MemberSignature]:
+    """
+    Narrows the members of a union down to the ones that could have produced `object_`. A `Literal` tag
+    present in the payload picks its members straight from the index, otherwise members are matched on
+    their required keys and ranked by how many of the payload's keys they do not know about.
+    """
+    candidates = signatures
+    for key, members_by_value in tag_index.items():
+        if key in object_:
+            try:
+                tagged = members_by_value.get(object_[key])
+            except TypeError:
+                tagged = None
+            if tagged:
+                candidates = tagged
+                break
+
+    best: typing.List[_MemberSignature] = []
+    best_unknown = -1
+    for signature in candidates:
+        if not signature.accepts(object_):
+            continue
+        unknown = len(object_.keys() - signature.known_keys)
+        if best_unknown == -1 or unknown < best_unknown:
+            best = [signature]
+            best_unknown = unknown
+        elif unknown == best_unknown:
+            best.append(signature)
+    return best
+
+
+def _compile_undiscriminated_union_decoder(union_type: typing.Type[typing.Any]) -> _Decoder:
     inner_types = get_args(union_type)
     if typing.Any in inner_types:
-        return object_
+        return _identity
 
+    # Members we attempt a validated parse against, in declaration order
+    validated_members: typing.List[typing.Tuple[bool, typing.Type[typing.Any]]] = []
+    model_members: typing.List[typing.Type[typing.Any]] = []
     for inner_type in inner_types:
         # Handle lists of objects that need parsing
-        if get_origin(inner_type) is list and isinstance(object_, list):
+        if get_origin(inner_type) is list:
             list_inner_type = get_args(inner_type)[0]
-            try:
-                if inspect.isclass(list_inner_type) and issubclass(list_inner_type, pydantic.BaseModel):
+            if inspect.isclass(list_inner_type) and issubclass(list_inner_type, pydantic.BaseModel):
+                validated_members.append((True, list_inner_type))
+        if inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel):
+            validated_members.append((False, inner_type))
+            model_members.append(inner_type)
+    fallback_decoders = [_get_decoder(inner_type) for inner_type in inner_types]
+
+    # Member signatures are compiled on first use, the members may still be mid-way through their own
+    # plan compilation when the union is first seen.
+    dispatch: typing.List[typing.Any] = []
+
+    def get_dispatch() -> typing.Tuple[
+        typing.List[_MemberSignature], typing.Dict[str, typing.Dict[typing.Any, typing.List[_MemberSignature]]]
+    ]:
+        if not dispatch:
+            signatures = [_compile_member_signature(model) for model in model_members]
+            tag_index: typing.Dict[str, typing.Dict[typing.Any, typing.List[_MemberSignature]]] = {}
+            for signature in signatures:
+                for key, allowed in signature.tags.items():
+                    for value in allowed:
+                        try:
+                            tag_index.setdefault(key, {}).setdefault(value, []).append(signature)
+                        except TypeError:
+                            continue
+            dispatch.extend((signatures, tag_index))
+        return dispatch[0], dispatch[1]
+
+    def trial_validate(
+        members: typing.List[typing.Tuple[bool, typing.Type[typing.Any]]], object_: typing.Any
+    ) -> typing.Any:
+        for is_list, member_type in members:
+            if is_list:
+                if not isinstance(object_, list):
+                    continue
+                try:
                     # Validate that all items in the list are compatible with the target type
-                    if _validate_collection_items_compatible(object_, list_inner_type):
-                        parsed_list = [parse_obj_as(object_=item, type_=list_inner_type) for item in object_]
-                        return parsed_list
-            except Exception:
-                pass
+                    if _validate_collection_items_compatible(object_, member_type):
+                        return [parse_obj_as(object_=item, type_=member_type) for item in object_]
+                except Exception:
+                    pass
+                continue
 
-        try:
-            if inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel):
+            try:
                 # Attempt a validated parse until one works
-                return parse_obj_as(inner_type, object_)
-        except Exception:
-            continue
-
-    # If none of the types work, just return the first successful cast
-    for inner_type in inner_types:
-        try:
-            return construct_type(object_=object_, type_=inner_type)
-        except Exception:
-            continue
+                return parse_obj_as(member_type, object_)
+            except Exception:
+                continue
 
+        # If none of the types work, just return the first successful cast
+        for decoder in fallback_decoders:
+            try:
+                return decoder(object_)
+            except Exception:
+                continue
+        return None
 
-def _convert_union_type(type_: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
+    # Members that accept a mapping or a list payload respectively. When only one member can take the shape
+    # of the payload (e.g. `Optional[Model]` or `Optional[List[Model]]`) there is nothing to choose between.
+    dict_members = [inner_type for inner_type in inner_types if get_origin(inner_type) is dict]
+    sequence_members = [inner_type for inner_type in inner_types if get_origin(inner_type) in (list, set)]
+    mapping_decoder = _get_decoder(model_members[0]) if len(model_members) == 1 and not dict_members else None
+    sequence_decoder = _get_decoder(sequence_members[0]) if len(sequence_members) == 1 else None
+
+    def decode_undiscriminated_union(object_: typing.Any) -> typing.Any:
+        if isinstance(object_, typing.Mapping):
+            if mapping_decoder is not None:
+                return mapping_decoder(object_)
+            if len(model_members) > 1:
+                signatures, tag_index = get_dispatch()
+                candidates = _select_union_members(signatures, tag_index, object_)
+                if len(candidates) == 1:
+                    return candidates[0].decoder(object_)
+                if candidates:
+                    # Ambiguous, only validate against the members that could match
+                    return trial_validate([(False, candidate.model) for candidate in candidates], object_)
+        elif isinstance(object_, list) and sequence_decoder is not None:
+            return sequence_decoder(object_)
+        return trial_validate(validated_members, object_)
+
+    return decode_undiscriminated_union
+
+
+def _compile_union_decoder(type_: typing.Type[typing.Any]) -> _Decoder:
     base_type = get_origin(type_) or type_
     union_type = type_
+    discriminated_members: typing.List[typing.Tuple[str, typing.List[typing.Tuple[typing.Any, _Decoder]]]] = []
     if base_type == typing_extensions.Annotated:  # type: ignore[comparison-overlap]
         union_type = get_args(type_)[0]
         annotated_metadata = get_args(type_)[1:]
         for metadata in annotated_metadata:
             if isinstance(metadata, UnionMetadata):
+                members = []
+                for inner_type in get_args(union_type):
+                    try:
+                        members.append((inner_type.__fields__[metadata.discriminant].default, _get_decoder(inner_type)))
+                    except Exception:
+                        # Members without the discriminant are only reachable through regular union handling
+                        break
+                discriminated_members.append((metadata.discriminant, members))
+    undiscriminated_decoder = _compile_undiscriminated_union_decoder(union_type)
+
+    if not discriminated_members:
+        return undiscriminated_decoder
+
+    def decode_union(object_: typing.Any) -> typing.Any:
+        for discriminant, members in discriminated_members:
+            try:
+                # Cast to the correct type, based on the discriminant
                 try:
-                    # Cast to the correct type, based on the discriminant
-                    for inner_type in get_args(union_type):
-                        try:
-                            objects_discriminant = getattr(object_, metadata.discriminant)
-                        except:
-                            objects_discriminant = object_[metadata.discriminant]
-                        if inner_type.__fields__[metadata.discriminant].default == objects_discriminant:
-                            return construct_type(object_=object_, type_=inner_type)
-                except Exception:
-                    # Allow to fall through to our regular union handling
-                    pass
-    return _convert_undiscriminated_union_type(union_type, object_)
+                    objects_discriminant = getattr(object_, discriminant)
+                except:
+                    objects_discriminant = object_[discriminant]
+                for default, decoder in members:
+                    if default == objects_discriminant:
+                        return decoder(object_)
+            except Exception:
+                # Allow to fall through to our regular union handling
+                pass
+        return undiscriminated_decoder(object_)
+
+    return decode_union
 
 
 def construct_type(*, type_: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
@@ -216,95 +738,7 @@ def construct_type(*, type_: typing.Type[typing.Any], object_: typing.Any) -> ty
     if object_ is None:
         return None
 
-    base_type = get_origin(type_) or type_
-    is_annotated = base_type == typing_extensions.Annotated  # type: ignore[comparison-overlap]
-    maybe_annotation_members = get_args(type_)
-    is_annotated_union = is_annotated and is_union(get_origin(maybe_annotation_members[0]))
-
-    if base_type == typing.Any:  # type: ignore[comparison-overlap]
-        return object_
-
-    if base_type == dict:
-        if not isinstance(object_, typing.Mapping):
-            return object_
-
-        key_type, items_type = get_args(type_)
-        d = {
-            construct_type(object_=key, type_=key_type): construct_type(object_=item, type_=items_type)
-            for key, item in object_.items()
-        }
-        return d
-
-    if base_type == list:
-        if not isinstance(object_, list):
-            return object_
-
-        inner_type = get_args(type_)[0]
-        return [construct_type(object_=entry, type_=inner_type) for entry in object_]
-
-    if base_type == set:
-        if not isinstance(object_, set) and not isinstance(object_, list):
-            return object_
-
-        inner_type = get_args(type_)[0]
-        return {construct_type(object_=entry, type_=inner_type) for entry in object_}
-
-    if is_union(base_type) or is_annotated_union:
-        return _convert_union_type(type_, object_)
-
-    # Cannot do an `issubclass` with a literal type, let's also just confirm we have a class before this call
-    if (
-        object_ is not None
-        and not is_literal_type(type_)
-        and (
-            (inspect.isclass(base_type) and issubclass(base_type, pydantic.BaseModel))
-            or (
-                is_annotated
-                and inspect.isclass(maybe_annotation_members[0])
-                and issubclass(maybe_annotation_members[0], pydantic.BaseModel)
-            )
-        )
-    ):
-        if IS_PYDANTIC_V2:
-            return type_.model_construct(**object_)
-        else:
-            return type_.construct(**object_)
-
-    if base_type == dt.datetime:
-        try:
-            return parse_datetime(object_)
-        except Exception:
-            return object_
-
-    if base_type == dt.date:
-        try:
-            return parse_date(object_)
-        except Exception:
-            return object_
-
-    if base_type == uuid.UUID:
-        try:
-            return uuid.UUID(object_)
-        except Exception:
-            return object_
-
-    if base_type == int:
-        try:
-            return int(object_)
-        except Exception:
-            return object_
-
-    if base_type == bool:
-        try:
-            if isinstance(object_, str):
-                stringified_object = object_.lower()
-                return stringified_object == "true" or stringified_object == "1"
-
-            return bool(object_)
-        except Exception:
-            return object_
-
-    return object_
+    return _get_decoder(type_)(object_)
 
 
 def _get_is_populate_by_name(model: typing.Type["Model"]) -> bool:
@@ -327,6 +761,12 @@ def _get_model_fields(
         return model.__fields__  # type: ignore # Pydantic v1
 
 
+def _is_field_required(field: PydanticField) -> bool:
+    if IS_PYDANTIC_V2:
+        return field.is_required()  # type: ignore # Pydantic v2
+    return bool(field.required)  # type: ignore # Pydantic v1
+
+
 def _get_field_default(field: PydanticField) -> typing.Any:
     try:
         value = field.get_default()  # type: ignore # Pydantic < v1.10.15
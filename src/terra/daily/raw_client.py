@@ -1,16 +1,22 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import contextlib
 import typing
 from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
 from ..core.unchecked_base_model import construct_type
 from ..errors.bad_request_error import BadRequestError
 from ..errors.not_found_error import NotFoundError
 from ..errors.unauthorized_error import UnauthorizedError
+from ..rate_limit_signals import record_processing_response
+from ..stream_fetch import async_stream_fetch, stream_fetch
+from ..types.daily import Daily
 from ..types.daily_fetch_request_end_date import DailyFetchRequestEndDate
 from .types.daily_fetch_request_start_date import DailyFetchRequestStartDate
 from .types.daily_fetch_response import DailyFetchResponse
@@ -72,13 +78,8 @@ class RawDailyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    DailyFetchResponse,
-                    construct_type(
-                        type_=DailyFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, DailyFetchResponse, model_backend=self._client_wrapper.model_backend)
+                record_processing_response(_response, _data)
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -87,7 +88,7 @@ class RawDailyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -98,7 +99,7 @@ class RawDailyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -109,15 +110,67 @@ class RawDailyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.contextmanager
+    def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: DailyFetchRequestStartDate,
+        end_date: typing.Optional[DailyFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[HttpResponse[typing.Iterator[Daily]]]:
+        """
+        Fetches daily summaries of activity metrics such as steps, distance, calories burned etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : DailyFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[DailyFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.Iterator[HttpResponse[typing.Iterator[Daily]]]
+            The response, whose data iterates over the records
+        """
+        with stream_fetch(
+            self._client_wrapper,
+            "daily",
+            record_type=Daily,
+            response_type=DailyFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
 
 class AsyncRawDailyClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -175,13 +228,8 @@ class AsyncRawDailyClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    DailyFetchResponse,
-                    construct_type(
-                        type_=DailyFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
-                )
+                _data = decode_response(_response, DailyFetchResponse, model_backend=self._client_wrapper.model_backend)
+                record_processing_response(_response, _data)
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -190,7 +238,7 @@ class AsyncRawDailyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -201,7 +249,7 @@ class AsyncRawDailyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -212,11 +260,63 @@ class AsyncRawDailyClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
+
+    @contextlib.asynccontextmanager
+    async def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: DailyFetchRequestStartDate,
+        end_date: typing.Optional[DailyFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Daily]]]:
+        """
+        Fetches daily summaries of activity metrics such as steps, distance, calories burned etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : DailyFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[DailyFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Daily]]]
+            The response, whose data iterates over the records
+        """
+        async with async_stream_fetch(
+            self._client_wrapper,
+            "daily",
+            record_type=Daily,
+            response_type=DailyFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
@@ -0,0 +1,315 @@
+import datetime as dt
+import typing
+
+import pydantic
+from .core.json_codec import dump_json
+from .core.jsonable_encoder import jsonable_encoder
+from .core.model_fields import get_model_fields, get_raw_field_value, get_record_type
+from .core.pydantic_utilities import get_args, get_origin, is_literal_type, is_union
+from .core.timestamps import MISSING_TIMESTAMP
+from .core.unchecked_base_model import construct_type
+from .samples import flatten_samples
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None  # type: ignore
+
+PYARROW_REQUIRED = "Exporting to Arrow requires pyarrow, install terra-python[pyarrow]"
+
+if pyarrow is not None:
+    SAMPLES_SCHEMA = pyarrow.schema(
+        [
+            pyarrow.field("user_id", pyarrow.string()),
+            pyarrow.field("record_id", pyarrow.string()),
+            pyarrow.field("series", pyarrow.string()),
+            pyarrow.field("timestamp", pyarrow.string()),
+            pyarrow.field("timestamp_ns", pyarrow.timestamp("ns", tz="UTC")),
+            pyarrow.field("value", pyarrow.float64()),
+        ]
+    )
+
+
+def get_arrow_schema(record_type: typing.Type[pydantic.BaseModel]) -> "pyarrow.Schema":
+    """
+    Returns the Arrow schema of `record_type`, e.g. `Activity`, with a column per field named after its JSON key.
+
+    Nested models are struct columns and lists are list columns. Values the schema cannot type, i.e. `Any`
+    fields, unions of models and recursive references, are JSON-encoded into string columns.
+    """
+    return _get_record_converter(record_type).schema
+
+
+def to_arrow(
+    records: typing.Iterable[typing.Any], record_type: typing.Optional[typing.Type[pydantic.BaseModel]] = None
+) -> "pyarrow.Table":
+    """
+    Converts records into an Arrow table with the schema of `get_arrow_schema`.
+
+    The records can be decoded models, e.g. the `data` of an activity fetch response, or their raw JSON objects, in
+    which case `record_type` is required. The table is built column by column from the records, without
+    converting each record to a dict first.
+
+    Examples
+    --------
+    from terra.export import to_arrow
+
+    response = client.activity.fetch(user_id="user_id", start_date=1704067200)
+    table = to_arrow(response.data)
+    """
+    if pyarrow is None:
+        raise ImportError(PYARROW_REQUIRED)
+    records = list(records)
+    converter = _get_record_converter(get_record_type(records[0] if records else None, record_type))
+    return pyarrow.Table.from_batches([converter.record_batch(records)], schema=converter.schema)
+
+
+def flatten_samples_to_arrow(
+    records: typing.Iterable[typing.Any],
+    record_type: typing.Optional[typing.Type[pydantic.BaseModel]] = None,
+    **kwargs: typing.Any,
+) -> typing.Iterator["pyarrow.RecordBatch"]:
+    """
+    The Arrow equivalent of `terra.samples.flatten_samples`, which yields each chunk as a record batch with the
+    schema `SAMPLES_SCHEMA`. Missing timestamps are null.
+    """
+    if pyarrow is None:
+        raise ImportError(PYARROW_REQUIRED)
+    for chunk in flatten_samples(records, record_type, **kwargs):
+        size = len(chunk["value"])
+        # The numeric columns are handed to Arrow without copying them
+        timestamps = pyarrow.Array.from_buffers(pyarrow.int64(), size, [None, pyarrow.py_buffer(chunk["timestamp_ns"])])
+        timestamps = pyarrow.compute.if_else(pyarrow.compute.equal(timestamps, MISSING_TIMESTAMP), None, timestamps)
+        yield pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array(chunk["user_id"], type=pyarrow.string()),
+                pyarrow.array(chunk["record_id"], type=pyarrow.string()),
+                pyarrow.array(chunk["series"], type=pyarrow.string()),
+                pyarrow.array(chunk["timestamp"], type=pyarrow.string()),
+                timestamps.cast(SAMPLES_SCHEMA.field("timestamp_ns").type),
+                pyarrow.Array.from_buffers(pyarrow.float64(), size, [None, pyarrow.py_buffer(chunk["value"])]),
+            ],
+            schema=SAMPLES_SCHEMA,
+        )
+
+
+class ParquetWriter:
+    """
+    Writes records to a Parquet file as they arrive, so that at most `batch_size` records are held in memory.
+    Each batch is a row group of the file.
+
+    Further keyword arguments, e.g. `compression`, are passed on to `pyarrow.parquet.ParquetWriter`.
+
+    Examples
+    --------
+    from terra.export import ParquetWriter
+    from terra.types import Activity
+
+    with ParquetWriter("activity.parquet", Activity) as writer:
+        for activity in client.activity.fetch_stream(user_id="user_id", start_date=1704067200):
+            writer.write(activity)
+    """
+
+    def __init__(
+        self,
+        where: typing.Any,
+        record_type: typing.Type[pydantic.BaseModel],
+        *,
+        batch_size: int = 10_000,
+        **options: typing.Any,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._converter = _get_record_converter(record_type)
+        self._writer = pyarrow.parquet.ParquetWriter(where, self._converter.schema, **options)
+        self._batch_size = batch_size
+        self._pending: typing.List[typing.Any] = []
+
+    @property
+    def schema(self) -> "pyarrow.Schema":
+        return self._converter.schema
+
+    def write(self, record: typing.Any) -> None:
+        self._pending.append(record)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def write_all(self, records: typing.Iterable[typing.Any]) -> None:
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """
+        Writes the records held in memory to the file.
+        """
+        if self._pending:
+            self._writer.write_batch(self._converter.record_batch(self._pending))
+            self._pending = []
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._writer.close()
+
+    def __enter__(self) -> "ParquetWriter":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+
+# Converters are compiled once per record type, as the Arrow types they produce
+_RECORD_CONVERTERS: typing.Dict[typing.Type[typing.Any], "_ModelConverter"] = {}
+
+
+def _get_record_converter(record_type: typing.Type[typing.Any]) -> "_ModelConverter":
+    if pyarrow is None:
+        raise ImportError(PYARROW_REQUIRED)
+    converter = _RECORD_CONVERTERS.get(record_type)
+    if converter is None:
+        converter = _ModelConverter(record_type, in_progress={record_type})
+        _RECORD_CONVERTERS[record_type] = converter
+    return converter
+
+
+class _ModelConverter:
+    """
+    Converts models, or their JSON objects, into struct arrays, or record batches for the top level records.
+    """
+
+    def __init__(self, model: typing.Type[typing.Any], *, in_progress: typing.Set[typing.Any]) -> None:
+        self.fields: typing.List[typing.Tuple[str, str, _Converter]] = [
+            (field.name, field.key, _compile_converter(field.type_, in_progress))
+            for field in get_model_fields(model).values()
+        ]
+        self.schema: "pyarrow.Schema" = pyarrow.schema(
+            [pyarrow.field(key, converter.type) for _, key, converter in self.fields]
+        )
+        self.type: "pyarrow.DataType" = pyarrow.struct(list(self.schema))
+
+    def record_batch(self, records: typing.List[typing.Any]) -> "pyarrow.RecordBatch":
+        return pyarrow.RecordBatch.from_arrays(self._convert_fields(records), schema=self.schema)
+
+    def convert(self, values: typing.List[typing.Any]) -> "pyarrow.Array":
+        if not self.fields:
+            return pyarrow.array([None if value is None else {} for value in values], type=self.type)
+        mask = pyarrow.array([not _is_model_value(value) for value in values], type=pyarrow.bool_())
+        return pyarrow.StructArray.from_arrays(self._convert_fields(values), fields=list(self.schema), mask=mask)
+
+    def _convert_fields(self, values: typing.List[typing.Any]) -> typing.List["pyarrow.Array"]:
+        return [
+            converter.convert([get_raw_field_value(value, name, key) for value in values])
+            for name, key, converter in self.fields
+        ]
+
+
+class _ListConverter:
+    def __init__(self, items: "_Converter") -> None:
+        self.items = items
+        self.type: "pyarrow.DataType" = pyarrow.list_(items.type)
+
+    def convert(self, values: typing.List[typing.Any]) -> "pyarrow.Array":
+        offsets = [0]
+        mask = []
+        items: typing.List[typing.Any] = []
+        for value in values:
+            is_list = isinstance(value, (list, tuple, set))
+            if is_list:
+                items.extend(value)
+            mask.append(not is_list)
+            offsets.append(len(items))
+        return pyarrow.ListArray.from_arrays(
+            pyarrow.array(offsets, type=pyarrow.int32()),
+            self.items.convert(items),
+            mask=pyarrow.array(mask, type=pyarrow.bool_()),
+        )
+
+
+class _ScalarConverter:
+    def __init__(self, type_: typing.Any, arrow_type: "pyarrow.DataType") -> None:
+        self.python_type = type_
+        self.type = arrow_type
+
+    def convert(self, values: typing.List[typing.Any]) -> "pyarrow.Array":
+        try:
+            return pyarrow.array(values, type=self.type)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            # Raw JSON values which are not of the field's type, e.g. numbers sent as strings, are decoded as the
+            # models decode them, and dropped if that fails too
+            return pyarrow.array([self._coerce(value) for value in values], type=self.type)
+
+    def _coerce(self, value: typing.Any) -> typing.Any:
+        decoded = construct_type(type_=self.python_type, object_=value)
+        return decoded if isinstance(decoded, self.python_type) else None
+
+
+class _TextConverter:
+    """
+    Stores values the schema cannot type as JSON. Enum fields keep their string values as they are.
+    """
+
+    def __init__(self, *, encode_strings: bool) -> None:
+        self.type: "pyarrow.DataType" = pyarrow.string()
+        self.encode_strings = encode_strings
+
+    def convert(self, values: typing.List[typing.Any]) -> "pyarrow.Array":
+        return pyarrow.array([self._encode(value) for value in values], type=self.type)
+
+    def _encode(self, value: typing.Any) -> typing.Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, str) and not self.encode_strings:
+            return value
+        return dump_json(jsonable_encoder(value)).decode()
+
+
+_Converter = typing.Union[_ModelConverter, _ListConverter, _ScalarConverter, _TextConverter]
+
+
+def _compile_converter(type_: typing.Any, in_progress: typing.Set[typing.Any]) -> _Converter:
+    origin = get_origin(type_)
+    if is_union(origin):
+        members = [member for member in get_args(type_) if member is not type(None)]
+        if len(members) == 1:
+            return _compile_converter(members[0], in_progress)
+        # Enums are unions of their string values and Any, to allow for values added to the API later
+        if all(is_literal_type(member) or member is typing.Any for member in members):
+            return _TextConverter(encode_strings=False)
+        return _TextConverter(encode_strings=True)
+    if origin in (list, set):
+        (items,) = get_args(type_) or (typing.Any,)
+        return _ListConverter(_compile_converter(items, in_progress))
+    if is_literal_type(type_):
+        return _TextConverter(encode_strings=False)
+    if isinstance(type_, type) and issubclass(type_, pydantic.BaseModel):
+        if type_ in in_progress:
+            return _TextConverter(encode_strings=True)
+        return _ModelConverter(type_, in_progress=in_progress | {type_})
+    arrow_type = _get_scalar_arrow_type(type_)
+    if arrow_type is None:
+        return _TextConverter(encode_strings=True)
+    return _ScalarConverter(type_, arrow_type)
+
+
+def _get_scalar_arrow_type(type_: typing.Any) -> typing.Optional["pyarrow.DataType"]:
+    # bool is checked before int, as it is a subclass of it
+    if type_ is bool:
+        return pyarrow.bool_()
+    if type_ is int:
+        return pyarrow.int64()
+    if type_ is float:
+        return pyarrow.float64()
+    if type_ is str:
+        return pyarrow.string()
+    if type_ is dt.datetime:
+        return pyarrow.timestamp("us", tz="UTC")
+    if type_ is dt.date:
+        return pyarrow.date32()
+    return None
+
+
+def _is_model_value(value: typing.Any) -> bool:
+    return value is not None and not isinstance(value, (str, int, float, bool, list, tuple))
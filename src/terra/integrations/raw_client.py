@@ -5,9 +5,10 @@ from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
-from ..core.unchecked_base_model import construct_type
 from ..types.integrations_response import IntegrationsResponse
 from .types.integrations_fetch_response import IntegrationsFetchResponse
 
@@ -39,15 +40,11 @@ class RawIntegrationsClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    IntegrationsFetchResponse,
-                    construct_type(
-                        type_=IntegrationsFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, IntegrationsFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -81,15 +78,11 @@ class RawIntegrationsClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    IntegrationsResponse,
-                    construct_type(
-                        type_=IntegrationsResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, IntegrationsResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -122,15 +115,11 @@ class AsyncRawIntegrationsClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    IntegrationsFetchResponse,
-                    construct_type(
-                        type_=IntegrationsFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, IntegrationsFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -164,15 +153,11 @@ class AsyncRawIntegrationsClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    IntegrationsResponse,
-                    construct_type(
-                        type_=IntegrationsResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, IntegrationsResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
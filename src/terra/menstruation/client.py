@@ -1,9 +1,12 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import datetime as dt
 import typing
 
+from ..chunked_fetch import async_chunked_fetch, chunked_fetch
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.request_options import RequestOptions
+from ..types.menstruation import Menstruation
 from ..types.menstruation_fetch_request_end_date import MenstruationFetchRequestEndDate
 from .raw_client import AsyncRawMenstruationClient, RawMenstruationClient
 from .types.menstruation_fetch_request_start_date import MenstruationFetchRequestStartDate
@@ -89,6 +92,124 @@ class MenstruationClient:
         )
         return _response.data
 
+    def fetch_chunked(
+        self,
+        *,
+        user_id: str,
+        start_date: MenstruationFetchRequestStartDate,
+        end_date: typing.Optional[MenstruationFetchRequestEndDate] = None,
+        window: dt.timedelta = dt.timedelta(days=7),
+        max_concurrency: int = 4,
+        to_webhook: typing.Optional[bool] = False,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> MenstruationFetchResponse:
+        """
+        Fetches menstruation data over a wide date range by splitting it into `window` sized fetches issued from a thread pool, and merging their data in chronological order. Records returned by more than one window are only kept once.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : MenstruationFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[MenstruationFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit). Defaults to now.
+
+        window : dt.timedelta
+            The length of the date range covered by each fetch
+
+        max_concurrency : int
+            The maximum number of window fetches in flight at once
+
+        to_webhook : typing.Optional[bool]
+            Boolean flag specifying whether to send the data retrieved to the webhook instead of in the response. Defaults to false, since the windows can only be merged when their data is returned in the response
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, applied to every window.
+
+        Returns
+        -------
+        MenstruationFetchResponse
+            The merged data. If a window returned neither data nor `NoDataReturned`, e.g. because the request was sent to the webhook or is still processing, that window's response is returned instead, and if no window returned data, the first window's response
+        """
+        return chunked_fetch(
+            self.fetch,
+            start_date=start_date,
+            end_date=end_date,
+            window=window,
+            max_concurrency=max_concurrency,
+            user_id=user_id,
+            to_webhook=to_webhook,
+            with_samples=with_samples,
+            request_options=request_options,
+        )
+
+    def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: MenstruationFetchRequestStartDate,
+        end_date: typing.Optional[MenstruationFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[Menstruation]:
+        """
+        Fetches menstruation data such as cycle length, period length, ovulation date etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory. The data is always returned in the response rather than sent to the webhook. A response without data yields no records if no data was found, and otherwise raises a `DataNotReturnedError` holding the decoded response, e.g. while a large request is being processed.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : MenstruationFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[MenstruationFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.Iterator[Menstruation]
+            The records, in the order they were returned
+
+        Examples
+        --------
+        from terra import Terra
+
+        client = Terra(
+            dev_id="YOUR_DEV_ID",
+            api_key="YOUR_API_KEY",
+        )
+        for record in client.menstruation.fetch_stream(
+            user_id="user_id",
+            start_date=1,
+            with_samples=True,
+        ):
+            print(record)
+        """
+        with self._raw_client.fetch_stream(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            with_samples=with_samples,
+            request_options=request_options,
+        ) as _response:
+            yield from _response.data
+
 
 class AsyncMenstruationClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -176,3 +297,130 @@ class AsyncMenstruationClient:
             request_options=request_options,
         )
         return _response.data
+
+    async def fetch_chunked(
+        self,
+        *,
+        user_id: str,
+        start_date: MenstruationFetchRequestStartDate,
+        end_date: typing.Optional[MenstruationFetchRequestEndDate] = None,
+        window: dt.timedelta = dt.timedelta(days=7),
+        max_concurrency: int = 4,
+        to_webhook: typing.Optional[bool] = False,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> MenstruationFetchResponse:
+        """
+        Fetches menstruation data over a wide date range by splitting it into `window` sized fetches issued concurrently, and merging their data in chronological order. Records returned by more than one window are only kept once.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : MenstruationFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[MenstruationFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit). Defaults to now.
+
+        window : dt.timedelta
+            The length of the date range covered by each fetch
+
+        max_concurrency : int
+            The maximum number of window fetches in flight at once
+
+        to_webhook : typing.Optional[bool]
+            Boolean flag specifying whether to send the data retrieved to the webhook instead of in the response. Defaults to false, since the windows can only be merged when their data is returned in the response
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, applied to every window.
+
+        Returns
+        -------
+        MenstruationFetchResponse
+            The merged data. If a window returned neither data nor `NoDataReturned`, e.g. because the request was sent to the webhook or is still processing, that window's response is returned instead, and if no window returned data, the first window's response
+        """
+        return await async_chunked_fetch(
+            self.fetch,
+            start_date=start_date,
+            end_date=end_date,
+            window=window,
+            max_concurrency=max_concurrency,
+            user_id=user_id,
+            to_webhook=to_webhook,
+            with_samples=with_samples,
+            request_options=request_options,
+        )
+
+    async def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: MenstruationFetchRequestStartDate,
+        end_date: typing.Optional[MenstruationFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[Menstruation]:
+        """
+        Fetches menstruation data such as cycle length, period length, ovulation date etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory. The data is always returned in the response rather than sent to the webhook. A response without data yields no records if no data was found, and otherwise raises a `DataNotReturnedError` holding the decoded response, e.g. while a large request is being processed.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : MenstruationFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[MenstruationFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.AsyncIterator[Menstruation]
+            The records, in the order they were returned
+
+        Examples
+        --------
+        import asyncio
+
+        from terra import AsyncTerra
+
+        client = AsyncTerra(
+            dev_id="YOUR_DEV_ID",
+            api_key="YOUR_API_KEY",
+        )
+
+
+        async def main() -> None:
+            async for record in client.menstruation.fetch_stream(
+                user_id="user_id",
+                start_date=1,
+                with_samples=True,
+            ):
+                print(record)
+
+
+        asyncio.run(main())
+        """
+        async with self._raw_client.fetch_stream(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            with_samples=with_samples,
+            request_options=request_options,
+        ) as _response:
+            async for _record in _response.data:
+                yield _record
@@ -1,16 +1,22 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import contextlib
 import typing
 from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
 from ..core.unchecked_base_model import construct_type
 from ..errors.bad_request_error import BadRequestError
 from ..errors.not_found_error import NotFoundError
 from ..errors.unauthorized_error import UnauthorizedError
+from ..rate_limit_signals import record_processing_response
+from ..stream_fetch import async_stream_fetch, stream_fetch
+from ..types.menstruation import Menstruation
 from ..types.menstruation_fetch_request_end_date import MenstruationFetchRequestEndDate
 from .types.menstruation_fetch_request_start_date import MenstruationFetchRequestStartDate
 from .types.menstruation_fetch_response import MenstruationFetchResponse
@@ -72,13 +78,10 @@ class RawMenstruationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    MenstruationFetchResponse,
-                    construct_type(
-                        type_=MenstruationFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, MenstruationFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
+                record_processing_response(_response, _data)
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -87,7 +90,7 @@ class RawMenstruationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -98,7 +101,7 @@ class RawMenstruationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -109,15 +112,67 @@ class RawMenstruationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.contextmanager
+    def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: MenstruationFetchRequestStartDate,
+        end_date: typing.Optional[MenstruationFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[HttpResponse[typing.Iterator[Menstruation]]]:
+        """
+        Fetches menstruation data such as cycle length, period length, ovulation date etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : MenstruationFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[MenstruationFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.Iterator[HttpResponse[typing.Iterator[Menstruation]]]
+            The response, whose data iterates over the records
+        """
+        with stream_fetch(
+            self._client_wrapper,
+            "menstruation",
+            record_type=Menstruation,
+            response_type=MenstruationFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
 
 class AsyncRawMenstruationClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -175,13 +230,10 @@ class AsyncRawMenstruationClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    MenstruationFetchResponse,
-                    construct_type(
-                        type_=MenstruationFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, MenstruationFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
+                record_processing_response(_response, _data)
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -190,7 +242,7 @@ class AsyncRawMenstruationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -201,7 +253,7 @@ class AsyncRawMenstruationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -212,11 +264,63 @@ class AsyncRawMenstruationClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
+
+    @contextlib.asynccontextmanager
+    async def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: MenstruationFetchRequestStartDate,
+        end_date: typing.Optional[MenstruationFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Menstruation]]]:
+        """
+        Fetches menstruation data such as cycle length, period length, ovulation date etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : MenstruationFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[MenstruationFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Menstruation]]]
+            The response, whose data iterates over the records
+        """
+        async with async_stream_fetch(
+            self._client_wrapper,
+            "menstruation",
+            record_type=Menstruation,
+            response_type=MenstruationFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
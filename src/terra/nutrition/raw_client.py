@@ -1,17 +1,22 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import contextlib
 import typing
 from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import decode_response
 from ..core.http_response import AsyncHttpResponse, HttpResponse
+from ..core.json_codec import load_json
 from ..core.request_options import RequestOptions
 from ..core.serialization import convert_and_respect_annotation_metadata
 from ..core.unchecked_base_model import construct_type
 from ..errors.bad_request_error import BadRequestError
 from ..errors.not_found_error import NotFoundError
 from ..errors.unauthorized_error import UnauthorizedError
+from ..rate_limit_signals import record_processing_response
+from ..stream_fetch import async_stream_fetch, stream_fetch
 from ..types.nutrition import Nutrition
 from ..types.nutrition_fetch_request_end_date import NutritionFetchRequestEndDate
 from .types.nutrition_delete_response import NutritionDeleteResponse
@@ -79,13 +84,10 @@ class RawNutritionClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    NutritionFetchResponse,
-                    construct_type(
-                        type_=NutritionFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, NutritionFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
+                record_processing_response(_response, _data)
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -94,7 +96,7 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -105,7 +107,7 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -116,15 +118,67 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.contextmanager
+    def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: NutritionFetchRequestStartDate,
+        end_date: typing.Optional[NutritionFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[HttpResponse[typing.Iterator[Nutrition]]]:
+        """
+        Fetches nutrition log data such as meal type, calories, macronutrients etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : NutritionFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[NutritionFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.Iterator[HttpResponse[typing.Iterator[Nutrition]]]
+            The response, whose data iterates over the records
+        """
+        with stream_fetch(
+            self._client_wrapper,
+            "nutrition",
+            record_type=Nutrition,
+            response_type=NutritionFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
     def write(
         self, *, data: typing.Sequence[Nutrition], request_options: typing.Optional[RequestOptions] = None
     ) -> HttpResponse[NutritionWriteResponse]:
@@ -160,12 +214,8 @@ class RawNutritionClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    NutritionWriteResponse,
-                    construct_type(
-                        type_=NutritionWriteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, NutritionWriteResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -175,7 +225,7 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -186,11 +236,11 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -238,12 +288,8 @@ class RawNutritionClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    NutritionDeleteResponse,
-                    construct_type(
-                        type_=NutritionDeleteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, NutritionDeleteResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return HttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -253,7 +299,7 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -264,7 +310,7 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -275,11 +321,11 @@ class RawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -341,13 +387,10 @@ class AsyncRawNutritionClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    NutritionFetchResponse,
-                    construct_type(
-                        type_=NutritionFetchResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, NutritionFetchResponse, model_backend=self._client_wrapper.model_backend
                 )
+                record_processing_response(_response, _data)
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -356,7 +399,7 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -367,7 +410,7 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -378,15 +421,67 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
+    @contextlib.asynccontextmanager
+    async def fetch_stream(
+        self,
+        *,
+        user_id: str,
+        start_date: NutritionFetchRequestStartDate,
+        end_date: typing.Optional[NutritionFetchRequestEndDate] = None,
+        with_samples: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Nutrition]]]:
+        """
+        Fetches nutrition log data such as meal type, calories, macronutrients etc. for a given user ID
+
+        The records are decoded one at a time as the response is received, so that only one is held in memory.
+
+        Parameters
+        ----------
+        user_id : str
+            Terra user ID (UUID format) to retrieve data for
+
+        start_date : NutritionFetchRequestStartDate
+            Start date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        end_date : typing.Optional[NutritionFetchRequestEndDate]
+            End date for data query - either ISO8601 date (YYYY-MM-DD) or unix timestamp in seconds (10-digit)
+
+        with_samples : typing.Optional[bool]
+            Boolean flag specifying whether to include detailed samples in the returned payload (default: false)
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[Nutrition]]]
+            The response, whose data iterates over the records
+        """
+        async with async_stream_fetch(
+            self._client_wrapper,
+            "nutrition",
+            record_type=Nutrition,
+            response_type=NutritionFetchResponse,
+            params={
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "with_samples": with_samples,
+            },
+            request_options=request_options,
+        ) as _response:
+            yield _response
+
     async def write(
         self, *, data: typing.Sequence[Nutrition], request_options: typing.Optional[RequestOptions] = None
     ) -> AsyncHttpResponse[NutritionWriteResponse]:
@@ -422,12 +517,8 @@ class AsyncRawNutritionClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    NutritionWriteResponse,
-                    construct_type(
-                        type_=NutritionWriteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, NutritionWriteResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -437,7 +528,7 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -448,11 +539,11 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -500,12 +591,8 @@ class AsyncRawNutritionClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                _data = typing.cast(
-                    NutritionDeleteResponse,
-                    construct_type(
-                        type_=NutritionDeleteResponse,  # type: ignore
-                        object_=_response.json(),
-                    ),
+                _data = decode_response(
+                    _response, NutritionDeleteResponse, model_backend=self._client_wrapper.model_backend
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
             if _response.status_code == 400:
@@ -515,7 +602,7 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -526,7 +613,7 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
@@ -537,11 +624,11 @@ class AsyncRawNutritionClient:
                         typing.Optional[typing.Any],
                         construct_type(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=load_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = load_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
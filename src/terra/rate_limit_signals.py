@@ -0,0 +1,27 @@
+import typing
+
+import httpx
+from .core.msgspec_models import get_struct_type, is_struct
+from .core.rate_limiter import throttle_response
+from .types.rate_limit_request_processing import RateLimitRequestProcessing
+from .types.request_processing import RequestProcessing
+
+_PROCESSING_TYPES = (RequestProcessing, RateLimitRequestProcessing)
+
+
+def record_processing_response(response: httpx.Response, data: typing.Any) -> None:
+    """
+    Throttles the rate limiter of the request for `response` if its decoded body, `data`, asks for the request to be
+    retried later. The API answers those with a success status, so the rate limiter cannot tell from the response
+    alone. The body's `retry_after_seconds` is honoured when given.
+    """
+    # Responses decoded by the msgspec model backend are mirrors of the models, rather than the models themselves
+    processing_types = (
+        tuple(get_struct_type(type_) for type_ in _PROCESSING_TYPES) if is_struct(data) else _PROCESSING_TYPES
+    )
+    if not isinstance(data, processing_types):
+        return
+    retry_after = getattr(data, "retry_after_seconds", None)
+    if isinstance(retry_after, bool) or not isinstance(retry_after, (int, float)):
+        retry_after = None
+    throttle_response(response, retry_after)
@@ -0,0 +1,508 @@
+import array
+import math
+import typing
+
+import pydantic
+from .core.model_fields import get_model_cache, get_model_fields, get_raw_field_value, get_record_type
+from .core.msgspec_models import get_struct_model, is_struct
+from .core.pydantic_utilities import IS_PYDANTIC_V2, get_args, get_origin, is_union
+from .core.timestamps import parse_timestamps_ns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore
+
+NUMPY_REQUIRED = "Converting sample series to NumPy requires numpy, install terra-python[numpy]"
+
+T = typing.TypeVar("T", bound=pydantic.BaseModel)
+
+Column = typing.Union["array.array[float]", typing.List[typing.Any]]
+
+# Columns which describe when a sample was taken, rather than what was measured
+_TIME_FIELDS = ("timestamp", "timer_duration_seconds")
+
+_NAN = math.nan
+
+
+class SampleSeries(typing.Generic[T]):
+    """
+    A series of samples stored column by column, rather than as one model per sample.
+
+    Numeric fields are held in `array('d')` columns, with NaN standing in for missing values, and every other
+    field in a list of its values. A series of 10,000 samples is then a handful of arrays instead of 10,000
+    models, and its numeric columns convert to NumPy without copying. Indexing it still returns sample models,
+    built on access.
+
+    Examples
+    --------
+    from terra.samples import get_sample_series
+
+    series = get_sample_series(activity.heart_rate_data.detailed, "hr_samples")
+    series.values  # array('d', [120.0, 121.0, ...])
+    series[0]  # HeartRateDataSample(timestamp='...', bpm=120.0)
+    series.to_numpy("bpm")
+    """
+
+    def __init__(self, sample_type: typing.Type[T], columns: typing.Dict[str, Column]) -> None:
+        self.sample_type = sample_type
+        self.columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+        self._timestamps_ns: typing.Optional["array.array[int]"] = None
+        if any(len(column) != self._length for column in columns.values()):
+            raise ValueError("Every column of a sample series must have the same length")
+
+    @classmethod
+    def from_json(cls, sample_type: typing.Type[T], objects: typing.Sequence[typing.Any]) -> "SampleSeries[T]":
+        """
+        Builds a series straight from the JSON objects of the samples, without constructing a model per sample.
+        Keys which are not fields of `sample_type` are dropped.
+        """
+        objects = [object_ if isinstance(object_, dict) else {} for object_ in objects]
+        columns: typing.Dict[str, Column] = {}
+        for name, key, is_numeric in _get_sample_fields(sample_type):
+            values = [object_.get(key) for object_ in objects]
+            columns[name] = _to_float_array(values) if is_numeric else values
+        return cls(sample_type, columns)
+
+    @classmethod
+    def from_samples(cls, sample_type: typing.Type[T], samples: typing.Sequence[typing.Any]) -> "SampleSeries[T]":
+        """
+        Builds a series from already decoded sample models.
+        """
+        columns: typing.Dict[str, Column] = {}
+        for name, _, is_numeric in _get_sample_fields(sample_type):
+            values = [getattr(sample, name, None) for sample in samples]
+            columns[name] = _to_float_array(values) if is_numeric else values
+        return cls(sample_type, columns)
+
+    @property
+    def timestamps(self) -> typing.Optional[typing.List[typing.Optional[str]]]:
+        """
+        The ISO-8601 timestamps of the samples, or None if the sample type has no timestamp.
+        """
+        return typing.cast(typing.Optional[typing.List[typing.Optional[str]]], self.columns.get("timestamp"))
+
+    @property
+    def timestamps_ns(self) -> typing.Optional["array.array[int]"]:
+        """
+        The timestamps of the samples in nanoseconds since the epoch, in UTC, as an `array('q')`, or None if the
+        sample type has no timestamp.
+
+        The timestamps are parsed in one batch the first time they are read, and kept for later reads. Timestamps
+        without a UTC offset, i.e. in the user's local time, are read as if they were in UTC, and missing ones are
+        `terra.core.timestamps.MISSING_TIMESTAMP`.
+        """
+        if self._timestamps_ns is None:
+            timestamps = self.timestamps
+            if timestamps is None:
+                return None
+            self._timestamps_ns = parse_timestamps_ns(timestamps)
+        return self._timestamps_ns
+
+    @property
+    def values(self) -> typing.Optional["array.array[float]"]:
+        """
+        The first numeric column that is not a time, e.g. `bpm` for heart rate samples, or None if there is none.
+        """
+        for name, column in self.columns.items():
+            if name not in _TIME_FIELDS and isinstance(column, array.array):
+                return column
+        return None
+
+    @property
+    def timer_duration_seconds(self) -> typing.Optional["array.array[float]"]:
+        return typing.cast(typing.Optional["array.array[float]"], self.columns.get("timer_duration_seconds"))
+
+    def column(self, name: str) -> Column:
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise KeyError(f"{self.sample_type.__name__} has no field {name!r}") from None
+
+    def to_numpy(self, name: typing.Optional[str] = None) -> typing.Any:
+        """
+        Returns the column `name` as a NumPy array, or all the columns keyed by name if `name` is not given.
+
+        Numeric columns are returned as float64 views of the column, without copying, and other columns as
+        object arrays.
+        """
+        if numpy is None:
+            raise ImportError(NUMPY_REQUIRED)
+        if name is None:
+            return {name: self.to_numpy(name) for name in self.columns}
+        column = self.column(name)
+        if isinstance(column, array.array):
+            return numpy.frombuffer(column, dtype=numpy.float64)
+        values = numpy.empty(len(column), dtype=object)
+        values[:] = column
+        return values
+
+    def to_datetime64(self) -> typing.Any:
+        """
+        Returns the timestamps of the samples as a NumPy `datetime64[ns]` array, in UTC, with NaT for missing ones.
+        The array is a view of `timestamps_ns`.
+        """
+        if numpy is None:
+            raise ImportError(NUMPY_REQUIRED)
+        timestamps_ns = self.timestamps_ns
+        if timestamps_ns is None:
+            raise KeyError(f"{self.sample_type.__name__} has no timestamp")
+        return numpy.frombuffer(timestamps_ns, dtype="datetime64[ns]")
+
+    def __len__(self) -> int:
+        return self._length
+
+    @typing.overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> "SampleSeries[T]": ...
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[T, "SampleSeries[T]"]:
+        if isinstance(index, slice):
+            return SampleSeries(self.sample_type, {name: column[index] for name, column in self.columns.items()})
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("sample series index out of range")
+        fields: typing.Dict[str, typing.Any] = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            # Missing values are left unset, as they are when the sample is decoded from JSON
+            if value is not None and value == value:
+                fields[name] = value
+        if IS_PYDANTIC_V2:
+            return self.sample_type.model_construct(**fields)  # type: ignore[return-value]
+        return self.sample_type.construct(**fields)  # type: ignore[return-value]
+
+    def __iter__(self) -> typing.Iterator[T]:
+        for index in range(self._length):
+            yield self[index]  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return f"SampleSeries[{self.sample_type.__name__}]({self._length} samples)"
+
+
+def get_sample_series(model: pydantic.BaseModel, field: str) -> typing.Optional[SampleSeries[typing.Any]]:
+    """
+    Returns the samples in `model`'s list field `field` as a `SampleSeries`, or None if the field is not set.
+
+    When `model` was decoded with the "lazy" model backend and the field has not been accessed yet, the series is
+    built straight from the JSON and the sample models are never constructed. The series is cached on `model`, so
+    its timestamps are parsed once for as long as the model is kept.
+
+    `model` can also be a struct decoded by the "msgspec" model backend, whose samples are read from its structs.
+    """
+    model_type = get_struct_model(type(model)) if is_struct(model) else type(model)
+    sample_type = _get_sample_type(model_type, field)
+    cache = get_model_cache(model)
+    if cache is not None and (_SERIES_CACHE_KEY, field) in cache:
+        return typing.cast(typing.Optional[SampleSeries[typing.Any]], cache[(_SERIES_CACHE_KEY, field)])
+
+    series = None
+    samples = get_raw_field_value(model, field, get_model_fields(model_type)[field].key)
+    if isinstance(samples, list):
+        if any(isinstance(sample, dict) for sample in samples):
+            series = SampleSeries.from_json(sample_type, samples)
+        else:
+            series = SampleSeries.from_samples(sample_type, samples)
+
+    if cache is not None:
+        cache[(_SERIES_CACHE_KEY, field)] = series
+    return series
+
+
+# The series built from a model are cached on it, under this key and the field's name
+_SERIES_CACHE_KEY = "sample_series"
+
+SampleChunk = typing.Dict[str, typing.Union[Column, "array.array[int]"]]
+
+# The fields holding the time of a sample, in order of preference
+_SAMPLE_TIME_FIELDS = ("timestamp", "measurement_time")
+# Sample fields holding several values, and the series each of their values is flattened into
+_COMPONENT_FIELDS = {"coords_lat_lng_deg": ("lat", "lng")}
+
+
+def get_sample_series_names(record_type: typing.Type[pydantic.BaseModel]) -> typing.List[str]:
+    """
+    Returns the names of the series `flatten_samples` flattens records of `record_type` into, e.g.
+    "heart_rate_data.detailed.hr_samples.bpm" for `Activity`.
+    """
+    return [name for source in _get_sample_sources(record_type) for name, _, _ in source.values]
+
+
+def flatten_samples(
+    records: typing.Iterable[typing.Any],
+    record_type: typing.Optional[typing.Type[pydantic.BaseModel]] = None,
+    *,
+    user_id: typing.Optional[str] = None,
+    series: typing.Optional[typing.Collection[str]] = None,
+    chunk_size: int = 100_000,
+) -> typing.Iterator[SampleChunk]:
+    """
+    Flattens the samples of records, e.g. `Activity`, `Daily`, `Sleep` or `Body` records, into a long-format table
+    with a row per sample value, and yields the table in chunks of at most `chunk_size` rows.
+
+    A chunk maps `user_id`, `record_id`, `series` and `timestamp` to lists, `value` to an `array('d')` and
+    `timestamp_ns` to the timestamps parsed by `parse_timestamps_ns`. The series of a row is the path of its
+    sample list and value, e.g. "heart_rate_data.detailed.hr_samples.bpm", and the record id is the record's
+    `metadata.summary_id`, or its `metadata.start_time` for records without one. Samples without a value have no
+    row for it.
+
+    The records are consumed lazily, so that only one chunk and the samples of one record are held at a time.
+    They can be models, or their raw JSON objects if `record_type` is given, and each can be paired with the id
+    of its user as a `(user_id, record)` tuple. Records which are not paired take `user_id`.
+
+    Parameters
+    ----------
+    series : typing.Optional[typing.Collection[str]]
+        Restricts the rows to these series, or to every series of these sample lists, e.g.
+        "heart_rate_data.detailed.hr_samples". See `get_sample_series_names`.
+
+    Examples
+    --------
+    from terra.samples import flatten_samples
+
+    records = client.activity.fetch_stream(user_id="user_id", start_date=1704067200, with_samples=True)
+    for chunk in flatten_samples(records, user_id="user_id", series=["heart_rate_data.detailed.hr_samples"]):
+        ...
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    chunk = _SampleChunkBuilder()
+    for record in records:
+        record_user_id = user_id
+        if isinstance(record, tuple):
+            record_user_id, record = record
+        record_id = _get_record_id(record)
+        for source in _get_sample_sources(get_record_type(record, record_type)):
+            values = (
+                source.values
+                if series is None
+                else [value for value in source.values if _is_selected(value[0], series)]
+            )
+            samples = source.get_samples(record) if values else None
+            if not samples:
+                continue
+            if any(isinstance(sample, dict) for sample in samples):
+                sample_series = SampleSeries.from_json(source.sample_type, samples)
+            else:
+                sample_series = SampleSeries.from_samples(source.sample_type, samples)
+            timestamps = typing.cast(typing.List[typing.Any], sample_series.columns[source.time_field])
+            for name, field, component in values:
+                column = sample_series.columns[field]
+                if component is not None:
+                    column = _to_float_array([_get_component(value, component) for value in column])
+                chunk.append(record_user_id, record_id, name, timestamps, typing.cast("array.array[float]", column))
+        while len(chunk) >= chunk_size:
+            yield chunk.take(chunk_size)
+    if len(chunk):
+        yield chunk.take(len(chunk))
+
+
+class _SampleSource:
+    """
+    A list of samples in a record, and the series its samples' values are flattened into.
+    """
+
+    __slots__ = ("path", "sample_type", "time_field", "values")
+
+    def __init__(
+        self,
+        *,
+        path: typing.Tuple[typing.Tuple[str, str], ...],
+        sample_type: typing.Type[typing.Any],
+        time_field: str,
+        values: typing.List[typing.Tuple[str, str, typing.Optional[int]]],
+    ) -> None:
+        self.path = path
+        self.sample_type = sample_type
+        self.time_field = time_field
+        # The series name, sample field and, for fields holding several values, the index of each value
+        self.values = values
+
+    def get_samples(self, record: typing.Any) -> typing.Optional[typing.List[typing.Any]]:
+        value = record
+        for name, key in self.path:
+            value = get_raw_field_value(value, name, key)
+            if value is None:
+                return None
+        return value if isinstance(value, list) else None
+
+
+class _SampleChunkBuilder:
+    def __init__(self) -> None:
+        self.user_ids: typing.List[typing.Optional[str]] = []
+        self.record_ids: typing.List[typing.Optional[str]] = []
+        self.series: typing.List[str] = []
+        self.timestamps: typing.List[typing.Optional[str]] = []
+        self.values: "array.array[float]" = array.array("d")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(
+        self,
+        user_id: typing.Optional[str],
+        record_id: typing.Optional[str],
+        series: str,
+        timestamps: typing.List[typing.Any],
+        values: "array.array[float]",
+    ) -> None:
+        if any(map(math.isnan, values)):
+            # NaN, i.e. a missing value, is the only value not equal to itself
+            kept = [index for index, value in enumerate(values) if value == value]
+            timestamps = [timestamps[index] for index in kept]
+            values = array.array("d", [values[index] for index in kept])
+        self.user_ids.extend([user_id] * len(values))
+        self.record_ids.extend([record_id] * len(values))
+        self.series.extend([series] * len(values))
+        self.timestamps.extend(timestamp if isinstance(timestamp, str) else None for timestamp in timestamps)
+        self.values.extend(values)
+
+    def take(self, size: int) -> SampleChunk:
+        timestamps = self.timestamps[:size]
+        chunk: SampleChunk = {
+            "user_id": self.user_ids[:size],
+            "record_id": self.record_ids[:size],
+            "series": self.series[:size],
+            "timestamp": timestamps,
+            "timestamp_ns": parse_timestamps_ns(timestamps),
+            "value": self.values[:size],
+        }
+        del self.user_ids[:size], self.record_ids[:size], self.series[:size], self.timestamps[:size]
+        del self.values[:size]
+        return chunk
+
+
+_SAMPLE_SOURCES: typing.Dict[typing.Type[typing.Any], typing.List[_SampleSource]] = {}
+
+
+def _get_sample_sources(record_type: typing.Type[typing.Any]) -> typing.List[_SampleSource]:
+    sources = _SAMPLE_SOURCES.get(record_type)
+    if sources is None:
+        sources = _compile_sample_sources(record_type, path=(), in_progress={record_type})
+        _SAMPLE_SOURCES[record_type] = sources
+    return sources
+
+
+def _compile_sample_sources(
+    model: typing.Type[typing.Any],
+    *,
+    path: typing.Tuple[typing.Tuple[str, str], ...],
+    in_progress: typing.Set[typing.Any],
+) -> typing.List[_SampleSource]:
+    sources = []
+    for field in get_model_fields(model).values():
+        field_path = (*path, (field.name, field.key))
+        field_type = _strip_optional(field.type_)
+        if get_origin(field_type) is list:
+            (item_type,) = get_args(field_type) or (typing.Any,)
+            item_type = _strip_optional(item_type)
+            if _is_model_type(item_type):
+                source = _compile_sample_source(item_type, path=field_path)
+                if source is not None:
+                    sources.append(source)
+        elif _is_model_type(field_type) and field_type not in in_progress:
+            sources.extend(_compile_sample_sources(field_type, path=field_path, in_progress=in_progress | {field_type}))
+    return sources
+
+
+def _compile_sample_source(
+    sample_type: typing.Type[typing.Any], *, path: typing.Tuple[typing.Tuple[str, str], ...]
+) -> typing.Optional[_SampleSource]:
+    fields = _get_sample_fields(sample_type)
+    field_names = {name for name, _, _ in fields}
+    time_field = next((name for name in _SAMPLE_TIME_FIELDS if name in field_names), None)
+    if time_field is None:
+        return None
+    prefix = ".".join(key for _, key in path)
+    values: typing.List[typing.Tuple[str, str, typing.Optional[int]]] = []
+    for name, key, is_numeric in fields:
+        if is_numeric and name not in _TIME_FIELDS:
+            values.append((f"{prefix}.{key}", name, None))
+        for index, component in enumerate(_COMPONENT_FIELDS.get(name, ())):
+            values.append((f"{prefix}.{component}", name, index))
+    if not values:
+        return None
+    return _SampleSource(path=path, sample_type=sample_type, time_field=time_field, values=values)
+
+
+def _is_model_type(type_: typing.Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, pydantic.BaseModel)
+
+
+def _is_selected(name: str, series: typing.Collection[str]) -> bool:
+    return name in series or name.rpartition(".")[0] in series
+
+
+def _get_component(value: typing.Any, index: int) -> typing.Any:
+    if isinstance(value, (list, tuple)) and len(value) > index:
+        return value[index]
+    return None
+
+
+def _get_record_id(record: typing.Any) -> typing.Optional[str]:
+    metadata = get_raw_field_value(record, "metadata", "metadata")
+    record_id = get_raw_field_value(metadata, "summary_id", "summary_id")
+    if record_id is None:
+        record_id = get_raw_field_value(metadata, "start_time", "start_time")
+    return record_id if isinstance(record_id, str) else None
+
+
+_SAMPLE_TYPES: typing.Dict[typing.Tuple[typing.Type[typing.Any], str], typing.Type[typing.Any]] = {}
+_SAMPLE_FIELDS: typing.Dict[typing.Type[typing.Any], typing.List[typing.Tuple[str, str, bool]]] = {}
+
+
+def _get_sample_type(model: typing.Type[typing.Any], field: str) -> typing.Type[typing.Any]:
+    sample_type = _SAMPLE_TYPES.get((model, field))
+    if sample_type is None:
+        fields = get_model_fields(model)
+        if field not in fields:
+            raise KeyError(f"{model.__name__} has no field {field!r}")
+        list_type = _strip_optional(fields[field].type_)
+        if get_origin(list_type) is not list:
+            raise TypeError(f"{model.__name__}.{field} is not a list of samples")
+        (sample_type,) = get_args(list_type)
+        if not (isinstance(sample_type, type) and issubclass(sample_type, pydantic.BaseModel)):
+            raise TypeError(f"{model.__name__}.{field} is not a list of samples")
+        _SAMPLE_TYPES[(model, field)] = sample_type
+    return sample_type
+
+
+def _get_sample_fields(sample_type: typing.Type[typing.Any]) -> typing.List[typing.Tuple[str, str, bool]]:
+    """
+    Returns the name, JSON key and whether it is numeric of each of the sample type's fields.
+    """
+    sample_fields = _SAMPLE_FIELDS.get(sample_type)
+    if sample_fields is None:
+        sample_fields = [
+            (field.name, field.key, _strip_optional(field.type_) in (float, int))
+            for field in get_model_fields(sample_type).values()
+        ]
+        _SAMPLE_FIELDS[sample_type] = sample_fields
+    return sample_fields
+
+
+def _strip_optional(type_: typing.Any) -> typing.Any:
+    if is_union(get_origin(type_)):
+        members = [member for member in get_args(type_) if member is not type(None)]
+        if len(members) == 1:
+            return members[0]
+    return type_
+
+
+def _to_float_array(values: typing.List[typing.Any]) -> "array.array[float]":
+    try:
+        return array.array("d", [_NAN if value is None else value for value in values])
+    except TypeError:
+        # Numbers sent as strings, or values which are not numbers at all
+        return array.array("d", [_to_float(value) for value in values])
+
+
+def _to_float(value: typing.Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
@@ -0,0 +1,141 @@
+import contextlib
+import typing
+from json.decoder import JSONDecodeError
+
+import httpx
+from .chunked_fetch import _is_no_data_returned
+from .core.api_error import ApiError
+from .core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .core.decoding import ModelBackend, decode_object
+from .core.http_response import AsyncHttpResponse, HttpResponse
+from .core.json_codec import load_json
+from .core.json_stream import JsonArrayStream
+from .core.request_options import RequestOptions
+from .core.unchecked_base_model import construct_type
+from .errors.bad_request_error import BadRequestError
+from .errors.not_found_error import NotFoundError
+from .errors.unauthorized_error import UnauthorizedError
+from .rate_limit_signals import record_processing_response
+
+T = typing.TypeVar("T")
+
+
+class DataNotReturnedError(ApiError):
+    """
+    Raised while iterating over a streamed fetch whose response had no data to stream, e.g. because a large request
+    is being processed or the request was rate limited. The decoded response is the error's `body`.
+    """
+
+    def __init__(
+        self,
+        body: typing.Optional[typing.Any],
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        status_code: typing.Optional[int] = None,
+    ):
+        super().__init__(status_code=status_code, headers=headers, body=body)
+
+
+@contextlib.contextmanager
+def stream_fetch(
+    client_wrapper: SyncClientWrapper,
+    path: str,
+    *,
+    record_type: typing.Type[T],
+    response_type: typing.Any,
+    params: typing.Dict[str, typing.Any],
+    request_options: typing.Optional[RequestOptions],
+) -> typing.Iterator[HttpResponse[typing.Iterator[T]]]:
+    """
+    Sends a fetch request and yields its records one at a time, decoding the response's `data` array as it is
+    received rather than once it has been read in full.
+
+    The data is always returned in the response, never sent to the webhook. A response without data yields no
+    records if no data was found, and otherwise raises a `DataNotReturnedError` holding the response decoded into
+    `response_type`, e.g. when a large request is being processed.
+    """
+    with client_wrapper.httpx_client.stream(
+        path,
+        method="GET",
+        params={**params, "to_webhook": False},
+        request_options=request_options,
+    ) as _response:
+        if not 200 <= _response.status_code < 300:
+            _response.read()
+            _raise_fetch_error(_response)
+
+        def _iter_records() -> typing.Iterator[T]:
+            stream = JsonArrayStream("data")
+            try:
+                for _chunk in _response.iter_bytes():
+                    for _record in stream.feed(_chunk):
+                        yield decode_object(_record, record_type, model_backend=client_wrapper.model_backend)
+                for _record in stream.close():
+                    yield decode_object(_record, record_type, model_backend=client_wrapper.model_backend)
+            except JSONDecodeError as e:
+                raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=str(e))
+            _check_data_returned(_response, stream, response_type, client_wrapper.model_backend)
+
+        yield HttpResponse(response=_response, data=_iter_records())
+
+
+@contextlib.asynccontextmanager
+async def async_stream_fetch(
+    client_wrapper: AsyncClientWrapper,
+    path: str,
+    *,
+    record_type: typing.Type[T],
+    response_type: typing.Any,
+    params: typing.Dict[str, typing.Any],
+    request_options: typing.Optional[RequestOptions],
+) -> typing.AsyncIterator[AsyncHttpResponse[typing.AsyncIterator[T]]]:
+    """
+    The async equivalent of `stream_fetch`.
+    """
+    async with client_wrapper.httpx_client.stream(
+        path,
+        method="GET",
+        params={**params, "to_webhook": False},
+        request_options=request_options,
+    ) as _response:
+        if not 200 <= _response.status_code < 300:
+            await _response.aread()
+            _raise_fetch_error(_response)
+
+        async def _iter_records() -> typing.AsyncIterator[T]:
+            stream = JsonArrayStream("data")
+            try:
+                async for _chunk in _response.aiter_bytes():
+                    for _record in stream.feed(_chunk):
+                        yield decode_object(_record, record_type, model_backend=client_wrapper.model_backend)
+                for _record in stream.close():
+                    yield decode_object(_record, record_type, model_backend=client_wrapper.model_backend)
+            except JSONDecodeError as e:
+                raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=str(e))
+            _check_data_returned(_response, stream, response_type, client_wrapper.model_backend)
+
+        yield AsyncHttpResponse(response=_response, data=_iter_records())
+
+
+def _check_data_returned(
+    _response: httpx.Response, stream: JsonArrayStream, response_type: typing.Any, model_backend: ModelBackend
+) -> None:
+    if stream.key_found:
+        return
+    _body = decode_object(stream.fields, response_type, model_backend=model_backend)
+    record_processing_response(_response, _body)
+    if not _is_no_data_returned(_body):
+        raise DataNotReturnedError(headers=dict(_response.headers), status_code=_response.status_code, body=_body)
+
+
+def _raise_fetch_error(_response: httpx.Response) -> typing.NoReturn:
+    try:
+        _body = construct_type(type_=typing.Optional[typing.Any], object_=load_json(_response))  # type: ignore
+    except JSONDecodeError:
+        raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
+    if _response.status_code == 400:
+        raise BadRequestError(headers=dict(_response.headers), body=_body)
+    if _response.status_code == 401:
+        raise UnauthorizedError(headers=dict(_response.headers), body=_body)
+    if _response.status_code == 404:
+        raise NotFoundError(headers=dict(_response.headers), body=_body)
+    raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_body)
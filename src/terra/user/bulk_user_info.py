@@ -0,0 +1,159 @@
+import asyncio
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.request_options import RequestOptions
+from ..core.ttl_cache import TTLCache
+from ..types.terra_user import TerraUser
+
+if typing.TYPE_CHECKING:
+    from .client import AsyncUserClient, UserClient
+
+DEFAULT_BATCH_SIZE = 100
+
+
+class _BaseBulkUserInfoLoader:
+    def __init__(self, *, batch_size: int, max_concurrency: int, cache_ttl: typing.Optional[float], cache_size: int):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._max_concurrency = max(1, max_concurrency)
+        self._cache: typing.Optional[TTLCache[str, TerraUser]] = (
+            TTLCache(ttl=cache_ttl, maxsize=cache_size) if cache_ttl is not None else None
+        )
+
+    def _split(
+        self, user_ids: typing.Iterable[str]
+    ) -> typing.Tuple[typing.Dict[str, TerraUser], typing.List[typing.List[str]]]:
+        """
+        Returns the users already cached, and the remaining (de-duplicated) IDs split into request sized batches.
+        """
+        cached: typing.Dict[str, TerraUser] = {}
+        missing: typing.List[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            user = self._cache.get(user_id) if self._cache is not None else None
+            if user is not None:
+                cached[user_id] = user
+            else:
+                missing.append(user_id)
+        return cached, [missing[i : i + self._batch_size] for i in range(0, len(missing), self._batch_size)]
+
+    def _merge(self, users: typing.Dict[str, TerraUser], batches: typing.Iterable[typing.List[TerraUser]]) -> None:
+        for batch in batches:
+            for user in batch:
+                users[user.user_id] = user
+                if self._cache is not None:
+                    self._cache.set(user.user_id, user)
+
+
+class BulkUserInfoLoader(_BaseBulkUserInfoLoader):
+    """
+    Looks up any number of users through `getinfoformultipleuserids`, splitting the IDs into batches that are
+    sent concurrently from a thread pool, and optionally caching the users found for `cache_ttl` seconds.
+
+    Examples
+    --------
+    from terra import Terra
+    from terra.user.bulk_user_info import BulkUserInfoLoader
+
+    client = Terra(
+        dev_id="YOUR_DEV_ID",
+        api_key="YOUR_API_KEY",
+    )
+    loader = BulkUserInfoLoader(client.user, cache_ttl=60)
+    users = loader.load(["user_id_1", "user_id_2"])
+    """
+
+    def __init__(
+        self,
+        user_client: "UserClient",
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = 4,
+        cache_ttl: typing.Optional[float] = None,
+        cache_size: int = 10_000,
+    ):
+        super().__init__(
+            batch_size=batch_size, max_concurrency=max_concurrency, cache_ttl=cache_ttl, cache_size=cache_size
+        )
+        self._user_client = user_client
+
+    def load(
+        self, user_ids: typing.Iterable[str], *, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.Dict[str, TerraUser]:
+        """
+        Returns the users found, keyed by user ID. IDs unknown to Terra are absent from the result.
+        """
+        users, batches = self._split(user_ids)
+        if not batches:
+            return users
+
+        def fetch_batch(batch: typing.List[str]) -> typing.List[TerraUser]:
+            return self._user_client.getinfoformultipleuserids(request=batch, request_options=request_options)
+
+        if len(batches) == 1:
+            self._merge(users, [fetch_batch(batches[0])])
+            return users
+        with ThreadPoolExecutor(max_workers=min(self._max_concurrency, len(batches))) as executor:
+            self._merge(users, executor.map(fetch_batch, batches))
+        return users
+
+
+class AsyncBulkUserInfoLoader(_BaseBulkUserInfoLoader):
+    """
+    Looks up any number of users through `getinfoformultipleuserids`, splitting the IDs into batches of which
+    at most `max_concurrency` are in flight at once, and optionally caching the users found for `cache_ttl` seconds.
+
+    Examples
+    --------
+    import asyncio
+
+    from terra import AsyncTerra
+    from terra.user.bulk_user_info import AsyncBulkUserInfoLoader
+
+    client = AsyncTerra(
+        dev_id="YOUR_DEV_ID",
+        api_key="YOUR_API_KEY",
+    )
+    loader = AsyncBulkUserInfoLoader(client.user, cache_ttl=60)
+
+
+    async def main() -> None:
+        users = await loader.load(["user_id_1", "user_id_2"])
+
+
+    asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        user_client: "AsyncUserClient",
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = 4,
+        cache_ttl: typing.Optional[float] = None,
+        cache_size: int = 10_000,
+    ):
+        super().__init__(
+            batch_size=batch_size, max_concurrency=max_concurrency, cache_ttl=cache_ttl, cache_size=cache_size
+        )
+        self._user_client = user_client
+
+    async def load(
+        self, user_ids: typing.Iterable[str], *, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.Dict[str, TerraUser]:
+        """
+        Returns the users found, keyed by user ID. IDs unknown to Terra are absent from the result.
+        """
+        users, batches = self._split(user_ids)
+        if not batches:
+            return users
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch_batch(batch: typing.List[str]) -> typing.List[TerraUser]:
+            async with semaphore:
+                return await self._user_client.getinfoformultipleuserids(request=batch, request_options=request_options)
+
+        self._merge(users, await asyncio.gather(*(fetch_batch(batch) for batch in batches)))
+        return users
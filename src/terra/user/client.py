@@ -1,5 +1,6 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import asyncio
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
@@ -7,6 +8,7 @@ from ..core.request_options import RequestOptions
 from ..types.terra_user import TerraUser
 from .raw_client import AsyncRawUserClient, RawUserClient
 from .types.user_get_all_user_i_ds_response import UserGetAllUserIDsResponse
+from .types.user_get_all_user_i_ds_response_users import UserGetAllUserIDsResponseUsers
 from .types.user_get_info_for_user_id_response import UserGetInfoForUserIdResponse
 from .types.user_modify_user_response import UserModifyUserResponse
 
@@ -195,6 +197,42 @@ class UserClient:
         _response = self._raw_client.getinfoformultipleuserids(request=request, request_options=request_options)
         return _response.data
 
+    def iter_all_users(
+        self, *, per_page: typing.Optional[int] = None, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.Iterator[TerraUser]:
+        """
+        Iterates over every Terra user, fetching one page of `getalluserids` at a time so that only a single page is held in memory.
+
+        Parameters
+        ----------
+        per_page : typing.Optional[int]
+            Number of results per page (default is 500).
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, applied to every page.
+
+        Yields
+        ------
+        TerraUser
+
+        Examples
+        --------
+        from terra import Terra
+
+        client = Terra(
+            dev_id="YOUR_DEV_ID",
+            api_key="YOUR_API_KEY",
+        )
+        for user in client.user.iter_all_users(per_page=1000):
+            print(user.user_id)
+        """
+        page: typing.Optional[int] = 0
+        while page is not None:
+            response = self.getalluserids(page=page, per_page=per_page, request_options=request_options)
+            users, next_page = _get_page(response, page)
+            yield from users
+            page = next_page
+
 
 class AsyncUserClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -408,3 +446,79 @@ class AsyncUserClient:
         """
         _response = await self._raw_client.getinfoformultipleuserids(request=request, request_options=request_options)
         return _response.data
+
+    async def iter_all_users(
+        self, *, per_page: typing.Optional[int] = None, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.AsyncIterator[TerraUser]:
+        """
+        Iterates over every Terra user, fetching one page of `getalluserids` at a time. The next page is prefetched while the current one is being consumed.
+
+        Parameters
+        ----------
+        per_page : typing.Optional[int]
+            Number of results per page (default is 500).
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, applied to every page.
+
+        Yields
+        ------
+        TerraUser
+
+        Examples
+        --------
+        import asyncio
+
+        from terra import AsyncTerra
+
+        client = AsyncTerra(
+            dev_id="YOUR_DEV_ID",
+            api_key="YOUR_API_KEY",
+        )
+
+
+        async def main() -> None:
+            async for user in client.user.iter_all_users(per_page=1000):
+                print(user.user_id)
+
+
+        asyncio.run(main())
+        """
+
+        def fetch_page(page: int) -> "asyncio.Task[UserGetAllUserIDsResponse]":
+            return asyncio.ensure_future(
+                self.getalluserids(page=page, per_page=per_page, request_options=request_options)
+            )
+
+        page = 0
+        next_response: typing.Optional["asyncio.Task[UserGetAllUserIDsResponse]"] = fetch_page(page)
+        try:
+            while next_response is not None:
+                response = await next_response
+                users, next_page = _get_page(response, page)
+                next_response = None
+                if next_page is not None:
+                    page = next_page
+                    next_response = fetch_page(page)
+                for user in users:
+                    yield user
+        finally:
+            if next_response is not None:
+                next_response.cancel()
+
+
+def _get_page(
+    response: UserGetAllUserIDsResponse, page: int
+) -> typing.Tuple[typing.Sequence[TerraUser], typing.Optional[int]]:
+    """
+    Returns the users on a page of `getalluserids` and the number of the page after it, if any.
+    """
+    if isinstance(response, UserGetAllUserIDsResponseUsers):
+        # The unpaginated shape holds every user, there is nothing left to fetch
+        return response.users or [], None
+
+    data = response.data
+    if data is None or not data.results:
+        return [], None
+    next_page = data.next
+    return data.results, next_page if next_page is not None and next_page > page else None
@@ -1,7 +1,10 @@
 import hashlib
 import hmac
 import time
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple, Union
+
+# Raw request bodies are accepted as bytes-like objects so they can be hashed without a decode/encode round-trip
+Payload = Union[bytes, bytearray, memoryview, str]
 
 
 class WebhookVerificationError(Exception):
@@ -10,7 +13,7 @@ class WebhookVerificationError(Exception):
 
 
 def verify_terra_webhook_signature(
-    payload: str,
+    payload: Payload,
     signature_header: str,
     signing_secret: str,
     tolerance: int = 300
@@ -18,8 +21,11 @@ def verify_terra_webhook_signature(
     """
     Verify Terra webhook signature using HMAC-SHA256.
 
+    For verifying many webhooks against the same secret, prefer a `WebhookVerifier`, which only
+    keys the HMAC once.
+
     Args:
-        payload: The raw JSON payload from the request body
+        payload: The raw JSON payload from the request body, as bytes or str
         signature_header: The 'terra-signature' header value
         signing_secret: The webhook endpoint's signing secret
         tolerance: Maximum age of the webhook in seconds (default: 5 minutes)
@@ -30,29 +36,99 @@ def verify_terra_webhook_signature(
     Raises:
         WebhookVerificationError: If verification fails
     """
-    if not payload or not signature_header or not signing_secret:
+    if not signing_secret:
         raise WebhookVerificationError("Missing required parameters")
 
-    # Step 1: Extract timestamp and signatures from header
-    timestamp, signatures = _extract_timestamp_and_signatures(signature_header)
+    return WebhookVerifier(signing_secret, tolerance=tolerance).verify(payload, signature_header)
 
-    if not timestamp:
-        raise WebhookVerificationError("No timestamp found in signature header")
 
-    if not signatures:
-        raise WebhookVerificationError("No v1 signatures found in signature header")
-
-    # Step 2: Prepare the signed payload string
-    signed_payload = f"{timestamp}.{payload}"
+class WebhookVerifier:
+    """
+    Reusable Terra webhook signature verifier.
 
-    # Step 3: Determine the expected signature
-    expected_signature = _compute_signature(signed_payload, signing_secret)
+    The signing secret is keyed into an HMAC-SHA256 state once, and each verification copies that
+    state and feeds the timestamp and raw body into it incrementally, so the body is never copied
+    into a concatenated signed payload.
 
-    # Step 4: Compare signatures and check timestamp tolerance
-    _verify_signatures(signatures, expected_signature)
-    _verify_timestamp(timestamp, tolerance)
+    Example:
+        verifier = WebhookVerifier(signing_secret)
+        verifier.verify(request_body_bytes, request.headers['terra-signature'])
+    """
 
-    return True
+    def __init__(self, signing_secret: str, tolerance: int = 300):
+        """
+        Args:
+            signing_secret: The webhook endpoint's signing secret
+            tolerance: Maximum age of the webhook in seconds (default: 5 minutes)
+        """
+        if not signing_secret:
+            raise WebhookVerificationError("Missing required parameters")
+
+        self.tolerance = tolerance
+        self._keyed_hmac = hmac.new(signing_secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+    def verify(self, payload: Payload, signature_header: str, now: Optional[int] = None) -> bool:
+        """
+        Verify a single webhook signature.
+
+        Args:
+            payload: The raw JSON payload from the request body, as bytes, memoryview or str
+            signature_header: The 'terra-signature' header value
+            now: Unix timestamp to check the tolerance against (default: the current time)
+
+        Returns:
+            bool: True if signature is valid and within tolerance
+
+        Raises:
+            WebhookVerificationError: If verification fails
+        """
+        if not payload or not signature_header:
+            raise WebhookVerificationError("Missing required parameters")
+
+        # Step 1: Extract timestamp and signatures from header
+        timestamp, signatures = _extract_timestamp_and_signatures(signature_header)
+
+        if not timestamp:
+            raise WebhookVerificationError("No timestamp found in signature header")
+
+        if not signatures:
+            raise WebhookVerificationError("No v1 signatures found in signature header")
+
+        # Step 2: Determine the expected signature over "{timestamp}.{payload}"
+        expected_signature = self._compute_signature(timestamp, payload)
+
+        # Step 3: Compare signatures and check timestamp tolerance
+        _verify_signatures(signatures, expected_signature)
+        _verify_timestamp(timestamp, self.tolerance, now=now)
+
+        return True
+
+    def verify_many(self, events: Iterable[Tuple[Payload, str]]) -> List[bool]:
+        """
+        Verify a batch of webhooks, e.g. when draining a queue.
+
+        Args:
+            events: (payload, signature_header) pairs
+
+        Returns:
+            list: Whether each webhook verified, in the order given. Failures are reported as
+            False rather than raised, so one bad event does not abort the batch.
+        """
+        now = int(time.time())
+        results = []
+        for payload, signature_header in events:
+            try:
+                results.append(self.verify(payload, signature_header, now=now))
+            except WebhookVerificationError:
+                results.append(False)
+        return results
+
+    def _compute_signature(self, timestamp: str, payload: Payload) -> str:
+        signature = self._keyed_hmac.copy()
+        signature.update(timestamp.encode('utf-8'))
+        signature.update(b'.')
+        signature.update(payload.encode('utf-8') if isinstance(payload, str) else payload)
+        return signature.hexdigest()
 
 
 def _extract_timestamp_and_signatures(signature_header: str) -> Tuple[Optional[str], List[str]]:
@@ -88,24 +164,6 @@ def _extract_timestamp_and_signatures(signature_header: str) -> Tuple[Optional[s
     return timestamp, signatures
 
 
-def _compute_signature(signed_payload: str, signing_secret: str) -> str:
-    """
-    Compute HMAC-SHA256 signature for the signed payload.
-
-    Args:
-        signed_payload: The concatenated timestamp.payload string
-        signing_secret: The webhook signing secret
-
-    Returns:
-        str: Hexadecimal HMAC-SHA256 signature
-    """
-    return hmac.new(
-        signing_secret.encode('utf-8'),
-        signed_payload.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-
-
 def _verify_signatures(received_signatures: List[str], expected_signature: str) -> None:
     """
     Verify that at least one received signature matches the expected signature.
@@ -125,13 +183,14 @@ def _verify_signatures(received_signatures: List[str], expected_signature: str)
     raise WebhookVerificationError("No matching signature found")
 
 
-def _verify_timestamp(timestamp_str: str, tolerance: int) -> None:
+def _verify_timestamp(timestamp_str: str, tolerance: int, now: Optional[int] = None) -> None:
     """
     Verify that the timestamp is within the acceptable tolerance.
 
     Args:
         timestamp_str: Timestamp as string from the header
         tolerance: Maximum age in seconds
+        now: Unix timestamp to compare against (default: the current time)
 
     Raises:
         WebhookVerificationError: If timestamp is invalid or too old
@@ -141,7 +200,7 @@ def _verify_timestamp(timestamp_str: str, tolerance: int) -> None:
     except ValueError:
         raise WebhookVerificationError("Invalid timestamp format")
 
-    current_timestamp = int(time.time())
+    current_timestamp = int(time.time()) if now is None else now
     age = current_timestamp - webhook_timestamp
 
     if age > tolerance:
@@ -0,0 +1,130 @@
+import typing
+
+from .core.json_codec import load_json
+from .core.model_fields import get_model_fields
+from .core.pydantic_utilities import get_args, parse_obj_as
+from .core.unchecked_base_model import construct_type
+from .types.webhook_event_type import WebhookEventType
+from .utils.verify_signature import WebhookVerifier
+
+WebhookPayload = typing.Union[bytes, bytearray, memoryview, str, typing.Mapping[str, typing.Any]]
+WebhookHandler = typing.Callable[[typing.Any], typing.Any]
+HandlerT = typing.TypeVar("HandlerT", bound=WebhookHandler)
+
+
+def _build_event_table() -> typing.Dict[str, typing.Any]:
+    members_by_type: typing.Dict[str, typing.List[typing.Any]] = {}
+    for member in get_args(typing.cast(typing.Type[typing.Any], WebhookEventType)):
+        event_type = get_model_fields(member)["type"].default
+        members_by_type.setdefault(event_type, []).append(member)
+
+    # Several events can share a tag (e.g. the "auth" success and error events), those are resolved from the
+    # remaining keys of the payload by the regular union decoding
+    return {
+        event_type: members[0] if len(members) == 1 else typing.Union[tuple(members)]
+        for event_type, members in members_by_type.items()
+    }
+
+
+_EVENT_TYPES = _build_event_table()
+
+
+def _load_payload(payload: WebhookPayload) -> typing.Dict[str, typing.Any]:
+    if isinstance(payload, typing.Mapping):
+        return dict(payload)
+    if isinstance(payload, memoryview):
+        payload = payload.tobytes()
+    object_ = load_json(payload)
+    if not isinstance(object_, dict):
+        raise ValueError(f"A webhook payload must be a JSON object, not {type(object_).__name__}")
+    return object_
+
+
+def parse_event(payload: WebhookPayload, *, validate: bool = False) -> WebhookEventType:
+    """
+    Decodes a webhook request body into its event model, using the `type` of the event to pick the model
+    directly rather than trying each member of `WebhookEventType` in turn.
+
+    Parameters
+    ----------
+    payload : WebhookPayload
+        The raw request body, or its already decoded JSON object.
+
+    validate : bool
+        Whether to validate the event against its model. By default the event is constructed without validation.
+
+    Returns
+    -------
+    WebhookEventType
+
+    Raises
+    ------
+    ValueError
+        If the payload is not a JSON object.
+    """
+    object_ = _load_payload(payload)
+    tag = object_.get("type")
+    event_type: typing.Any = _EVENT_TYPES.get(tag, WebhookEventType) if isinstance(tag, str) else WebhookEventType
+    if validate:
+        return typing.cast(WebhookEventType, parse_obj_as(event_type, object_))
+    return typing.cast(WebhookEventType, construct_type(type_=event_type, object_=object_))
+
+
+class WebhookRouter:
+    """
+    Dispatches webhook events to the handler registered for their `type`.
+
+    Examples
+    --------
+    from terra.webhooks import WebhookRouter
+
+    router = WebhookRouter(verifier=WebhookVerifier("YOUR_SIGNING_SECRET"))
+
+    @router.on("activity")
+    def handle_activity(event):
+        ...
+
+    router.dispatch(request_body, signature_header=request_headers["terra-signature"])
+    """
+
+    def __init__(
+        self,
+        *,
+        default_handler: typing.Optional[WebhookHandler] = None,
+        validate: bool = False,
+        verifier: typing.Optional[WebhookVerifier] = None,
+    ) -> None:
+        self._handlers: typing.Dict[str, WebhookHandler] = {}
+        self._default_handler = default_handler
+        self._validate = validate
+        self._verifier = verifier
+
+    def register(self, event_type: str, handler: WebhookHandler) -> None:
+        if event_type not in _EVENT_TYPES:
+            raise ValueError(f"Unknown webhook event type: {event_type}")
+        self._handlers[event_type] = handler
+
+    def on(self, event_type: str) -> typing.Callable[[HandlerT], HandlerT]:
+        def decorator(handler: HandlerT) -> HandlerT:
+            self.register(event_type, handler)
+            return handler
+
+        return decorator
+
+    def dispatch(self, payload: WebhookPayload, *, signature_header: typing.Optional[str] = None) -> typing.Any:
+        """
+        Parses the payload and calls the handler registered for its event type, returning the handler's result.
+        Events without a handler go to the default handler, or are dropped if there is none.
+
+        When the router has a verifier, the raw payload is verified against `signature_header` first and a
+        `WebhookVerificationError` is raised if it does not match.
+        """
+        if self._verifier is not None:
+            if isinstance(payload, typing.Mapping):
+                raise ValueError("The raw request body is required to verify a webhook signature")
+            self._verifier.verify(payload, signature_header or "")
+        event = parse_event(payload, validate=self._validate)
+        handler = self._handlers.get(getattr(event, "type", None), self._default_handler)  # type: ignore[arg-type]
+        if handler is None:
+            return None
+        return handler(event)
@@ -0,0 +1,55 @@
+import asyncio
+import typing
+
+import httpx
+
+from terra import AsyncTerra
+from terra.activity.types.activity_fetch_response_data import ActivityFetchResponseData
+from terra.core.api_error import ApiError
+
+
+def make_client(
+    handler: typing.Callable[[httpx.Request], typing.Coroutine[typing.Any, typing.Any, httpx.Response]],
+) -> AsyncTerra:
+    return AsyncTerra(
+        dev_id="dev", api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+async def test_bulk_fetch_bounds_concurrency_and_yields_in_completion_order() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        user_id = request.url.params["user_id"]
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05 if user_id == "slow" else 0.001)
+        in_flight -= 1
+        return httpx.Response(200, json={"user": {"user_id": user_id, "provider": "GARMIN"}, "data": []})
+
+    client = make_client(handler)
+    user_ids = ["slow", *[f"user-{i}" for i in range(9)]]
+
+    results = [result async for result in client.bulk_fetch("activity", user_ids, start_date=1, concurrency=3)]
+
+    assert peak == 3
+    assert sorted(result.user_id for result in results) == sorted(user_ids)
+    assert results[-1].user_id == "slow"
+    assert all(isinstance(result.data, ActivityFetchResponseData) for result in results)
+
+
+async def test_bulk_fetch_captures_errors_per_user() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["user_id"] == "broken":
+            return httpx.Response(500, json={"message": "error"})
+        return httpx.Response(200, json={"data": []})
+
+    client = make_client(handler)
+
+    results = {result.user_id: result async for result in client.bulk_fetch("sleep", ["ok", "broken"], start_date=1)}
+
+    assert results["ok"].error is None
+    assert isinstance(results["broken"].error, ApiError)
+    assert results["broken"].data is None
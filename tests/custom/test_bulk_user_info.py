@@ -0,0 +1,78 @@
+import json
+import threading
+import typing
+
+import httpx
+
+from terra import AsyncTerra, Terra
+from terra.core.ttl_cache import TTLCache
+from terra.user.bulk_user_info import AsyncBulkUserInfoLoader, BulkUserInfoLoader
+
+
+def bulk_user_info(request: httpx.Request, requested: typing.List[typing.List[str]]) -> httpx.Response:
+    user_ids = json.loads(request.content)
+    requested.append(user_ids)
+    users = [{"user_id": user_id, "provider": "GARMIN"} for user_id in user_ids if user_id != "unknown"]
+    return httpx.Response(200, json=users)
+
+
+def test_loader_batches_ids_and_merges_results() -> None:
+    requested: typing.List[typing.List[str]] = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            return bulk_user_info(request, requested)
+
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    loader = BulkUserInfoLoader(client.user, batch_size=2, max_concurrency=2)
+
+    users = loader.load(["a", "b", "a", "c", "unknown", "d"])
+
+    assert sorted(users) == ["a", "b", "c", "d"]
+    assert users["c"].provider == "GARMIN"
+    assert sorted(requested) == [["a", "b"], ["c", "unknown"], ["d"]]
+
+
+def test_loader_serves_recent_users_from_cache() -> None:
+    requested: typing.List[typing.List[str]] = []
+    transport = httpx.MockTransport(lambda request: bulk_user_info(request, requested))
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=transport))
+    loader = BulkUserInfoLoader(client.user, cache_ttl=60)
+
+    loader.load(["a", "b"])
+    users = loader.load(["a", "b", "c"])
+
+    assert sorted(users) == ["a", "b", "c"]
+    assert requested == [["a", "b"], ["c"]]
+
+
+async def test_async_loader_batches_ids_and_caches_results() -> None:
+    requested: typing.List[typing.List[str]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return bulk_user_info(request, requested)
+
+    client = AsyncTerra(
+        dev_id="dev", api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    loader = AsyncBulkUserInfoLoader(client.user, batch_size=2, cache_ttl=60)
+
+    users = await loader.load(["a", "b", "c"])
+    await loader.load(["c"])
+
+    assert sorted(users) == ["a", "b", "c"]
+    assert requested == [["a", "b"], ["c"]]
+
+
+def test_ttl_cache_expires_and_evicts_entries() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=0)
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    cache.set("d", 4)
+    assert cache.get("a") is None
+    assert len(cache) == 2
@@ -0,0 +1,69 @@
+import datetime as dt
+import typing
+
+import httpx
+
+from terra import AsyncTerra, Terra
+from terra.chunked_fetch import split_date_range
+from terra.types.data_sent_to_webhook import DataSentToWebhook
+
+DAY = 24 * 60 * 60
+JAN_1 = 1704067200
+
+
+def activity(summary_id: str, start_time: str) -> typing.Dict[str, typing.Any]:
+    return {"metadata": {"summary_id": summary_id, "start_time": start_time, "end_time": start_time}}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    # The windows are only merged if their data comes back in the response rather than being sent to the webhook
+    assert request.url.params["to_webhook"] == "false"
+    # Windows are returned newest first and the record straddling the boundary comes back from both windows
+    if int(request.url.params["start_date"]) == JAN_1:
+        data = [activity("b", "2024-01-07T23:00:00+00:00"), activity("a", "2024-01-02T10:00:00+00:00")]
+    else:
+        data = [activity("c", "2024-01-09T08:00:00+00:00"), activity("b", "2024-01-07T23:00:00+00:00")]
+    return httpx.Response(200, json={"user": {"user_id": "user", "provider": "GARMIN"}, "data": data})
+
+
+async def async_handler(request: httpx.Request) -> httpx.Response:
+    return handler(request)
+
+
+def test_split_date_range_covers_the_whole_range() -> None:
+    windows = split_date_range("2024-01-01", "2024-01-10", dt.timedelta(days=7))
+
+    assert windows == [(JAN_1, JAN_1 + 7 * DAY), (JAN_1 + 7 * DAY, JAN_1 + 10 * DAY)]
+    assert split_date_range(JAN_1, JAN_1 + DAY, dt.timedelta(hours=12))[-1] == (JAN_1 + DAY // 2, JAN_1 + DAY)
+
+
+def test_fetch_chunked_merges_windows_chronologically_without_duplicates() -> None:
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    response = client.activity.fetch_chunked(user_id="user", start_date="2024-01-01", end_date="2024-01-10")
+
+    assert [record.metadata.summary_id for record in response.data] == ["a", "b", "c"]
+    assert response.user.user_id == "user"
+
+
+async def test_async_fetch_chunked_merges_windows() -> None:
+    client = AsyncTerra(
+        dev_id="dev", api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler))
+    )
+
+    response = await client.activity.fetch_chunked(user_id="user", start_date="2024-01-01", end_date="2024-01-10")
+
+    assert [record.metadata.summary_id for record in response.data] == ["a", "b", "c"]
+
+
+def test_fetch_chunked_returns_non_data_responses_as_is() -> None:
+    def webhook_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"reference": "ref", "message": "sent"})
+
+    client = Terra(
+        dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(webhook_handler))
+    )
+
+    response = client.sleep.fetch_chunked(user_id="user", start_date="2024-01-01", end_date="2024-01-10")
+
+    assert isinstance(response, DataSentToWebhook)
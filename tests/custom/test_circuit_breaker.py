@@ -0,0 +1,118 @@
+import time
+import typing
+
+import httpx
+import pytest
+
+from terra import AsyncTerra, Terra
+from terra.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, get_endpoint
+
+Transition = typing.Tuple[str, CircuitState, CircuitState]
+
+
+def test_get_endpoint_groups_paths() -> None:
+    assert get_endpoint("activity") == "activity"
+    assert get_endpoint("auth/authenticateUser") == "auth/authenticateUser"
+    assert get_endpoint("users/abc-123") == "users"
+
+
+def test_circuit_opens_on_failures_and_closes_after_a_probe(monkeypatch: typing.Any) -> None:
+    transitions: typing.List[Transition] = []
+    breaker = CircuitBreaker(
+        minimum_requests=4,
+        reset_timeout=30,
+        on_state_change=lambda *transition: transitions.append(transition),
+    )
+    for failed in (False, True, False, True):
+        breaker.before_request("activity")
+        breaker.record("activity", failed=failed, elapsed=0.1)
+
+    assert breaker.get_state("activity") is CircuitState.OPEN
+    assert breaker.get_state("sleep") is CircuitState.CLOSED
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("activity")
+
+    now = time.monotonic()
+    monkeypatch.setattr("terra.core.circuit_breaker.time.monotonic", lambda: now + 31)
+    breaker.before_request("activity")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("activity")
+    breaker.record("activity", failed=False, elapsed=0.1)
+
+    assert [transition[2] for transition in transitions] == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_outcomes_of_requests_admitted_under_an_earlier_state_are_ignored(monkeypatch: typing.Any) -> None:
+    breaker = CircuitBreaker(minimum_requests=2, reset_timeout=30)
+    slow = breaker.before_request("activity")
+    for _ in range(2):
+        breaker.record("activity", failed=True, elapsed=0.1, generation=breaker.before_request("activity"))
+
+    now = time.monotonic()
+    monkeypatch.setattr("terra.core.circuit_breaker.time.monotonic", lambda: now + 31)
+    probe = breaker.before_request("activity")
+    # The request sent before the circuit opened is not a probe, its success does not close the circuit
+    breaker.record("activity", failed=False, elapsed=0.1, generation=slow)
+    breaker.release("activity", slow)
+    assert breaker.get_state("activity") is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("activity")
+
+    breaker.record("activity", failed=False, elapsed=0.1, generation=probe)
+    assert breaker.get_state("activity") is CircuitState.CLOSED
+
+
+def test_slow_calls_count_as_failures() -> None:
+    breaker = CircuitBreaker(minimum_requests=2, slow_call_threshold=1)
+    breaker.record("daily", failed=False, elapsed=5)
+    breaker.record("daily", failed=False, elapsed=5)
+
+    assert breaker.get_state("daily") is CircuitState.OPEN
+
+
+def test_client_fails_fast_while_the_endpoint_circuit_is_open() -> None:
+    paths: typing.List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/activity"):
+            raise httpx.ConnectError("unreachable")
+        return httpx.Response(200, json={"providers": []})
+
+    breaker = CircuitBreaker(minimum_requests=2)
+    client = Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        circuit_breaker=breaker,
+    )
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            client.activity.fetch(user_id="user", start_date=1)
+
+    with pytest.raises(CircuitOpenError):
+        client.activity.fetch(user_id="user", start_date=1)
+    client.integrations.fetch()
+
+    assert len(paths) == 3
+
+
+async def test_async_client_records_server_errors() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    breaker = CircuitBreaker(minimum_requests=1)
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        circuit_breaker=breaker,
+    )
+    with pytest.raises(Exception):
+        await client.user.getinfoforuserid(user_id="user")
+
+    assert breaker.get_state("userInfo") is CircuitState.OPEN
@@ -0,0 +1,36 @@
+import httpx
+
+from terra import AsyncTerra, Terra
+
+
+def test_pool_limits_are_applied_to_the_default_client() -> None:
+    client = Terra(dev_id="dev", api_key="key", max_connections=250, max_keepalive_connections=50)
+
+    stats = client.get_connection_pool_stats()
+
+    assert stats is not None
+    assert stats.connections == 0
+    assert stats.pending_requests == 0
+    assert stats.max_connections == 250
+    assert stats.max_keepalive_connections == 50
+
+
+def test_pool_stats_are_none_for_custom_transports() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=transport))
+
+    assert client.get_connection_pool_stats() is None
+
+
+def test_timeout_split_defaults_unset_phases_to_timeout() -> None:
+    client = AsyncTerra(dev_id="dev", api_key="key", timeout=30, connect_timeout=5, pool_timeout=1)
+
+    timeout = client._client_wrapper.get_timeout()
+
+    assert timeout == httpx.Timeout(30, connect=5, pool=1)
+
+
+def test_plain_timeout_is_unchanged() -> None:
+    client = Terra(dev_id="dev", api_key="key", timeout=15)
+
+    assert client._client_wrapper.get_timeout() == 15
@@ -0,0 +1,65 @@
+import typing
+
+import httpx
+
+from terra import AsyncTerra, Terra
+from terra.core.response_cache import DATA_ENDPOINTS, ResponseCache
+
+DAILY = {"user": {"user_id": "user", "provider": "GARMIN"}, "data": [{"metadata": {}}], "type": "daily"}
+
+
+def test_data_fetches_are_revalidated_and_304s_served_locally() -> None:
+    requests: typing.List[httpx.Request] = []
+    responses = [
+        httpx.Response(200, json=DAILY, headers={"etag": '"v1"', "last-modified": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+        httpx.Response(304),
+        httpx.Response(200, json=DAILY),
+        httpx.Response(200, json=DAILY),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        response_cache=ResponseCache(endpoint_ttls={}, revalidate_endpoints=DATA_ENDPOINTS),
+    )
+
+    first = client.daily.fetch(user_id="user", start_date=1)
+    second = client.daily.fetch(user_id="user", start_date=1)
+    assert second is first
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    assert requests[1].headers["if-modified-since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    # A response without validators replaces the stored one and is not kept
+    client.daily.fetch(user_id="user", start_date=1)
+    client.daily.fetch(user_id="user", start_date=1)
+    assert "if-none-match" in requests[2].headers
+    assert "if-none-match" not in requests[3].headers
+
+
+async def test_async_client_revalidates_with_last_modified() -> None:
+    requests: typing.List[httpx.Request] = []
+    responses = [httpx.Response(200, json=DAILY, headers={"last-modified": "Wed, 21 Oct 2026 07:28:00 GMT"})]
+    responses.append(httpx.Response(304))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        response_cache=ResponseCache(revalidate_endpoints=["body"]),
+    )
+
+    first = await client.body.fetch(user_id="user", start_date=1)
+    second = await client.body.fetch(user_id="user", start_date=1)
+
+    assert second is first
+    assert "if-none-match" not in requests[1].headers
+    assert requests[1].headers["if-modified-since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
@@ -0,0 +1,99 @@
+import typing
+
+import httpx
+import pytest
+
+from terra import Terra
+from terra.core.unchecked_base_model import construct_type
+
+pyarrow = pytest.importorskip("pyarrow")
+parquet = pytest.importorskip("pyarrow.parquet")
+
+from terra.export import ParquetWriter, flatten_samples_to_arrow, get_arrow_schema, to_arrow  # noqa: E402
+from terra.types.activity import Activity  # noqa: E402
+from terra.types.sleep import Sleep  # noqa: E402
+
+ACTIVITY: typing.Dict[str, typing.Any] = {
+    "metadata": {"summary_id": "a", "start_time": "2024-01-01T00:00:00+00:00", "type": 1},
+    "calories_data": {"total_burned_calories": "900"},
+    "MET_data": {"num_high_intensity_minutes": 3},
+    "heart_rate_data": {
+        "detailed": {"hr_samples": [{"timestamp": "2024-01-01T00:00:00+00:00", "bpm": 120 + i} for i in range(5)]},
+    },
+    "lap_data": {"laps": [{"stroke_type": "freestyle"}]},
+    "unknown_field": True,
+}
+
+
+def test_schema_mirrors_the_models() -> None:
+    schema = get_arrow_schema(Activity)
+
+    assert schema.field("MET_data").type.get_field_index("num_high_intensity_minutes") >= 0
+    assert schema.field("metadata").type.field("summary_id").type == pyarrow.string()
+    hr_samples = schema.field("heart_rate_data").type.field("detailed").type.field("hr_samples").type
+    assert hr_samples.value_type.field("bpm").type == pyarrow.float64()
+    assert schema.field("lap_data").type.field("laps").type.value_type.field("stroke_type").type == pyarrow.string()
+    assert "unknown_field" not in schema.names
+
+
+def test_models_and_json_convert_to_the_same_table() -> None:
+    models = [construct_type(type_=Activity, object_=ACTIVITY), None, construct_type(type_=Activity, object_={})]
+
+    table = to_arrow([model for model in models if model is not None])
+
+    assert table.equals(to_arrow([ACTIVITY, {}], Activity))
+    row = table.to_pylist()[0]
+    assert row["metadata"]["summary_id"] == "a"
+    assert row["calories_data"]["total_burned_calories"] == 900
+    assert [sample["bpm"] for sample in row["heart_rate_data"]["detailed"]["hr_samples"]] == [
+        120.0 + i for i in range(5)
+    ]
+    assert row["lap_data"]["laps"][0]["stroke_type"] == "freestyle"
+    assert table.to_pylist()[1]["metadata"] is None
+
+
+def test_to_arrow_needs_the_type_of_json_records() -> None:
+    with pytest.raises(TypeError):
+        to_arrow([ACTIVITY])
+
+
+def test_lazy_records_are_converted_without_decoding_them() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"user": {"user_id": "user-1"}, "data": [ACTIVITY], "type": "activity"})
+
+    client = Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        model_backend="lazy",
+    )
+    activity = client.activity.fetch(user_id="user-1", start_date=1704067200).data[0]
+
+    table = to_arrow([activity])
+
+    assert table.equals(to_arrow([ACTIVITY], Activity))
+    assert "heart_rate_data" not in activity.__dict__
+
+
+def test_parquet_writer_writes_a_row_group_per_batch(tmp_path: typing.Any) -> None:
+    path = str(tmp_path / "sleep.parquet")
+
+    with ParquetWriter(path, Sleep, batch_size=10) as writer:
+        writer.write_all({"metadata": {"summary_id": str(i)}} for i in range(25))
+
+    parquet_file = parquet.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.schema_arrow == get_arrow_schema(Sleep)
+    assert parquet_file.read().column("metadata").to_pylist()[24]["summary_id"] == "24"
+
+
+def test_flatten_samples_to_arrow() -> None:
+    records = [("user-1", ACTIVITY), ("user-2", {"heart_rate_data": {"detailed": {"hr_samples": [{"bpm": 60}]}}})]
+
+    (batch,) = flatten_samples_to_arrow(records, Activity, series=["heart_rate_data.detailed.hr_samples"])
+
+    assert batch.num_rows == 6
+    assert batch.column("value").to_pylist() == [120.0 + i for i in range(5)] + [60.0]
+    assert batch.column("timestamp_ns")[0].value == 1704067200000000000
+    assert batch.column("timestamp_ns")[5].as_py() is None
+    assert batch.column("record_id").to_pylist() == ["a"] * 5 + [None]
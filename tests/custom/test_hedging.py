@@ -0,0 +1,88 @@
+import asyncio
+import typing
+
+import httpx
+
+from terra import AsyncTerra
+from terra.core.hedging import HedgingPolicy, send_hedged
+
+
+def test_hedging_delay_tracks_the_latency_percentile() -> None:
+    policy = HedgingPolicy(percentile=0.9, initial_delay=1, min_samples=10)
+    assert policy.get_delay("userInfo") == 1
+
+    for latency in range(1, 11):
+        policy.record_latency("userInfo", latency / 100)
+
+    assert policy.get_delay("userInfo") == 0.1
+    assert policy.get_delay("athlete") == 1
+
+
+def test_hedging_budget_limits_duplicates() -> None:
+    policy = HedgingPolicy(budget=0.5)
+
+    policy.earn()
+    assert not policy.try_spend()
+    policy.earn()
+    assert policy.try_spend()
+    assert not policy.try_spend()
+
+
+async def test_slow_get_is_hedged_and_the_fastest_response_wins() -> None:
+    calls: typing.List[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"attempt": "first"})
+        return httpx.Response(200, json={"attempt": "hedge"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    policy = HedgingPolicy(initial_delay=0.01, budget=1)
+    request = client.build_request("GET", "https://api.tryterra.co/v2/userInfo")
+
+    response = await send_hedged(client, request, endpoint="userInfo", policy=policy)
+
+    assert response.json() == {"attempt": "hedge"}
+    assert len(calls) == 2
+
+
+async def test_primaries_that_lose_the_race_are_recorded() -> None:
+    calls: typing.List[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    policy = HedgingPolicy(initial_delay=0.05, budget=1, min_samples=1)
+    request = client.build_request("GET", "https://api.tryterra.co/v2/userInfo")
+
+    await send_hedged(client, request, endpoint="userInfo", policy=policy)
+    await asyncio.sleep(0)
+
+    # The primary was cancelled when the hedge answered, after the hedging delay, rather than the hedge recorded
+    assert policy.get_delay("userInfo") >= 0.05
+
+
+async def test_client_only_hedges_get_requests() -> None:
+    methods: typing.List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"providers": [], "status": "success"})
+
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedging_policy=HedgingPolicy(initial_delay=0.01, budget=1),
+    )
+    await client.integrations.fetch()
+    await client.authentication.deauthenticateuser(user_id="user")
+
+    assert methods == ["GET", "GET", "DELETE"]
@@ -0,0 +1,58 @@
+import json
+import math
+import typing
+
+import httpx
+import pytest
+
+from terra import Terra
+from terra.core import json_codec
+from terra.core.json_codec import dump_json, load_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+        monkeypatch.setattr(json_codec, "msgspec", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_load_json(codec: str) -> None:
+    response = httpx.Response(200, content='{"name": "Zoë", "values": [1, 2.5, null]}'.encode())
+
+    assert load_json(response) == {"name": "Zoë", "values": [1, 2.5, None]}
+
+
+def test_load_json_falls_back_for_bodies_the_fast_decoders_reject(codec: str) -> None:
+    assert math.isnan(load_json(httpx.Response(200, content=b'{"value": NaN}'))["value"])
+    assert load_json(httpx.Response(200, content='{"name": "Zoë"}'.encode("utf-16"))) == {"name": "Zoë"}
+
+
+def test_load_json_raises_json_decode_error(codec: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        load_json(httpx.Response(200, content=b"<html>Bad Gateway</html>"))
+
+
+def test_dump_json_matches_the_standard_library(codec: str) -> None:
+    obj = {"name": "Zoë", "values": [1, 2.5, None], "nested": {"ok": True}}
+
+    assert json.loads(dump_json(obj)) == obj
+    assert b" " not in dump_json(obj)
+
+
+def test_json_bodies_are_encoded_with_the_codec(codec: str) -> None:
+    requests: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"status": "success", "session_id": "s", "url": "https://widget"})
+
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    response = client.authentication.generatewidgetsession(providers="GARMIN", reference_id="ref")
+
+    assert response.session_id == "s"
+    assert requests[0].headers["content-type"] == "application/json"
+    assert json.loads(requests[0].content) == {"providers": "GARMIN", "reference_id": "ref"}
@@ -0,0 +1,97 @@
+import copy
+import pickle
+import typing
+
+import httpx
+import pydantic
+
+from terra import Terra
+from terra.activity.types.activity_fetch_response import ActivityFetchResponse
+from terra.core.unchecked_base_model import construct_type, lazy_decoding
+from terra.types.activity import Activity
+from terra.types.heart_rate_data import HeartRateData
+
+ACTIVITY: typing.Dict[str, typing.Any] = {
+    "metadata": {"summary_id": "a", "start_time": "2024-01-01T00:00:00+00:00", "type": 1},
+    "calories_data": {"total_burned_calories": 900},
+    "MET_data": {"num_high_intensity_minutes": 3},
+    "heart_rate_data": {
+        "detailed": {"hr_samples": [{"timestamp": "2024-01-01T00:00:00+00:00", "bpm": 120 + i} for i in range(5)]},
+        "summary": {"avg_hr_bpm": 122},
+    },
+    "cheat_detection": 0,
+}
+RESPONSE = {"user": {"user_id": "user-1"}, "data": [ACTIVITY], "type": "activity"}
+
+
+def construct_lazily(type_: typing.Any, object_: typing.Any) -> typing.Any:
+    with lazy_decoding():
+        return construct_type(type_=type_, object_=object_)
+
+
+def test_fields_are_decoded_on_first_access() -> None:
+    activity = construct_lazily(Activity, ACTIVITY)
+
+    assert "heart_rate_data" not in activity.__dict__
+    assert activity.cheat_detection == 0.0
+
+    heart_rate_data = activity.heart_rate_data
+    assert isinstance(heart_rate_data, HeartRateData)
+    assert activity.heart_rate_data is heart_rate_data
+    # Nested models are lazy too
+    assert "detailed" not in heart_rate_data.__dict__
+    assert heart_rate_data.detailed is not None and heart_rate_data.detailed.hr_samples is not None
+    assert heart_rate_data.detailed.hr_samples[2].bpm == 122.0
+    assert activity.met_data.num_high_intensity_minutes == 3.0
+
+
+def test_lazy_models_serialize_and_compare_like_eager_ones() -> None:
+    eager = construct_type(type_=typing.cast(typing.Type[typing.Any], ActivityFetchResponse), object_=RESPONSE)
+
+    assert construct_lazily(ActivityFetchResponse, RESPONSE) == eager
+    assert construct_lazily(ActivityFetchResponse, RESPONSE).dict() == eager.dict()
+    assert construct_lazily(ActivityFetchResponse, RESPONSE).json() == eager.json()
+    assert construct_lazily(ActivityFetchResponse, RESPONSE).model_dump() == eager.model_dump()
+    assert repr(construct_lazily(ActivityFetchResponse, RESPONSE)) == repr(eager)
+
+
+def test_lazy_models_nested_in_other_models_serialize_in_full() -> None:
+    class Wrap(pydantic.BaseModel):
+        items: typing.List[Activity]
+
+    eager = construct_type(type_=Activity, object_=ACTIVITY)
+
+    assert (
+        Wrap.model_construct(items=[construct_lazily(Activity, ACTIVITY)]).model_dump()
+        == Wrap.model_construct(items=[eager]).model_dump()
+    )
+    adapter: pydantic.TypeAdapter[typing.List[Activity]] = pydantic.TypeAdapter(typing.List[Activity])
+    assert adapter.dump_python([construct_lazily(Activity, ACTIVITY)]) == adapter.dump_python([eager])
+    assert adapter.dump_json([construct_lazily(Activity, ACTIVITY)]) == adapter.dump_json([eager])
+    assert "heart_rate_data" in adapter.dump_python([construct_lazily(Activity, ACTIVITY)])[0]
+
+
+def test_lazy_models_copy_and_pickle() -> None:
+    eager = construct_type(type_=Activity, object_=ACTIVITY)
+
+    assert pickle.loads(pickle.dumps(construct_lazily(Activity, ACTIVITY))) == eager
+    assert copy.deepcopy(construct_lazily(Activity, ACTIVITY)) == eager
+    assert construct_lazily(Activity, ACTIVITY).model_copy().heart_rate_data == eager.heart_rate_data
+
+
+def test_lazy_model_backend() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=RESPONSE)
+
+    client = Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        model_backend="lazy",
+    )
+
+    response = client.activity.fetch(user_id="user-1", start_date=1704067200)
+
+    activity = response.data[0]
+    assert "heart_rate_data" not in activity.__dict__
+    assert activity.calories_data.total_burned_calories == 900
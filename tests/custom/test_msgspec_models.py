@@ -0,0 +1,142 @@
+import typing
+
+import httpx
+import pytest
+
+from terra import AsyncTerra, Terra
+from terra.core.response_cache import ResponseCache, SqliteCacheBackend
+
+msgspec = pytest.importorskip("msgspec")
+
+from terra.core.msgspec_models import TerraStruct, get_struct_model, get_struct_type  # noqa: E402
+from terra.samples import get_sample_series  # noqa: E402
+from terra.types.activity import Activity  # noqa: E402
+from terra.types.planned_workout_step_targets import PlannedWorkoutStepTargets  # noqa: E402
+
+ACTIVITY = {
+    "user": {"user_id": "user-1", "provider": "GARMIN"},
+    "data": [
+        {
+            "metadata": {"summary_id": "a", "start_time": "2024-01-01T00:00:00+00:00", "type": 1},
+            "MET_data": {"num_high_intensity_minutes": 3},
+            "heart_rate_data": {
+                "detailed": {"hr_samples": [{"timestamp": "2024-01-01T00:00:00+00:00", "bpm": 120}]},
+                "summary": {"avg_hr_bpm": "125.5"},
+            },
+            "unknown_field": True,
+        }
+    ],
+    "type": "activity",
+}
+
+
+def make_client(body: typing.Any, **kwargs: typing.Any) -> Terra:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=body(request) if callable(body) else body)
+
+    return Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        model_backend="msgspec",
+        **kwargs,
+    )
+
+
+def test_fetch_decodes_into_structs() -> None:
+    response = make_client(ACTIVITY).activity.fetch(user_id="user-1", start_date=1704067200)
+
+    assert isinstance(response, TerraStruct)
+    assert type(response).__name__ == "ActivityFetchResponseData"
+    activity = getattr(response, "data")[0]
+    assert activity.metadata.summary_id == "a"
+    assert activity.met_data.num_high_intensity_minutes == 3
+    assert activity.heart_rate_data.detailed.hr_samples[0].bpm == 120.0
+    assert activity.heart_rate_data.summary.avg_hr_bpm == 125.5
+    assert response.dict()["user"] == {"user_id": "user-1", "provider": "GARMIN"}
+
+
+def test_union_members_are_picked_from_the_payload() -> None:
+    response = make_client({"status": "success", "message": "no data"}).activity.fetch(
+        user_id="user-1", start_date=1704067200
+    )
+
+    assert type(response).__name__ == "NoDataReturned"
+    assert response.message == "no data"
+
+
+def test_discriminated_unions_are_tagged() -> None:
+    decoder = msgspec.json.Decoder(get_struct_type(PlannedWorkoutStepTargets))
+
+    target = decoder.decode(b'{"type": "CadencePlannedWorkoutStepTarget", "cadence": 90}')
+
+    assert type(target).__name__ == "PlannedWorkoutStepTargets_CadencePlannedWorkoutStepTarget"
+    assert target.cadence == 90
+
+
+def test_undecodable_bodies_fall_back_to_pydantic() -> None:
+    body = {"data": [{"metadata": {"summary_id": ["not", "a", "string"]}}], "type": "activity"}
+
+    response = make_client(body).activity.fetch(user_id="user-1", start_date=1704067200)
+
+    assert isinstance(response.data[0], Activity)
+
+
+def test_structs_mirror_the_models() -> None:
+    assert get_struct_model(get_struct_type(Activity)) is Activity
+    with pytest.raises(TypeError):
+        get_struct_model(TerraStruct)
+
+
+def test_fetch_chunked_merges_structs() -> None:
+    def body(request: httpx.Request) -> typing.Any:
+        if int(request.url.params["start_date"]) == 1704067200:
+            return ACTIVITY
+        return {"status": "success", "message": "no data"}
+
+    client = make_client(body)
+
+    response = client.activity.fetch_chunked(user_id="user-1", start_date="2024-01-01", end_date="2024-01-10")
+
+    assert isinstance(response, TerraStruct)
+    assert [activity.metadata.summary_id for activity in getattr(response, "data")] == ["a"]
+
+
+def test_get_sample_series_reads_structs() -> None:
+    response: typing.Any = make_client(ACTIVITY).activity.fetch(user_id="user-1", start_date=1704067200)
+
+    series = get_sample_series(response.data[0].heart_rate_data.detailed, "hr_samples")
+
+    assert series is not None and list(series.column("bpm")) == [120.0]
+    assert series.timestamps == ["2024-01-01T00:00:00+00:00"]
+
+
+def test_structs_are_not_pickled_into_the_sqlite_cache(tmp_path: typing.Any) -> None:
+    cache = ResponseCache(endpoint_ttls={"userInfo": 60}, backend=SqliteCacheBackend(str(tmp_path / "cache.sqlite")))
+    client = make_client({"status": "success", "user": {"user_id": "user-1"}}, response_cache=cache)
+
+    first = client.user.getinfoforuserid(user_id="user-1")
+    second = client.user.getinfoforuserid(user_id="user-1")
+
+    assert first.user.user_id == second.user.user_id == "user-1"
+
+
+async def test_async_client() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=ACTIVITY)
+
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        model_backend="msgspec",
+    )
+
+    response = await client.activity.fetch(user_id="user-1", start_date=1704067200)
+
+    assert isinstance(response, TerraStruct)
+
+
+def test_unknown_backends_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        Terra(dev_id="dev", api_key="key", model_backend="attrs")  # type: ignore[arg-type]
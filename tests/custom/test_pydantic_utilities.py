@@ -0,0 +1,41 @@
+import typing
+
+import pytest
+
+from terra.core.pydantic_utilities import IS_PYDANTIC_V2, TypeAdapterRegistry, parse_obj_as, type_adapter_registry
+from terra.types.terra_user import TerraUser
+
+pytestmark = pytest.mark.skipif(not IS_PYDANTIC_V2, reason="TypeAdapters only exist in Pydantic V2")
+
+
+def test_registry_reuses_adapters_and_counts_hits() -> None:
+    registry = TypeAdapterRegistry(maxsize=8)
+
+    first = registry.get(TerraUser)
+    second = registry.get(TerraUser)
+
+    assert first is second
+    assert registry.cache_info() == (1, 1, 8, 1)
+
+
+def test_registry_evicts_least_recently_used() -> None:
+    registry = TypeAdapterRegistry(maxsize=2)
+
+    int_adapter = registry.get(int)
+    registry.get(str)
+    registry.get(int)
+    registry.get(float)
+
+    assert registry.cache_info().currsize == 2
+    assert registry.get(int) is int_adapter
+    assert registry.cache_info().misses == 3
+
+
+def test_parse_obj_as_uses_the_shared_registry() -> None:
+    type_adapter_registry.clear()
+
+    parse_obj_as(typing.List[TerraUser], [{"user_id": "a", "provider": "GARMIN"}])
+    user = parse_obj_as(typing.List[TerraUser], [{"user_id": "b", "provider": "GARMIN"}])[0]
+
+    assert user.user_id == "b"
+    assert type_adapter_registry.cache_info().hits == 1
@@ -0,0 +1,146 @@
+import typing
+
+import httpx
+
+from terra import AsyncTerra, Terra
+from terra.core import ttl_cache
+from terra.core.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_token_bucket_spaces_requests_beyond_the_burst() -> None:
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+
+def test_token_bucket_shrinks_on_throttling_and_recovers_gradually() -> None:
+    bucket = TokenBucket(rate=10, recovery_factor=0.1)
+
+    bucket.throttle(retry_after=5)
+    assert bucket.rate == 5
+    assert bucket.reserve() > 4
+
+    for _ in range(3):
+        bucket.recover()
+    assert bucket.rate == 8
+    for _ in range(10):
+        bucket.recover()
+    assert bucket.rate == 10
+
+
+def test_rate_limiter_uses_endpoint_and_user_buckets() -> None:
+    limiter = RateLimiter(rate=100, per_user_rate=1, per_endpoint_rates={"auth": 1, "auth/authenticateUser": 50})
+
+    assert limiter.reserve("activity", "user-1") == 0
+    assert limiter.reserve("activity", "user-1") > 0
+    assert limiter.reserve("activity", "user-2") == 0
+    assert limiter.reserve("auth/deauthenticateUser") == 0
+    assert limiter.reserve("auth/deauthenticateUser") > 0
+    assert limiter.reserve("auth/authenticateUser") == 0
+
+
+def test_rate_limiter_reacts_to_rate_limit_signals() -> None:
+    responses = iter(
+        [
+            httpx.Response(429, headers={"retry-after": "0"}),
+            httpx.Response(202, json={"type": "rate_limit_request_processing", "retry_after_seconds": 0}),
+            httpx.Response(200, json={"data": []}),
+        ]
+    )
+    limiter = RateLimiter(rate=1000, per_user_rate=1000)
+    transport = httpx.MockTransport(lambda request: next(responses))
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=transport), rate_limiter=limiter)
+    http = client._client_wrapper.httpx_client
+
+    http.request("activity", method="GET", params={"user_id": "user"})
+    assert limiter.bucket.rate == 500
+    # The transport only reads the status and headers, bodies count once they are decoded by the clients
+    http.request("activity", method="GET", params={"user_id": "user"})
+    assert limiter.bucket.rate == 550
+    http.request("activity", method="GET", params={"user_id": "user"})
+    assert limiter.bucket.rate == 600
+
+
+def test_rate_limiter_throttles_on_decoded_processing_responses() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        user = {"user_id": request.url.params["user_id"], "provider": "GARMIN"}
+        return httpx.Response(200, json={"type": "rate_limit", "message": "Rate limited", "user": user})
+
+    limiter = RateLimiter(rate=1000, per_user_rate=100, per_endpoint_rates={"activity": 10})
+    client = Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=limiter,
+    )
+
+    client.activity.fetch(user_id="user-1", start_date=1704067200)
+
+    global_bucket, endpoint_bucket, user_bucket = limiter._get_buckets("activity", "user-1")
+    assert global_bucket.rate == 500
+    assert endpoint_bucket.rate == 5
+    assert user_bucket.rate == 50
+    assert limiter._get_buckets("activity", "user-2")[2].rate == 100
+
+
+def test_rate_limiter_honours_retry_after_seconds_of_processing_responses() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        user = {"user_id": "user-1", "provider": "GARMIN"}
+        return httpx.Response(200, json={"retry_after_seconds": 30, "message": "Processing", "user": user})
+
+    limiter = RateLimiter(rate=1000)
+    client = Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=limiter,
+    )
+
+    client.sleep.fetch(user_id="user-1", start_date=1704067200)
+
+    assert limiter.bucket.rate == 500
+    assert limiter.reserve("sleep", "user-1") > 29
+
+
+def test_user_buckets_in_use_do_not_expire(monkeypatch: typing.Any) -> None:
+    now = [0.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    limiter = RateLimiter(rate=1000, per_user_rate=1)
+    user_bucket = limiter._get_buckets("activity", "user-1")[1]
+
+    for _ in range(3):
+        now[0] += 200
+        assert limiter._get_buckets("activity", "user-1")[1] is user_bucket
+    now[0] += 301
+    assert limiter._get_buckets("activity", "user-1")[1] is not user_bucket
+
+
+async def test_async_client_shares_one_limiter_across_sub_clients() -> None:
+    paths: typing.List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(429)
+
+    limiter = RateLimiter(rate=1000)
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=limiter,
+    )
+
+    for _ in range(2):
+        try:
+            await client.integrations.fetch()
+        except Exception:
+            pass
+        try:
+            await client.user.getinfoforuserid(user_id="user")
+        except Exception:
+            pass
+
+    assert len(paths) == 4
+    assert limiter.bucket.rate == 1000 * 0.5**4
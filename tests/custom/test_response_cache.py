@@ -0,0 +1,117 @@
+import json
+import sqlite3
+import typing
+
+import httpx
+
+from terra import AsyncTerra, Terra
+from terra.core.decoding import decode_response
+from terra.core.response_cache import ResponseCache, SqliteCacheBackend
+from terra.integrations.types.integrations_fetch_response import IntegrationsFetchResponse
+
+INTEGRATIONS = {"providers": ["GARMIN"], "sdk_resource": [], "status": "success"}
+
+
+def make_client(
+    responses: typing.List[httpx.Response], requests: typing.List[httpx.Request], response_cache: ResponseCache
+) -> Terra:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    return Terra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        response_cache=response_cache,
+    )
+
+
+def test_decode_response_is_memoized() -> None:
+    response = httpx.Response(200, json=INTEGRATIONS)
+
+    first = decode_response(response, IntegrationsFetchResponse)
+
+    assert first.providers == ["GARMIN"]
+    assert decode_response(response, IntegrationsFetchResponse) is first
+
+
+def test_cache_hits_skip_the_request_and_decoding() -> None:
+    requests: typing.List[httpx.Request] = []
+    client = make_client([httpx.Response(200, json=INTEGRATIONS)], requests, ResponseCache(ttl=60))
+
+    first = client.integrations.fetch()
+    second = client.integrations.fetch()
+
+    assert second is first
+    assert len(requests) == 1
+
+
+def test_expired_responses_are_revalidated_with_their_etag() -> None:
+    requests: typing.List[httpx.Request] = []
+    responses = [
+        httpx.Response(200, json=INTEGRATIONS, headers={"etag": '"v1"', "cache-control": "no-cache"}),
+        httpx.Response(304),
+    ]
+    client = make_client(responses, requests, ResponseCache(ttl=60))
+
+    first = client.integrations.fetch()
+    second = client.integrations.fetch()
+
+    assert second is first
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"v1"'
+
+
+def test_no_store_responses_and_uncached_endpoints_are_not_cached() -> None:
+    requests: typing.List[httpx.Request] = []
+    responses = [httpx.Response(200, json=INTEGRATIONS, headers={"cache-control": "no-store"}) for _ in range(2)]
+    client = make_client(responses, requests, ResponseCache(endpoint_ttls={"integrations": 60}))
+    client.integrations.fetch()
+    client.integrations.fetch()
+
+    assert len(requests) == 2
+    assert ResponseCache(endpoint_ttls={"integrations": 60}).get_key(requests[0], "userInfo") is None
+
+
+def test_sqlite_backend_persists_responses_without_credentials(tmp_path: typing.Any) -> None:
+    path = str(tmp_path / "cache.sqlite")
+    requests: typing.List[httpx.Request] = []
+    client = make_client(
+        [httpx.Response(200, json=INTEGRATIONS)], requests, ResponseCache(backend=SqliteCacheBackend(path))
+    )
+    client.integrations.fetch()
+
+    restarted = make_client([], requests, ResponseCache(backend=SqliteCacheBackend(path)))
+    assert restarted.integrations.fetch().providers == ["GARMIN"]
+    assert len(requests) == 1
+
+    status_code, headers, content = (
+        sqlite3.connect(path).execute("SELECT status_code, headers, content FROM cached_responses").fetchone()
+    )
+    assert status_code == 200
+    assert "x-api-key" not in headers.lower()
+    assert httpx.Headers(json.loads(headers))["content-type"] == "application/json"
+    assert json.loads(content) == INTEGRATIONS
+
+
+async def test_async_client_caches_user_info() -> None:
+    requests: typing.List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"user": {"user_id": request.url.params["user_id"], "provider": "GARMIN"}})
+
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        response_cache=ResponseCache(),
+    )
+
+    await client.user.getinfoforuserid(user_id="a")
+    await client.user.getinfoforuserid(user_id="b")
+    user = await client.user.getinfoforuserid(user_id="a")
+
+    assert user.user.user_id == "a"
+    assert len(requests) == 2
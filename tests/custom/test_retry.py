@@ -0,0 +1,132 @@
+import dataclasses
+import typing
+
+import httpx
+import pytest
+
+from terra import AsyncTerra, RetryPolicy, Terra
+from terra.core import http_client
+from terra.core.http_client import AsyncHttpClient, HttpClient
+
+NO_DELAY = RetryPolicy(max_retries=3, initial_delay=0, jitter=0)
+
+
+def flaky(failures: typing.List[typing.Any], requests: typing.List[httpx.Request]) -> typing.Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return httpx.Response(failure)
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def make_http_client(handler: typing.Any, retry_policy: typing.Optional[RetryPolicy] = None) -> HttpClient:
+    return HttpClient(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_timeout=lambda: 60,
+        base_headers=lambda: {},
+        base_url=lambda: "https://api.tryterra.co/v2",
+        retry_policy=retry_policy,
+    )
+
+
+def test_retries_resend_the_same_encoded_request(monkeypatch: typing.Any) -> None:
+    encode_calls: typing.List[typing.Any] = []
+    encode_query = http_client.encode_query
+
+    def counting_encode_query(query: typing.Any) -> typing.Any:
+        encode_calls.append(query)
+        return encode_query(query)
+
+    monkeypatch.setattr(http_client, "encode_query", counting_encode_query)
+    requests: typing.List[httpx.Request] = []
+    client = make_http_client(flaky([429, 503], requests), NO_DELAY)
+
+    response = client.request("auth", method="POST", params={"a": 1}, data={"hello": "world"})
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert len(encode_calls) == 1
+    assert all(request.content == b"hello=world" for request in requests)
+
+
+def test_retries_stop_at_max_retries_and_deadline() -> None:
+    requests: typing.List[httpx.Request] = []
+    client = make_http_client(flaky([500] * 5, requests), NO_DELAY)
+    assert client.request("auth", method="GET").status_code == 500
+    assert len(requests) == 4
+
+    requests.clear()
+    slow = RetryPolicy(max_retries=3, initial_delay=10, jitter=0, deadline=1)
+    client = make_http_client(flaky([500] * 5, requests), slow)
+    assert client.request("auth", method="GET").status_code == 500
+    assert len(requests) == 1
+
+
+def test_request_options_override_the_client_policy() -> None:
+    requests: typing.List[httpx.Request] = []
+    client = make_http_client(flaky([429, 429], requests), NO_DELAY)
+    assert client.request("auth", method="GET", request_options={"max_retries": 0}).status_code == 429
+
+    requests.clear()
+    client = make_http_client(flaky([409], requests))
+    policy = RetryPolicy(max_retries=1, retry_statuses={409}, initial_delay=0)
+    assert client.request("auth", method="GET", request_options={"retry_policy": policy}).status_code == 200
+    assert len(requests) == 2
+
+
+def test_timeouts_are_retried_when_enabled() -> None:
+    requests: typing.List[httpx.Request] = []
+    timeout = httpx.ReadTimeout("timed out")
+    client = make_http_client(flaky([timeout], requests), NO_DELAY)
+    assert client.request("auth", method="GET").status_code == 200
+
+    client = make_http_client(flaky([timeout], requests), RetryPolicy(max_retries=3, retry_on_timeout=False))
+    with pytest.raises(httpx.ReadTimeout):
+        client.request("auth", method="GET")
+
+
+def test_read_timeouts_are_only_retried_for_idempotent_methods() -> None:
+    requests: typing.List[httpx.Request] = []
+    client = make_http_client(flaky([httpx.ReadTimeout("timed out")], requests), NO_DELAY)
+    with pytest.raises(httpx.ReadTimeout):
+        client.request("auth", method="POST")
+
+    client = make_http_client(flaky([httpx.ConnectTimeout("timed out")], requests), NO_DELAY)
+    assert client.request("auth", method="POST").status_code == 200
+
+    opted_in = dataclasses.replace(NO_DELAY, retry_read_timeout_on_any_method=True)
+    client = make_http_client(flaky([httpx.ReadTimeout("timed out")], requests), opted_in)
+    assert client.request("auth", method="POST").status_code == 200
+
+
+async def test_async_client_retries_with_the_client_policy() -> None:
+    requests: typing.List[httpx.Request] = []
+    handler = flaky([429, httpx.ConnectTimeout("timed out")], requests)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+        retry_policy=NO_DELAY,
+    )
+    http = client._client_wrapper.httpx_client
+
+    assert isinstance(http, AsyncHttpClient)
+    response = await http.request("auth", method="POST", json={"hello": "world"})
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert requests[-1].headers["dev-id"] == "dev"
+
+
+def test_sync_client_accepts_a_retry_policy() -> None:
+    client = Terra(dev_id="dev", api_key="key", retry_policy=NO_DELAY)
+    assert client._client_wrapper.httpx_client.retry_policy is NO_DELAY
@@ -0,0 +1,210 @@
+import array
+import copy
+import gc
+import math
+import pickle
+import typing
+import weakref
+
+import pytest
+
+from terra.core import timestamps
+from terra.core.timestamps import MISSING_TIMESTAMP, parse_timestamps_ns
+from terra.core.unchecked_base_model import construct_type, lazy_decoding
+from terra.samples import SampleSeries, flatten_samples, get_sample_series, get_sample_series_names
+from terra.types.activity import Activity
+from terra.types.body import Body
+from terra.types.daily_pattern_sample import DailyPatternSample
+from terra.types.heart_rate_data_detailed import HeartRateDataDetailed
+from terra.types.heart_rate_data_sample import HeartRateDataSample
+from terra.types.sleep import Sleep
+from terra.types.step_sample import StepSample
+
+DETAILED: typing.Dict[str, typing.Any] = {
+    "hr_samples": [
+        {"timestamp": "2024-01-01T00:00:00+00:00", "bpm": 120, "timer_duration_seconds": 0},
+        {"timestamp": "2024-01-01T00:00:01+00:00", "bpm": None, "timer_duration_seconds": 1, "context": 1},
+        {"timestamp": "2024-01-01T00:00:02+00:00", "bpm": "122.5", "unknown": True},
+    ]
+}
+
+
+def test_series_are_built_from_json() -> None:
+    series = SampleSeries.from_json(HeartRateDataSample, DETAILED["hr_samples"])
+
+    assert len(series) == 3
+    assert series.timestamps == [sample["timestamp"] for sample in DETAILED["hr_samples"]]
+    assert isinstance(series.values, array.array)
+    assert series.values[0] == 120.0 and math.isnan(series.values[1]) and series.values[2] == 122.5
+    assert list(series.timer_duration_seconds or [])[:2] == [0.0, 1.0]
+    assert math.isnan((series.timer_duration_seconds or [])[2])
+    assert series.column("timestamp") is series.timestamps
+
+
+def test_indexing_returns_the_samples() -> None:
+    eager = construct_type(type_=HeartRateDataDetailed, object_=DETAILED)
+    series = SampleSeries.from_json(HeartRateDataSample, DETAILED["hr_samples"])
+
+    assert series[0] == eager.hr_samples[0]
+    assert series[-1].bpm == 122.5
+    assert series[1].bpm is None and series[1].context == 1.0
+    assert [sample.timestamp for sample in series] == [sample.timestamp for sample in eager.hr_samples]
+    assert len(series[1:]) == 2
+    with pytest.raises(IndexError):
+        series[3]
+
+
+def test_get_sample_series_reads_lazy_models_from_json() -> None:
+    with lazy_decoding():
+        detailed = construct_type(type_=HeartRateDataDetailed, object_=DETAILED)
+
+    series = get_sample_series(detailed, "hr_samples")
+
+    assert series is not None and list(series.column("bpm"))[0] == 120.0
+    # The samples were never decoded into models
+    assert "hr_samples" not in detailed.__dict__
+    assert get_sample_series(detailed, "hrv_samples_rmssd") is None
+
+
+def test_get_sample_series_from_decoded_models() -> None:
+    detailed = construct_type(type_=HeartRateDataDetailed, object_=DETAILED)
+
+    series = get_sample_series(detailed, "hr_samples")
+    values = SampleSeries.from_json(HeartRateDataSample, DETAILED["hr_samples"]).values
+
+    assert series is not None and values is not None
+    assert bytes(series.column("bpm")) == bytes(values)
+    with pytest.raises(KeyError):
+        get_sample_series(detailed, "samples")
+
+
+def test_to_numpy_does_not_copy() -> None:
+    numpy = pytest.importorskip("numpy")
+    series = SampleSeries.from_json(StepSample, [{"timestamp": "t", "steps": i} for i in range(4)])
+
+    steps = series.to_numpy("steps")
+    series.column("steps")[0] = 10.0
+
+    assert steps.dtype == numpy.float64
+    assert steps.tolist() == [10.0, 1.0, 2.0, 3.0]
+    assert series.to_numpy()["timestamp"].tolist() == ["t"] * 4
+
+
+TIMESTAMPS = [
+    "2024-01-01T00:00:00+00:00",
+    "2024-01-01T01:00:00.5+01:00",
+    "2024-02-29 23:59:59.123456-05:30",
+    "2024-01-01T00:00:00Z",
+    "2024-01-01T00:00:00",
+    "2024-01-01T00:00",
+    "2023-02-29T00:00:00Z",
+    "not a timestamp",
+    None,
+]
+EXPECTED_NS = [
+    1704067200000000000,
+    1704067200500000000,
+    1709270999123456000,
+    1704067200000000000,
+    1704067200000000000,
+    1704067200000000000,
+    MISSING_TIMESTAMP,
+    MISSING_TIMESTAMP,
+    MISSING_TIMESTAMP,
+]
+
+
+def test_parse_timestamps_ns(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert list(parse_timestamps_ns(TIMESTAMPS)) == EXPECTED_NS
+
+    monkeypatch.setattr(timestamps, "numpy", None)
+    assert list(parse_timestamps_ns(TIMESTAMPS)) == EXPECTED_NS
+
+
+def test_timestamps_are_parsed_once_per_series() -> None:
+    with lazy_decoding():
+        detailed = construct_type(type_=HeartRateDataDetailed, object_=DETAILED)
+
+    series = get_sample_series(detailed, "hr_samples")
+
+    assert series is get_sample_series(detailed, "hr_samples")
+    assert series is not None and series.timestamps_ns is series.timestamps_ns
+    assert list(series.timestamps_ns or []) == [1704067200000000000 + i * 1_000_000_000 for i in range(3)]
+
+
+def test_series_are_cached_on_the_model() -> None:
+    detailed = construct_type(type_=HeartRateDataDetailed, object_=DETAILED)
+    series = get_sample_series(detailed, "hr_samples")
+    collected = weakref.ref(typing.cast(SampleSeries[typing.Any], series))
+
+    assert get_sample_series(copy.copy(detailed), "hr_samples") is not series
+    assert pickle.loads(pickle.dumps(detailed)) == detailed
+    del detailed, series
+    gc.collect()
+    assert collected() is None
+
+
+def test_to_datetime64() -> None:
+    numpy = pytest.importorskip("numpy")
+    series = SampleSeries.from_json(StepSample, [{"timestamp": timestamp} for timestamp in TIMESTAMPS])
+
+    datetimes = series.to_datetime64()
+
+    assert datetimes.dtype == numpy.dtype("datetime64[ns]")
+    assert datetimes[1] == numpy.datetime64("2024-01-01T00:00:00.5")
+    assert numpy.isnat(datetimes[-1])
+    with pytest.raises(KeyError):
+        SampleSeries.from_json(DailyPatternSample, []).to_datetime64()
+
+
+RECORDS: typing.List[typing.Dict[str, typing.Any]] = [
+    {
+        "metadata": {"summary_id": "a"},
+        "heart_rate_data": {"detailed": DETAILED},
+        "position_data": {"position_samples": [{"timestamp": "2024-01-01T00:00:00Z", "coords_lat_lng_deg": [51.5, 0]}]},
+    },
+    {"metadata": {"summary_id": "b"}, "power_data": {"power_samples": [{"timestamp": None, "watts": 250}]}},
+]
+
+
+def test_sample_series_names_cover_the_records() -> None:
+    names = get_sample_series_names(Activity)
+
+    assert "heart_rate_data.detailed.hr_samples.bpm" in names
+    assert "position_data.position_samples.lat" in names
+    assert "MET_data.MET_samples.level" in names
+    assert "sleep_durations_data.hypnogram_samples.level" in get_sample_series_names(Sleep)
+    assert "measurements_data.measurements.weight_kg" in get_sample_series_names(Body)
+    # Laps have no timestamp to place them in a series
+    assert not any(name.startswith("lap_data") for name in names)
+
+
+def test_flatten_samples() -> None:
+    (chunk,) = flatten_samples([("user-1", RECORDS[0]), RECORDS[1]], Activity, user_id="user-2")
+
+    rows = list(zip(chunk["user_id"], chunk["record_id"], chunk["series"], chunk["timestamp"], chunk["value"]))
+    assert rows == [
+        ("user-1", "a", "heart_rate_data.detailed.hr_samples.bpm", "2024-01-01T00:00:00+00:00", 120.0),
+        ("user-1", "a", "heart_rate_data.detailed.hr_samples.bpm", "2024-01-01T00:00:02+00:00", 122.5),
+        ("user-1", "a", "heart_rate_data.detailed.hr_samples.context", "2024-01-01T00:00:01+00:00", 1.0),
+        ("user-1", "a", "position_data.position_samples.lat", "2024-01-01T00:00:00Z", 51.5),
+        ("user-1", "a", "position_data.position_samples.lng", "2024-01-01T00:00:00Z", 0.0),
+        ("user-2", "b", "power_data.power_samples.watts", None, 250.0),
+    ]
+    seconds = [0, 2, 1, 0, 0]
+    assert list(chunk["timestamp_ns"]) == [1704067200000000000 + second * 1_000_000_000 for second in seconds] + [
+        MISSING_TIMESTAMP
+    ]
+
+
+def test_flatten_samples_in_chunks() -> None:
+    models = [construct_type(type_=Activity, object_=record) for record in RECORDS]
+    series = ["heart_rate_data.detailed.hr_samples.bpm", "power_data.power_samples"]
+
+    chunks = list(flatten_samples(iter(models), series=series, chunk_size=2))
+
+    assert [len(chunk["value"]) for chunk in chunks] == [2, 1]
+    assert list(chunks[0]["value"]) == [120.0, 122.5]
+    assert chunks[1]["series"] == ["power_data.power_samples.watts"]
+    with pytest.raises(TypeError):
+        next(flatten_samples(RECORDS))
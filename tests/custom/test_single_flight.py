@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from terra import AsyncTerra, Terra
+from terra.core.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_results_and_errors_across_threads() -> None:
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls: typing.List[int] = []
+
+    def slow() -> int:
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 42
+
+    results: typing.List[int] = []
+    leader = threading.Thread(target=lambda: results.append(single_flight.do("key", slow)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(single_flight.do("key", slow))) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    # Give the followers time to join the in-flight call
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert results == [42] * 4
+    assert len(calls) == 1
+
+    def fail() -> int:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+
+
+async def test_async_single_flight_survives_a_cancelled_caller() -> None:
+    single_flight = AsyncSingleFlight()
+    calls: typing.List[int] = []
+
+    async def slow() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 42
+
+    first = asyncio.ensure_future(single_flight.do("key", slow))
+    second = asyncio.ensure_future(single_flight.do("key", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 42
+    assert len(calls) == 1
+    assert await single_flight.do("key", slow) == 42
+    assert len(calls) == 2
+
+
+async def test_async_client_coalesces_identical_gets() -> None:
+    requests: typing.List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"user": {"user_id": request.url.params["user_id"], "provider": "GARMIN"}})
+
+    client = AsyncTerra(
+        dev_id="dev",
+        api_key="key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        coalesce_requests=True,
+    )
+
+    responses = await asyncio.gather(
+        client.user.getinfoforuserid(user_id="a"),
+        client.user.getinfoforuserid(user_id="a"),
+        client.user.getinfoforuserid(user_id="b"),
+    )
+
+    assert [response.user.user_id for response in responses] == ["a", "a", "b"]
+    assert len(requests) == 2
+
+
+def test_sync_client_does_not_coalesce_by_default() -> None:
+    client = Terra(dev_id="dev", api_key="key")
+    assert client._client_wrapper.httpx_client.single_flight is None
+    client = Terra(dev_id="dev", api_key="key", coalesce_requests=True)
+    assert isinstance(client._client_wrapper.httpx_client.single_flight, SingleFlight)
@@ -0,0 +1,140 @@
+import json
+import typing
+
+import httpx
+import pytest
+
+from terra import AsyncTerra, Terra
+from terra.core.api_error import ApiError
+from terra.core.json_stream import JsonArrayStream
+from terra.errors.bad_request_error import BadRequestError
+from terra.stream_fetch import DataNotReturnedError
+from terra.types.activity import Activity
+from terra.types.large_request_processing_event import LargeRequestProcessingEvent
+
+BODY = json.dumps(
+    {
+        "user": {"user_id": "user-1", "provider": "GARMIN"},
+        "data": [
+            {"metadata": {"summary_id": str(i), "name": 'a "quoted", [bracketed] name'}, "calories_data": {}}
+            for i in range(20)
+        ],
+        "type": "activity",
+    }
+).encode()
+
+
+def chunks(body: bytes, size: int) -> typing.Iterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 20])
+def test_json_array_stream(size: int) -> None:
+    stream = JsonArrayStream("data")
+
+    items = [item for chunk in chunks(BODY, size) for item in stream.feed(chunk)] + stream.close()
+
+    assert items == json.loads(BODY)["data"]
+    assert stream.fields == {"user": {"user_id": "user-1", "provider": "GARMIN"}, "type": "activity"}
+
+
+def test_json_array_stream_at_every_split() -> None:
+    body = json.dumps(
+        {
+            "g0": -12,
+            "data": [1.25, -3e-2, 4e10, 0, True, None, {"x": [1.5e3, -0.0]}],
+            "f0": 1.25,
+            "f1": 6.02e23,
+            "f2": False,
+        }
+    ).encode()
+
+    for offset in range(len(body) + 1):
+        stream = JsonArrayStream("data")
+        items = stream.feed(body[:offset]) + stream.feed(body[offset:]) + stream.close()
+
+        assert items == json.loads(body)["data"], offset
+        assert stream.fields == {"g0": -12, "f0": 1.25, "f1": 6.02e23, "f2": False}, offset
+
+
+def test_json_array_stream_rejects_truncated_bodies() -> None:
+    stream = JsonArrayStream("data")
+    stream.feed(BODY[:-20])
+
+    with pytest.raises(json.JSONDecodeError):
+        stream.close()
+
+
+def test_fetch_stream_yields_records() -> None:
+    requests: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=chunks(BODY, 100))
+
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    records = list(client.activity.fetch_stream(user_id="user-1", start_date=1704067200, with_samples=True))
+
+    assert [record.metadata.summary_id for record in records] == [str(i) for i in range(20)]
+    assert all(isinstance(record, Activity) for record in records)
+    assert requests[0].url.params["to_webhook"] == "false"
+    assert requests[0].url.params["with_samples"] == "true"
+
+
+def test_fetch_stream_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["user_id"] == "bad":
+            return httpx.Response(400, json={"status": "error", "message": "bad user"})
+        return httpx.Response(200, content=BODY[:-20])
+
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(BadRequestError) as e:
+        list(client.sleep.fetch_stream(user_id="bad", start_date=1704067200))
+    assert e.value.body == {"status": "error", "message": "bad user"}
+    with pytest.raises(ApiError):
+        list(client.sleep.fetch_stream(user_id="user-1", start_date=1704067200))
+
+
+def test_fetch_stream_raises_for_responses_without_data() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["user_id"] == "empty":
+            body = {"status": "success", "message": "no data", "user": {"user_id": "empty", "provider": "GARMIN"}}
+        else:
+            body = {
+                "type": "large_request_processing",
+                "status": "processing",
+                "message": "Large request is being processed",
+                "user": {"user_id": "user-1", "provider": "GARMIN"},
+                "reference": "ref-1",
+            }
+        return httpx.Response(200, content=chunks(json.dumps(body).encode(), 16))
+
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(DataNotReturnedError) as e:
+        list(client.activity.fetch_stream(user_id="user-1", start_date=1704067200))
+    assert isinstance(e.value.body, LargeRequestProcessingEvent)
+    assert e.value.body.reference == "ref-1"
+    assert e.value.status_code == 200
+    assert list(client.activity.fetch_stream(user_id="empty", start_date=1704067200)) == []
+
+
+async def test_async_fetch_stream_yields_records() -> None:
+    class Body(httpx.AsyncByteStream):
+        async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+            for chunk in chunks(BODY, 100):
+                yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=Body())
+
+    client = AsyncTerra(
+        dev_id="dev", api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    records = [record async for record in client.daily.fetch_stream(user_id="user-1", start_date=1704067200)]
+
+    assert len(records) == 20
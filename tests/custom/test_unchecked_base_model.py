@@ -0,0 +1,114 @@
+import typing
+
+import pydantic
+import typing_extensions
+
+from terra.activity.types.activity_fetch_response import ActivityFetchResponse
+from terra.activity.types.activity_fetch_response_data import ActivityFetchResponseData
+from terra.core import unchecked_base_model
+from terra.core.serialization import FieldMetadata
+from terra.core.unchecked_base_model import UncheckedBaseModel, construct_type
+from terra.types.activity import Activity
+from terra.types.data_sent_to_webhook import DataSentToWebhook
+from terra.types.large_request_processing_event import LargeRequestProcessingEvent
+from terra.types.request_processing import RequestProcessing
+from terra.user.types.user_get_all_user_i_ds_response import UserGetAllUserIDsResponse
+from terra.user.types.user_get_all_user_i_ds_response_data import UserGetAllUserIDsResponseData
+from terra.user.types.user_get_all_user_i_ds_response_users import UserGetAllUserIDsResponseUsers
+
+
+class Sample(UncheckedBaseModel):
+    timestamp: typing.Optional[str] = None
+    bpm: typing.Optional[float] = None
+
+
+class Node(UncheckedBaseModel):
+    name: str
+    met_data: typing_extensions.Annotated[typing.Optional[int], FieldMetadata(alias="MET_data")] = None
+    samples: typing.List[Sample] = pydantic.Field(default=[])
+    children: typing.Optional[typing.List["Node"]] = None
+    flag: bool = False
+
+
+if hasattr(Node, "model_rebuild"):
+    Node.model_rebuild()
+else:
+    Node.update_forward_refs()
+
+
+def test_construct_type_respects_aliases_defaults_and_extras() -> None:
+    node = construct_type(
+        type_=Node,
+        object_={"name": "root", "MET_data": "3", "samples": [{"bpm": 60}], "flag": "true", "unknown": 1},
+    )
+
+    assert isinstance(node, Node)
+    assert node.met_data == 3
+    assert node.samples[0].bpm == 60
+    assert node.flag is True
+    assert node.dict()["unknown"] == 1
+
+
+def test_construct_type_handles_self_referencing_models() -> None:
+    node = construct_type(type_=Node, object_={"name": "root", "children": [{"name": "leaf"}]})
+
+    assert node.children[0].name == "leaf"
+    assert node.children[0].children is None
+
+
+def test_model_plans_are_compiled_once(monkeypatch: typing.Any) -> None:
+    construct_type(type_=typing.List[Node], object_=[{"name": "warm"}])
+
+    def fail(type_: typing.Any) -> typing.Dict[str, str]:
+        raise AssertionError("alias mapping should be served from the compiled plan")
+
+    monkeypatch.setattr(unchecked_base_model, "get_field_to_alias_mapping", fail)
+
+    nodes = construct_type(type_=typing.List[Node], object_=[{"name": "a", "MET_data": 1}, {"name": "b"}])
+    assert [node.name for node in nodes] == ["a", "b"]
+    assert nodes[0].met_data == 1
+
+
+USER = {"user_id": "user", "provider": "GARMIN"}
+# The response unions are typing special forms rather than types, which construct_type accepts all the same
+ACTIVITY_FETCH_RESPONSE = typing.cast(typing.Type[typing.Any], ActivityFetchResponse)
+USER_GET_ALL_USER_IDS_RESPONSE = typing.cast(typing.Type[typing.Any], UserGetAllUserIDsResponse)
+
+
+def test_response_unions_dispatch_on_top_level_keys() -> None:
+    data = construct_type(
+        type_=ACTIVITY_FETCH_RESPONSE, object_={"user": USER, "data": [{"metadata": {}}], "type": "activity"}
+    )
+    processing = construct_type(
+        type_=ACTIVITY_FETCH_RESPONSE, object_={"user": USER, "message": "wait", "retry_after_seconds": 5}
+    )
+    sent = construct_type(type_=ACTIVITY_FETCH_RESPONSE, object_={"user": USER, "message": "sent", "reference": "ref"})
+    users = construct_type(type_=USER_GET_ALL_USER_IDS_RESPONSE, object_={"users": [USER]})
+    page = construct_type(type_=USER_GET_ALL_USER_IDS_RESPONSE, object_={"data": {"next": 1, "results": [USER]}})
+
+    assert isinstance(data, ActivityFetchResponseData)
+    assert data.data is not None and isinstance(data.data[0], Activity)
+    assert isinstance(processing, RequestProcessing)
+    assert processing.retry_after_seconds == 5.0
+    assert isinstance(sent, DataSentToWebhook)
+    assert isinstance(users, UserGetAllUserIDsResponseUsers)
+    assert isinstance(page, UserGetAllUserIDsResponseData)
+
+
+def test_response_unions_dispatch_on_literal_tags() -> None:
+    event = construct_type(
+        type_=ACTIVITY_FETCH_RESPONSE,
+        object_={"user": USER, "message": "large", "reference": "ref", "type": "large_request_processing"},
+    )
+
+    assert isinstance(event, LargeRequestProcessingEvent)
+
+
+def test_response_unions_skip_validation_when_unambiguous(monkeypatch: typing.Any) -> None:
+    def fail(type_: typing.Any, object_: typing.Any) -> typing.Any:
+        raise AssertionError("unambiguous payloads should not be validated")
+
+    monkeypatch.setattr(unchecked_base_model, "parse_obj_as", fail)
+
+    response = construct_type(type_=ACTIVITY_FETCH_RESPONSE, object_={"user": USER, "data": [{"metadata": {}}]})
+    assert isinstance(response, ActivityFetchResponseData)
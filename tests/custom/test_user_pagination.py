@@ -0,0 +1,54 @@
+import typing
+
+import httpx
+
+from terra import AsyncTerra, Terra
+
+PER_PAGE = 2
+USERS = [{"user_id": f"user-{i}", "provider": "GARMIN"} for i in range(5)]
+
+
+def paginate(request: httpx.Request, requested: typing.List[int]) -> httpx.Response:
+    page = int(request.url.params["page"])
+    requested.append(page)
+    results = USERS[page * PER_PAGE : (page + 1) * PER_PAGE]
+    next_page = page + 1 if (page + 1) * PER_PAGE < len(USERS) else None
+    return httpx.Response(200, json={"data": {"next": next_page, "max_page": 2, "results": results}})
+
+
+def test_iter_all_users_walks_every_page() -> None:
+    requested: typing.List[int] = []
+    transport = httpx.MockTransport(lambda request: paginate(request, requested))
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=transport))
+
+    user_ids = [user.user_id for user in client.user.iter_all_users(per_page=PER_PAGE)]
+
+    assert user_ids == [user["user_id"] for user in USERS]
+    assert requested == [0, 1, 2]
+
+
+def test_iter_all_users_is_lazy() -> None:
+    requested: typing.List[int] = []
+    transport = httpx.MockTransport(lambda request: paginate(request, requested))
+    client = Terra(dev_id="dev", api_key="key", httpx_client=httpx.Client(transport=transport))
+
+    users = client.user.iter_all_users(per_page=PER_PAGE)
+    next(users)
+
+    assert requested == [0]
+
+
+async def test_async_iter_all_users_walks_every_page() -> None:
+    requested: typing.List[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return paginate(request, requested)
+
+    client = AsyncTerra(
+        dev_id="dev", api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    user_ids = [user.user_id async for user in client.user.iter_all_users(per_page=PER_PAGE)]
+
+    assert user_ids == [user["user_id"] for user in USERS]
+    assert requested == [0, 1, 2]
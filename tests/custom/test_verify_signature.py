@@ -0,0 +1,52 @@
+import hashlib
+import hmac
+import time
+
+import pytest
+
+from terra.utils.verify_signature import WebhookVerificationError, WebhookVerifier, verify_terra_webhook_signature
+from terra.webhooks import WebhookRouter
+
+SECRET = "whsec_test"
+BODY = b'{"type": "healthcheck", "creation_timestamp": "now", "trend_percentage": 0, "sent_webhooks_last_hour": 1}'
+
+
+def sign(body: bytes, timestamp: int) -> str:
+    signature = hmac.new(SECRET.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+def test_verifier_accepts_bytes_memoryview_and_str() -> None:
+    header = sign(BODY, int(time.time()))
+    verifier = WebhookVerifier(SECRET)
+
+    assert verifier.verify(BODY, header)
+    assert verifier.verify(memoryview(BODY), header)
+    assert verifier.verify(BODY.decode(), header)
+    assert verify_terra_webhook_signature(BODY.decode(), header, SECRET)
+
+
+def test_verifier_rejects_tampered_and_stale_payloads() -> None:
+    verifier = WebhookVerifier(SECRET)
+
+    with pytest.raises(WebhookVerificationError):
+        verifier.verify(BODY + b" ", sign(BODY, int(time.time())))
+    with pytest.raises(WebhookVerificationError):
+        verifier.verify(BODY, sign(BODY, int(time.time()) - 3600))
+
+
+def test_verify_many_reports_failures_without_raising() -> None:
+    now = int(time.time())
+    verifier = WebhookVerifier(SECRET)
+
+    results = verifier.verify_many([(BODY, sign(BODY, now)), (b"{}", sign(BODY, now)), (BODY, "v1=missing")])
+
+    assert results == [True, False, False]
+
+
+def test_router_verifies_before_dispatching() -> None:
+    router = WebhookRouter(verifier=WebhookVerifier(SECRET), default_handler=lambda event: event.type)
+
+    assert router.dispatch(BODY, signature_header=sign(BODY, int(time.time()))) == "healthcheck"
+    with pytest.raises(WebhookVerificationError):
+        router.dispatch(BODY, signature_header=sign(b"{}", int(time.time())))
@@ -0,0 +1,61 @@
+import json
+import typing
+
+import pytest
+
+from terra.types.activity_event import ActivityEvent
+from terra.types.auth_error_event import AuthErrorEvent
+from terra.types.auth_success_event import AuthSuccessEvent
+from terra.types.s_3_payload_event import S3PayloadEvent
+from terra.webhooks import WebhookRouter, parse_event
+
+USER = {"user_id": "user", "provider": "GARMIN"}
+ACTIVITY = {"type": "activity", "user": USER, "version": "2022-03-16", "data": [{"metadata": {"summary_id": "1"}}]}
+
+
+def test_parse_event_picks_the_model_from_the_type() -> None:
+    event = parse_event(json.dumps(ACTIVITY).encode())
+
+    assert isinstance(event, ActivityEvent)
+    assert event.data[0].metadata.summary_id == "1"
+
+
+def test_parse_event_accepts_memoryviews_and_mappings() -> None:
+    payload = {"type": "s3_payload", "url": "https://example.com", "user": USER, "version": "2022-03-16"}
+
+    assert isinstance(parse_event(memoryview(json.dumps(payload).encode())), S3PayloadEvent)
+    assert isinstance(parse_event(payload), S3PayloadEvent)
+
+
+def test_parse_event_resolves_shared_tags_from_the_payload() -> None:
+    success = {"type": "auth", "user": USER, "reference_id": "ref", "widget_session_id": "session"}
+    error = {**success, "provider": "GARMIN", "message": "denied", "reason": "user_denied"}
+
+    assert isinstance(parse_event(success), AuthSuccessEvent)
+    assert isinstance(parse_event(error), AuthErrorEvent)
+
+
+def test_parse_event_rejects_payloads_that_are_not_objects() -> None:
+    with pytest.raises(ValueError, match="JSON object"):
+        parse_event(b"[1, 2]")
+    with pytest.raises(ValueError):
+        parse_event(b"null")
+
+
+def test_router_dispatches_to_registered_handlers() -> None:
+    received: typing.List[typing.Any] = []
+    router = WebhookRouter(default_handler=lambda event: "default")
+
+    @router.on("activity")
+    def handle_activity(event: ActivityEvent) -> str:
+        received.append(event)
+        return "activity"
+
+    assert router.dispatch(json.dumps(ACTIVITY)) == "activity"
+    assert router.dispatch({"type": "healthcheck"}) == "default"
+    assert isinstance(received[0], ActivityEvent)
+
+
+def test_router_rejects_unknown_event_types() -> None:
+    with pytest.raises(ValueError):
+        WebhookRouter().register("not_an_event", lambda event: None)